@@ -0,0 +1,311 @@
+"""
+Analyze the structure of generated DOCX/PPTX packages.
+Streams each package part by part and reports part sizes, duplicate media
+(by SHA-256), paragraph/run/table/cell counts and how much formatting is
+applied directly to runs rather than through styles, as a text summary or
+as JSON for tracking output size over time.
+
+Run:  python scripts/analyze_packages.py [PATH ...] [--json] [-o report.json]
+                                         [--jobs N] [--parts N]
+PATH may be a .docx/.pptx file or a directory searched recursively
+(default: docs/). Needs only the standard library.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from xml.etree.ElementTree import iterparse
+
+ROOT = Path(__file__).resolve().parent.parent
+DOCS = ROOT / "docs"
+
+PACKAGE_SUFFIXES = (".docx", ".pptx")
+
+W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+
+# Parts holding the document's own text: body, headers and footers, notes
+# and slides (not styles, themes, masters or layouts)
+STORY_PARTS = re.compile(
+    r"^(word/(document|header\d*|footer\d*|footnotes|endnotes|comments)\.xml"
+    r"|ppt/(slides/slide|notesSlides/notesSlide)\d+\.xml)$")
+MEDIA_PARTS = re.compile(r"/media/")
+
+COUNTED = {
+    W + "p": "paragraphs", A + "p": "paragraphs",
+    W + "r": "runs", A + "r": "runs",
+    W + "tbl": "tables", A + "tbl": "tables",
+    W + "tc": "cells", A + "tc": "cells",
+}
+PARAGRAPHS = {W + "p", A + "p"}
+RUNS = {W + "r", A + "r"}
+RUN_PROPERTIES = {W + "rPr", A + "rPr"}
+# DrawingML paragraph-level run defaults (python-pptx's paragraph.font)
+PARAGRAPH_RUN_PROPERTIES = (A + "pPr", A + "defRPr")
+
+# rStyle applies a style, and the DrawingML attributes below are
+# bookkeeping rather than formatting
+NOT_DIRECT = {"rStyle", "lang", "altLang", "dirty", "err", "noProof", "smtClean",
+              "smtId", "bmk", "kumimoji"}
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  ANALYSIS
+# ══════════════════════════════════════════════════════════════════════
+
+def _local(tag):
+    return tag.rsplit("}", 1)[-1]
+
+
+def run_formatting(rpr):
+    """Direct formatting in a run properties element: (names, font, size in pt)."""
+    if rpr.tag == W + "rPr":
+        names = [_local(child.tag) for child in rpr]
+        fonts = rpr.find(W + "rFonts")
+        font = fonts.get(W + "ascii") if fonts is not None else None
+        size = rpr.find(W + "sz")
+        pt = int(size.get(W + "val")) / 2 if size is not None else None
+    else:
+        names = [_local(child.tag) for child in rpr] + list(rpr.attrib)
+        latin = rpr.find(A + "latin")
+        font = latin.get("typeface") if latin is not None else None
+        pt = int(rpr.get("sz")) / 100 if rpr.get("sz") else None
+    return [name for name in names if name not in NOT_DIRECT], font, pt
+
+
+def _record_run(formatting, own, inherited):
+    names = set(own[0] if own else ()) | set(inherited[0] if inherited else ())
+    font = (own and own[1]) or (inherited and inherited[1])
+    pt = (own and own[2]) or (inherited and inherited[2])
+    if names:
+        formatting["runs"] += 1
+        formatting["properties"].update(names)
+    if font:
+        formatting["fonts"][font] += 1
+    if pt:
+        formatting["sizes"][f"{pt:g}"] += 1
+
+
+def scan_story(stream, counts, formatting):
+    """Count structure and run formatting in one XML part, streaming it."""
+    stack = []
+    inherited = own = None
+    for event, elem in iterparse(stream, events=("start", "end")):
+        tag = elem.tag
+        if event == "start":
+            stack.append(tag)
+            if tag in PARAGRAPHS:
+                inherited = None
+            elif tag in RUNS:
+                own = None
+            continue
+        stack.pop()
+        parent = stack[-1] if stack else None
+        if tag in COUNTED:
+            counts[COUNTED[tag]] += 1
+        if tag in RUN_PROPERTIES and parent in RUNS:
+            own = run_formatting(elem)
+        elif (parent, tag) == PARAGRAPH_RUN_PROPERTIES:
+            inherited = run_formatting(elem)
+        elif tag in RUNS:
+            _record_run(formatting, own, inherited)
+        elif tag in PARAGRAPHS:
+            elem.clear()    # everything inside has been counted
+
+
+def _sha256(stream):
+    h = hashlib.sha256()
+    for block in iter(lambda: stream.read(1 << 20), b""):
+        h.update(block)
+    return h.hexdigest()
+
+
+def analyze_package(path):
+    """Structure report for one .docx/.pptx package, as a JSON-ready dict."""
+    path = Path(path)
+    start = time.perf_counter()
+    parts = []
+    media = {}
+    counts = Counter(paragraphs=0, runs=0, tables=0, cells=0)
+    formatting = {"runs": 0, "properties": Counter(), "fonts": Counter(),
+                  "sizes": Counter()}
+
+    with zipfile.ZipFile(path) as zf:
+        for info in zf.infolist():
+            name = info.filename
+            parts.append({"name": name, "bytes": info.file_size,
+                          "compressed": info.compress_size,
+                          "stored": info.compress_type == zipfile.ZIP_STORED})
+            if MEDIA_PARTS.search(name):
+                with zf.open(info) as stream:
+                    media.setdefault(_sha256(stream), []).append(name)
+            elif STORY_PARTS.match(name):
+                with zf.open(info) as stream:
+                    scan_story(stream, counts, formatting)
+
+    sizes = {part["name"]: part["bytes"] for part in parts}
+    duplicates = [{"sha256": digest, "bytes": sizes[names[0]], "parts": names}
+                  for digest, names in media.items() if len(names) > 1]
+    runs = counts["runs"]
+    return {
+        "file": str(path),
+        "bytes": path.stat().st_size,
+        "parts": sorted(parts, key=lambda p: -p["compressed"]),
+        "xml_bytes": sum(p["bytes"] for p in parts
+                         if p["name"].endswith((".xml", ".rels"))),
+        "media": {
+            "count": sum(len(names) for names in media.values()),
+            "bytes": sum(sizes[n] for names in media.values() for n in names),
+            "duplicates": duplicates,
+            "duplicate_bytes": sum(d["bytes"] * (len(d["parts"]) - 1)
+                                   for d in duplicates),
+        },
+        "structure": dict(counts),
+        "direct_formatting": {
+            "runs": formatting["runs"],
+            "share": formatting["runs"] / runs if runs else 0.0,
+            "properties_per_run": (sum(formatting["properties"].values()) / runs
+                                   if runs else 0.0),
+            "properties": dict(formatting["properties"].most_common()),
+            "fonts": dict(formatting["fonts"].most_common()),
+            "sizes_pt": dict(formatting["sizes"].most_common()),
+        },
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def find_packages(paths):
+    """Package files named by paths, searching directories recursively."""
+    found = []
+    for path in map(Path, paths):
+        if path.is_dir():
+            found += sorted(p for p in path.rglob("*")
+                            if p.suffix.lower() in PACKAGE_SUFFIXES
+                            and not p.name.startswith("~$"))
+        else:
+            found.append(path)
+    return found
+
+
+def _attempt(fn, *args):
+    """Call fn and return (result, None), or (None, exc) if it raised."""
+    try:
+        return fn(*args), None
+    except Exception as e:
+        return None, e
+
+
+def analyze_all(paths, jobs=1):
+    """Analyze every package, yielding (path, report, exc) in order."""
+    jobs = max(1, min(jobs, len(paths)))
+    if jobs == 1:
+        for path in paths:
+            yield (path, *_attempt(analyze_package, path))
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(_attempt, analyze_package, path) for path in paths]
+        for path, future in zip(paths, futures):
+            yield (path, *future.result())
+
+
+def summarize(reports):
+    """Totals across reports, for comparing one run with the next."""
+    total = Counter()
+    for report in reports:
+        total["packages"] += 1
+        total["bytes"] += report["bytes"]
+        total["xml_bytes"] += report["xml_bytes"]
+        total["media_bytes"] += report["media"]["bytes"]
+        total["duplicate_media_bytes"] += report["media"]["duplicate_bytes"]
+        total["direct_formatting_runs"] += report["direct_formatting"]["runs"]
+        total.update(report["structure"])
+    return dict(total)
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  MAIN
+# ══════════════════════════════════════════════════════════════════════
+
+def print_report(report, listed_parts=0):
+    structure = report["structure"]
+    direct = report["direct_formatting"]
+    media = report["media"]
+    print(f"  [OK] {Path(report['file']).name} ({report['bytes'] / 1024:.1f} KB, "
+          f"{len(report['parts'])} parts)")
+    print(f"       {structure['paragraphs']} paragraphs, {structure['runs']} runs, "
+          f"{structure['tables']} tables, {structure['cells']} cells")
+    print(f"       direct formatting on {direct['share']:.0%} of runs "
+          f"({direct['properties_per_run']:.1f} properties/run)")
+    if media["duplicates"]:
+        print(f"       [!] {len(media['duplicates'])} duplicated media "
+              f"({media['duplicate_bytes'] / 1024:.1f} KB)")
+    for part in report["parts"][:listed_parts]:
+        print(f"         {part['compressed'] / 1024:9.1f} KB  {part['name']}"
+              + ("  (stored)" if part["stored"] else ""))
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Report part sizes, duplicate media, structure counts and "
+                    "direct-formatting density of DOCX/PPTX packages.")
+    parser.add_argument("paths", nargs="*", metavar="PATH", default=[DOCS],
+                        help=f"packages or directories (default: {DOCS.relative_to(ROOT)})")
+    parser.add_argument("--json", action="store_true",
+                        help="print the report as JSON instead of a summary")
+    parser.add_argument("-o", "--output", type=Path,
+                        help="also write the JSON report to this file")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--parts", type=int, default=0, metavar="N",
+                        help="list each package's N largest parts in the summary")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    paths = find_packages(args.paths)
+    if not paths:
+        print("  [ERR] no .docx or .pptx packages found")
+        return 1
+
+    start = time.perf_counter()
+    reports, errors = [], []
+    for path, report, exc in analyze_all(paths, args.jobs):
+        if exc is not None:
+            errors.append({"file": str(path), "error": f"{type(exc).__name__}: {exc}"})
+            if not args.json:
+                print(f"  [ERR] {path}: {exc}")
+            continue
+        reports.append(report)
+        if not args.json:
+            print_report(report, args.parts)
+
+    result = {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "totals": summarize(reports),
+        "packages": reports,
+        "errors": errors,
+    }
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(result, indent=2) + "\n", encoding="utf-8")
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"\n{len(reports)} of {len(paths)} packages analyzed in "
+              f"{time.perf_counter() - start:.2f}s")
+        if args.output:
+            print(f"  [OK] Report written: {args.output}")
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
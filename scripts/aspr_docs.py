@@ -0,0 +1,141 @@
+"""
+Command-line entry point for the document generators.
+Each sub-command imports its generator, and with it python-docx or
+python-pptx, only when it runs; help and the stdlib-only plan generator
+never load the Office libraries.
+
+Run:  python scripts/aspr_docs.py {docs,requirements,deck,plan,all,analyze} [ARGS ...]
+      python scripts/aspr_docs.py deck --help
+      python scripts/aspr_docs.py --import-report plan --check
+"""
+
+import argparse
+import importlib.util
+import sys
+from pathlib import Path
+
+SCRIPTS = Path(__file__).resolve().parent
+
+COMMANDS = {
+    "docs": ("generate_all_docx.py",
+             "generate the DOCX document suite from docs/*.md"),
+    "requirements": ("generate-requirements-docx.py",
+                     "generate the requirements DOCX"),
+    "deck": ("generate_exec_summary_pptx.py",
+             "generate the executive summary PPTX"),
+    "plan": ("generate_project_plan_xml.py",
+             "generate the MS Project plan XML and its exports (stdlib only)"),
+    "all": ("build_all.py",
+            "build every out-of-date document in one process"),
+    "analyze": ("analyze_packages.py",
+                "report part sizes, duplicate media and formatting density of outputs"),
+}
+
+IMPORT_REPORT_LISTED = 15
+
+
+def load_command(command):
+    """Import the script behind command, by path (some names have hyphens)."""
+    script = COMMANDS[command][0]
+    name = Path(script).stem.replace("-", "_")
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, SCRIPTS / script)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+    return sys.modules[name]
+
+
+def run_command(command, args):
+    """Run command's main() with args, as if its script had been invoked."""
+    module = load_command(command)
+    # Generator parsers take their prog name from argv[0]
+    sys.argv = [f"{Path(sys.argv[0]).name} {command}", *args]
+    status = module.main(args) or 0
+    # Generators that exit 0 despite failures as scripts do so here too
+    return status if getattr(module, "EXIT_STATUS_ON_ERROR", True) else 0
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  IMPORT REPORT
+# ══════════════════════════════════════════════════════════════════════
+
+def parse_importtime(lines):
+    """Top-level imports from -X importtime output as (name, self us, cumulative us)."""
+    imports = []
+    for line in lines:
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue    # the column header
+        name = fields[2]
+        # Nested imports are indented two spaces per level past the first
+        if name.startswith("  "):
+            continue
+        imports.append((name.strip(), int(fields[0]), int(fields[1])))
+    return imports
+
+
+def print_import_report(imports, listed=IMPORT_REPORT_LISTED):
+    total = sum(cumulative for _, _, cumulative in imports)
+    print()
+    print(f"  Import time: {total / 1000:.1f} ms across {len(imports)} top-level imports")
+    for name, own, cumulative in sorted(imports, key=lambda i: -i[2])[:listed]:
+        print(f"    {cumulative / 1000:8.1f} ms  {name}"
+              + (f"  ({own / 1000:.1f} ms own)" if own * 2 > cumulative else ""))
+
+
+def run_with_import_report(argv, listed=IMPORT_REPORT_LISTED):
+    """Re-run argv under -X importtime, pass its output through and summarise imports."""
+    import subprocess
+
+    proc = subprocess.run([sys.executable, "-X", "importtime", __file__, *argv],
+                          stderr=subprocess.PIPE, text=True)
+    lines = proc.stderr.splitlines()
+    for line in lines:
+        if not line.startswith("import time:"):
+            print(line, file=sys.stderr)
+    print_import_report(parse_importtime(lines), listed)
+    return proc.returncode
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  MAIN
+# ══════════════════════════════════════════════════════════════════════
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        prog=Path(sys.argv[0]).name,
+        description="Generate the ASPR Photo Repository documents.",
+        epilog="Options after the command go to its generator; "
+               "use COMMAND --help to list them.")
+    parser.add_argument("--import-report", action="store_true",
+                        help="run under -X importtime and list the "
+                             f"{IMPORT_REPORT_LISTED} slowest top-level imports")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+    for command, (_, summary) in COMMANDS.items():
+        # add_help=False so COMMAND --help reaches the generator's own parser
+        commands.add_parser(command, help=summary, add_help=False)
+
+    # Everything after the command belongs to the generator, options included
+    argv = sys.argv[1:] if argv is None else list(argv)
+    split = next((i + 1 for i, arg in enumerate(argv) if arg in COMMANDS), len(argv))
+    args = parser.parse_args(argv[:split])
+    args.args = argv[split:]
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.import_report:
+        return run_with_import_report([args.command, *args.args])
+    return run_command(args.command, args.args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,361 @@
+"""
+Benchmark suite for the DOCX generator in generate_all_docx.py.
+
+Generates synthetic markdown corpora of controlled size and shape (headings,
+R x C tables, long code blocks, nested bullet lists) and times md_to_docx,
+styled_table and doc.save (and office_save.save_package) across scales, reporting throughput (lines/s,
+cells/s) and peak traced memory. Results can be written as JSON and compared
+with an earlier run.
+
+Run:  python scripts/benchmark_docx.py [--scales 1,4,16] [--repeat N]
+                                       [--output results.json]
+                                       [--compare baseline.json] [--micro]
+Requires: pip install python-docx
+"""
+
+import argparse
+import json
+import platform
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from io import BytesIO
+from pathlib import Path
+
+import docx
+from docx import Document
+from docx.oxml import parse_xml
+
+import docx_xml
+import generate_all_docx as gen
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  HELPERS
+# ══════════════════════════════════════════════════════════════════════
+
+def _best_of(fn, repeat):
+    """Best wall time (seconds) of `repeat` calls to fn."""
+    best = None
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - t0
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def _peak_bytes(fn):
+    """Peak traced allocation of one untimed call to fn."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _per_cell_styled_table(doc, headers, rows, col_widths=None):
+    """styled_table with the bulk writer disabled."""
+    threshold = gen.BULK_TABLE_MIN_ROWS
+    gen.BULK_TABLE_MIN_ROWS = len(rows) + 1
+    try:
+        return gen.styled_table(doc, headers, rows, col_widths)
+    finally:
+        gen.BULK_TABLE_MIN_ROWS = threshold
+
+
+def synthetic_table(rows, cols):
+    headers = [f"Column {c + 1}" for c in range(cols)]
+    body = [[f"r{r}c{c} value" for c in range(cols)] for r in range(rows)]
+    return headers, body
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  SYNTHETIC CORPORA
+# ══════════════════════════════════════════════════════════════════════
+
+TABLE_COLS = 6
+
+# Sizes at scale 1. The scale factor multiplies the number of sections and
+# the length of each table, code block and list, so corpora grow linearly.
+SHAPES = {
+    "headings": {"sections": 50},
+    "tables":   {"tables": 4, "table_rows": 25},
+    "code":     {"code_blocks": 4, "code_lines": 100},
+    "bullets":  {"lists": 4, "bullets": 50},
+    "mixed":    {"sections": 10, "tables": 2, "table_rows": 10,
+                 "code_blocks": 2, "code_lines": 20, "lists": 2, "bullets": 20},
+}
+
+
+def synthetic_markdown(scale, sections=0, tables=0, table_rows=0,
+                       code_blocks=0, code_lines=0, lists=0, bullets=0):
+    """Build a markdown document; returns (text, table cell count)."""
+    lines = ["# Synthetic Benchmark Document", "", "---", ""]
+    cells = 0
+    for s in range(sections * scale):
+        lines += [f"## {s + 1}. Section heading", "",
+                  f"### {s + 1}.1 Subsection heading", "",
+                  "Body text with **bold** markers that the converter strips "
+                  "before writing the paragraph.", ""]
+    for t in range(tables):
+        headers, rows = synthetic_table(table_rows * scale, TABLE_COLS)
+        lines += [f"## Table {t + 1}", "", "| " + " | ".join(headers) + " |",
+                  "|" + "---|" * TABLE_COLS]
+        lines += ["| " + " | ".join(row) + " |" for row in rows]
+        lines.append("")
+        cells += (len(rows) + 1) * TABLE_COLS
+    for c in range(code_blocks):
+        lines += [f"## Code {c + 1}", "", "```bash"]
+        lines += [f"az resource show --ids /subscriptions/{i:08d}"
+                  for i in range(code_lines * scale)]
+        lines += ["```", ""]
+    for b in range(lists):
+        lines += [f"## List {b + 1}", ""]
+        lines += [("  - " if i % 3 else "- ") + f"**Item {i}** bullet text"
+                  for i in range(bullets * scale)]
+        lines.append("")
+    return "\n".join(lines) + "\n", cells
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  SUITE
+# ══════════════════════════════════════════════════════════════════════
+
+def _record(benchmark, shape, scale, seconds, peak, lines=0, cells=0):
+    return {
+        "benchmark": benchmark,
+        "shape": shape,
+        "scale": scale,
+        "lines": lines,
+        "cells": cells,
+        "seconds": seconds,
+        "lines_per_s": lines / seconds if lines else None,
+        "cells_per_s": cells / seconds if cells else None,
+        "peak_mb": peak / 2**20,
+    }
+
+
+def bench_md_to_docx(shape, scale, repeat, workdir):
+    """End-to-end conversion of one synthetic corpus, then doc.save alone."""
+    text, cells = synthetic_markdown(scale, **SHAPES[shape])
+    md_path = workdir / f"{shape}-{scale}.md"
+    md_path.write_text(text, encoding="utf-8")
+    nlines = text.count("\n")
+    doc_def = {"title": "Benchmark", "subtitle": f"{shape} x{scale}"}
+
+    def convert():
+        gen.md_to_docx(md_path, doc_def["title"], doc_def["subtitle"],
+                       f"{shape}-{scale}.docx")
+
+    def parse():
+        with open(md_path, encoding="utf-8") as fh:
+            return list(gen.tokenize_md(gen.iter_lines(fh)))
+
+    blocks = parse()
+    doc = gen.setup_doc(doc_def["title"], doc_def["subtitle"])
+    gen.render_docx(doc, blocks)
+
+    def save():
+        doc.save(BytesIO())
+
+    def save_package():
+        gen.save_package(doc, BytesIO())
+
+    return [
+        _record("md_to_docx", shape, scale, _best_of(convert, repeat),
+                _peak_bytes(convert), lines=nlines, cells=cells),
+        _record("tokenize_md", shape, scale, _best_of(parse, repeat),
+                _peak_bytes(parse), lines=nlines),
+        _record("doc.save", shape, scale, _best_of(save, repeat),
+                _peak_bytes(save), lines=nlines, cells=cells),
+        _record("save_package", shape, scale, _best_of(save_package, repeat),
+                _peak_bytes(save_package), lines=nlines, cells=cells),
+    ]
+
+
+def bench_styled_table(scale, repeat):
+    """styled_table on one table of 25*scale rows, as md_to_docx calls it."""
+    headers, rows = synthetic_table(25 * scale, TABLE_COLS)
+    cells = (len(rows) + 1) * TABLE_COLS
+
+    def build():
+        gen.styled_table(Document(), headers, rows)
+
+    return [_record("styled_table", f"{len(rows)}x{TABLE_COLS}", scale,
+                    _best_of(build, repeat), _peak_bytes(build), cells=cells)]
+
+
+def run_suite(scales, repeat):
+    records = []
+    original_docs = gen.DOCS
+    with tempfile.TemporaryDirectory() as tmp:
+        gen.DOCS = Path(tmp)   # md_to_docx writes its output under DOCS
+        try:
+            for scale in scales:
+                for shape in SHAPES:
+                    records += bench_md_to_docx(shape, scale, repeat, Path(tmp))
+                records += bench_styled_table(scale, repeat)
+        finally:
+            gen.DOCS = original_docs
+    return records
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  MICRO-BENCHMARKS
+# ══════════════════════════════════════════════════════════════════════
+
+def _with_and_without_fragment_cache(fn, repeat):
+    """Time fn with parse_xml per fragment ("before") and the cache ("after")."""
+    # The generator and the shared helpers each hold their own reference
+    modules = (gen, docx_xml)
+    cached_fragment = docx_xml.xml_fragment
+    try:
+        for module in modules:
+            module.xml_fragment = parse_xml
+        before = _best_of(fn, repeat)
+    finally:
+        for module in modules:
+            module.xml_fragment = cached_fragment
+    after = _best_of(fn, repeat)
+    return before, after
+
+
+def bench_cell_fragments(rows, cols, repeat):
+    """Per-cell cost of shading/tblHeader fragments, before and after caching."""
+    headers, body = synthetic_table(rows, cols)
+    table = _per_cell_styled_table(Document(), headers, body)
+    cells = [cell for row in table.rows for cell in row.cells]
+
+    def shade():
+        for cell in cells:
+            gen.set_cell_shading(cell, gen.LIGHT_GRAY_HEX)
+        gen.mark_header_row(table)
+
+    def build():
+        _per_cell_styled_table(Document(), headers, body, col_widths=[1] * cols)
+
+    shade_before, shade_after = _with_and_without_fragment_cache(shade, repeat)
+    build_before, build_after = _with_and_without_fragment_cache(build, repeat)
+    return [
+        ("cell shading, parse_xml", shade_before, len(cells)),
+        ("cell shading, cached fragment", shade_after, len(cells)),
+        ("styled_table, parse_xml", build_before, len(cells)),
+        ("styled_table, cached fragments", build_after, len(cells)),
+    ]
+
+
+def bench_table_writers(rows, cols, repeat):
+    """Per-cell cost of the python-docx cell path vs the bulk lxml writer."""
+    headers, body = synthetic_table(rows, cols)
+    cells = (rows + 1) * cols
+
+    def per_cell():
+        _per_cell_styled_table(Document(), headers, body, col_widths=[1] * cols)
+
+    def bulk():
+        gen.styled_table_bulk(Document(), headers, body, col_widths=[1] * cols)
+
+    return [
+        ("styled_table, per-cell API", _best_of(per_cell, repeat), cells),
+        ("styled_table_bulk", _best_of(bulk, repeat), cells),
+    ]
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  REPORTING
+# ══════════════════════════════════════════════════════════════════════
+
+def _key(record):
+    return record["benchmark"], record["shape"], record["scale"]
+
+
+def _rate(value):
+    return f"{value:>10.0f}" if value else f"{'-':>10}"
+
+
+def print_records(records, baseline=None):
+    base = {_key(r): r for r in (baseline or [])}
+    print(f"  {'Benchmark':<12} {'Shape':<10} {'Scale':>5} {'Time ms':>10} "
+          f"{'Lines/s':>10} {'Cells/s':>10} {'Peak MB':>8}"
+          + (f" {'vs base':>8}" if base else ""))
+    for r in records:
+        line = (f"  {r['benchmark']:<12} {r['shape']:<10} {r['scale']:>5} "
+                f"{r['seconds'] * 1000:>10.1f} "
+                f"{_rate(r['lines_per_s'])} {_rate(r['cells_per_s'])} "
+                f"{r['peak_mb']:>8.1f}")
+        before = base.get(_key(r))
+        if before:
+            line += f" {r['seconds'] / before['seconds']:>7.2f}x"
+        elif base:
+            line += f" {'new':>8}"
+        print(line)
+
+
+def write_results(path, records, args):
+    results = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "python_docx": docx.__version__,
+        "repeat": args.repeat,
+        "scales": args.scales,
+        "records": records,
+    }
+    Path(path).write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  MAIN
+# ══════════════════════════════════════════════════════════════════════
+
+def _scales(value):
+    return [int(s) for s in value.split(",") if s.strip()]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scales", type=_scales, default=[1, 4, 16],
+                        help="comma-separated scale factors (default: 1,4,16)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed repetitions per benchmark; best is kept")
+    parser.add_argument("--output", metavar="PATH",
+                        help="write results as JSON to PATH")
+    parser.add_argument("--compare", metavar="PATH",
+                        help="show time relative to an earlier --output file")
+    parser.add_argument("--micro", action="store_true",
+                        help="also run the fragment-cache and table-writer "
+                             "micro-benchmarks")
+    parser.add_argument("--rows", type=int, default=400,
+                        help="table rows for --micro (default: 400)")
+    parser.add_argument("--cols", type=int, default=5,
+                        help="table columns for --micro (default: 5)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    baseline = None
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))["records"]
+
+    records = run_suite(args.scales, args.repeat)
+    print_records(records, baseline)
+    if args.output:
+        write_results(args.output, records, args)
+        print(f"\n  Results: {args.output}")
+
+    if args.micro:
+        results = bench_cell_fragments(args.rows, args.cols, args.repeat)
+        results += bench_table_writers(args.rows, args.cols, args.repeat)
+        print()
+        print(f"  {'Micro-benchmark':<36} {'Total':>10} {'Per cell':>12}")
+        for name, seconds, cells in results:
+            print(f"  {name:<36} {seconds * 1000:>8.1f}ms "
+                  f"{seconds / cells * 1e6:>10.1f}us")
+
+
+if __name__ == "__main__":
+    main()
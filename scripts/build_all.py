@@ -0,0 +1,340 @@
+"""
+Build every generated document from one process.
+Runs the DOCX suite, requirements DOCX, executive summary PPTX and project
+plan XML generators as targets with declared inputs and outputs; targets
+whose inputs are unchanged since their last successful build are skipped,
+and the rest share one interpreter, paying for start-up and imports once.
+Targets are dispatched to a thread pool in dependency order, but rendering
+with python-docx/python-pptx/lxml holds the GIL, so CPU-bound targets run
+mostly one after another; --jobs overlaps their file I/O, not their work.
+
+Run:  python scripts/build_all.py [TARGET ...] [--force] [--jobs N] [--verbose]
+      python scripts/build_all.py --list
+"""
+
+import argparse
+import hashlib
+import importlib
+import importlib.util
+import io
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPTS = ROOT / "scripts"
+DOCS = ROOT / "docs"
+STAMPS = DOCS / ".build-stamps.json"
+
+# Each target names its generator script, the argv its main() gets (plus
+# "force" under --force), glob patterns (relative to ROOT) for the files it
+# reads and writes, and the targets that must finish first. The generators
+# currently read only their own sources, so none declares a dependency.
+# "settings" names modules whose settings_key(), read from the environment,
+# also goes into the target's fingerprint.
+TARGETS = {
+    "docs": {
+        "script": "generate_all_docx.py",
+        # In-process, one document at a time: no worker processes forked
+        # from a threaded interpreter
+        "argv": ["--jobs", "1"],
+        "force": ["--force"],
+        "inputs": ["scripts/generate_all_docx.py", "scripts/docx_xml.py",
+                   "scripts/image_assets.py", "scripts/office_save.py",
+                   "docs/0[0-6]_*.md", "public/aspr-logo-blue.png"],
+        "outputs": ["docs/0[0-6]_ASPR_Photos_*.docx"],
+        "settings": ["image_assets", "office_save"],
+        "deps": [],
+    },
+    "requirements": {
+        "script": "generate-requirements-docx.py",
+        "argv": [],
+        "inputs": ["scripts/generate-requirements-docx.py", "scripts/docx_xml.py",
+                   "scripts/image_assets.py", "scripts/office_save.py",
+                   "public/aspr-logo-blue.png"],
+        "outputs": ["docs/ASPR_Photo_Repository_Requirements_v1.docx"],
+        "settings": ["image_assets", "office_save"],
+        "deps": [],
+    },
+    "deck": {
+        "script": "generate_exec_summary_pptx.py",
+        "argv": [],
+        "inputs": ["scripts/generate_exec_summary_pptx.py",
+                   "scripts/image_assets.py", "scripts/office_save.py",
+                   "public/aspr-logo-blue.png"],
+        "outputs": ["docs/ASPR_Photo_Repository_Executive_Summary.pptx"],
+        "settings": ["image_assets", "office_save"],
+        "deps": [],
+    },
+    "plan": {
+        "script": "generate_project_plan_xml.py",
+        "argv": [],
+        "inputs": ["scripts/generate_project_plan_xml.py"],
+        "outputs": ["docs/ASPR_Photo_Repository_Project_Plan.xml"],
+        "deps": [],
+    },
+}
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  UP-TO-DATE CHECKS
+# ══════════════════════════════════════════════════════════════════════
+
+def _matches(patterns):
+    return sorted({path for pattern in patterns for path in ROOT.glob(pattern)
+                   if path.is_file()})
+
+
+def target_fingerprint(name):
+    """Digest of a target's argv, settings and the contents of its input files."""
+    target = TARGETS[name]
+    h = hashlib.sha256(json.dumps(target["argv"]).encode("utf-8"))
+    for module in target.get("settings", []):
+        # Environment-driven output settings, e.g. ASPR_IMAGE_DPI
+        h.update(importlib.import_module(module).settings_key().encode("utf-8"))
+    for path in _matches(target["inputs"]):
+        h.update(path.relative_to(ROOT).as_posix().encode("utf-8"))
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def load_stamps():
+    try:
+        return json.loads(STAMPS.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_stamps(stamps):
+    STAMPS.parent.mkdir(parents=True, exist_ok=True)
+    STAMPS.write_text(json.dumps(stamps, indent=2, sort_keys=True) + "\n",
+                      encoding="utf-8")
+
+
+def make_stamp(name, fingerprint):
+    """Stamp for a target just built: its fingerprint and the files it wrote."""
+    return {"fingerprint": fingerprint,
+            "outputs": [path.relative_to(ROOT).as_posix()
+                        for path in _matches(TARGETS[name]["outputs"])]}
+
+
+def is_up_to_date(name, fingerprint, stamps):
+    # Every file the last build wrote must still exist: one pattern such
+    # as docs/0[0-6]_ASPR_Photos_*.docx stands for several documents
+    stamp = stamps.get(name)
+    if not isinstance(stamp, dict) or stamp.get("fingerprint") != fingerprint:
+        return False
+    return (all((ROOT / path).is_file() for path in stamp.get("outputs", []))
+            and all(any(ROOT.glob(pattern)) for pattern in TARGETS[name]["outputs"]))
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  RUNNING TARGETS
+# ══════════════════════════════════════════════════════════════════════
+
+class TargetOutput(io.TextIOBase):
+    """sys.stdout stand-in that gives each worker thread its own buffer."""
+
+    def __init__(self, console):
+        self.console = console
+        self.local = threading.local()
+
+    def capture(self):
+        self.local.buffer = io.StringIO()
+        return self.local.buffer
+
+    def release(self):
+        self.local.buffer = None
+
+    def write(self, text):
+        buffer = getattr(self.local, "buffer", None)
+        return (buffer or self.console).write(text)
+
+    def flush(self):
+        self.console.flush()
+
+
+def load_generator(script):
+    """Import a generator script once, by path (some names have hyphens)."""
+    name = Path(script).stem.replace("-", "_")
+    if name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(name, SCRIPTS / script)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[name]
+            raise
+    return sys.modules[name]
+
+
+def run_target(name, module, output, force=False):
+    """Run one target's main(); returns (exit code, seconds, captured output)."""
+    target = TARGETS[name]
+    argv = target["argv"] + (target.get("force", []) if force else [])
+    buffer = output.capture()
+    start = time.perf_counter()
+    try:
+        code = module.main(argv) or 0
+    except SystemExit as exc:
+        code = exc.code if isinstance(exc.code, int) else 1
+    except Exception as exc:
+        print(f"  [ERR] {type(exc).__name__}: {exc}")
+        code = 1
+    finally:
+        output.release()
+    return code, time.perf_counter() - start, buffer.getvalue()
+
+
+def _with_deps(names):
+    """names plus everything they depend on, in TARGETS order."""
+    wanted = set()
+    stack = list(names)
+    while stack:
+        name = stack.pop()
+        if name not in wanted:
+            wanted.add(name)
+            stack.extend(TARGETS[name]["deps"])
+    return [name for name in TARGETS if name in wanted]
+
+
+def build(names, force=False, jobs=1, verbose=False):
+    """Build names and their dependencies; returns {target: result dict}."""
+    names = _with_deps(names)
+    stamps = {} if force else load_stamps()
+    fingerprints = {name: target_fingerprint(name) for name in names}
+    results = {}
+
+    pending = []
+    for name in names:
+        if is_up_to_date(name, fingerprints[name], stamps):
+            results[name] = {"status": "cached", "seconds": 0.0}
+            print(f"  [CACHED] {name}")
+        else:
+            pending.append(name)
+
+    # Imports run here, one at a time, so workers never race on a module
+    imported = {}
+    for name in pending:
+        start = time.perf_counter()
+        try:
+            imported[name] = load_generator(TARGETS[name]["script"])
+        except Exception as exc:
+            results[name] = {"status": "error", "seconds": 0.0}
+            print(f"  [ERR] {name}: cannot import {TARGETS[name]['script']}: {exc}")
+            continue
+        results[name] = {"status": "pending",
+                         "import_seconds": time.perf_counter() - start}
+
+    output = TargetOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+            running = {}
+            waiting = [name for name in pending if name in imported]
+            while waiting or running:
+                for name in list(waiting):
+                    states = [results[dep]["status"] for dep in TARGETS[name]["deps"]]
+                    if any(state in ("error", "skipped") for state in states):
+                        waiting.remove(name)
+                        results[name]["status"] = "skipped"
+                        output.console.write(f"  [SKIP] {name} (dependency failed)\n")
+                    elif all(state in ("ok", "cached") for state in states):
+                        waiting.remove(name)
+                        running[pool.submit(run_target, name, imported[name],
+                                            output, force)] = name
+                if not running:
+                    # Nothing ready and nothing running: the rest wait on a cycle
+                    for name in waiting:
+                        results[name]["status"] = "skipped"
+                        output.console.write(f"  [SKIP] {name} (dependency cycle)\n")
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    code, seconds, captured = future.result()
+                    ok = code == 0
+                    results[name].update(status="ok" if ok else "error", seconds=seconds)
+                    if ok:
+                        stamps[name] = make_stamp(name, fingerprints[name])
+                    else:
+                        stamps.pop(name, None)
+                    tag = "[OK]" if ok else "[ERR]"
+                    output.console.write(f"  {tag} {name} ({seconds:.2f}s)\n")
+                    if verbose or not ok:
+                        output.console.write(captured)
+    finally:
+        sys.stdout = output.console
+
+    save_stamps(stamps)
+    return results
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  MAIN
+# ══════════════════════════════════════════════════════════════════════
+
+def print_timings(results, wall):
+    print()
+    print(f"  {'Target':<14}{'Status':<10}{'Import':>9}{'Build':>9}")
+    for name, result in results.items():
+        imported = result.get("import_seconds")
+        import_col = f"{imported:.2f}s" if imported is not None else "-"
+        build_col = f"{result.get('seconds', 0.0):.2f}s"
+        print(f"  {name:<14}{result['status']:<10}{import_col:>9}{build_col:>9}")
+    busy = sum(r.get("seconds", 0.0) + r.get("import_seconds", 0.0)
+               for r in results.values())
+    print(f"\n  Wall time: {wall:.2f}s  (target time {busy:.2f}s)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Build the generated documents as one concurrent target graph.")
+    parser.add_argument("targets", nargs="*", metavar="TARGET",
+                        help=f"targets to build (default: all of {', '.join(TARGETS)})")
+    parser.add_argument("-f", "--force", action="store_true",
+                        help="rebuild targets even when their inputs are unchanged")
+    parser.add_argument("-j", "--jobs", type=int, default=min(len(TARGETS), os.cpu_count() or 1),
+                        help="target threads (default: CPU count, at most one per target); "
+                             "they overlap I/O, rendering still takes turns")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="show each generator's own output")
+    parser.add_argument("--list", action="store_true",
+                        help="list targets with their inputs and outputs, then exit")
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.targets if name not in TARGETS]
+    if unknown:
+        parser.error(f"unknown target(s): {', '.join(unknown)}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.list:
+        for name, target in TARGETS.items():
+            deps = f"  (after {', '.join(target['deps'])})" if target["deps"] else ""
+            print(f"{name}: scripts/{target['script']}{deps}")
+            print(f"    inputs:  {', '.join(target['inputs'])}")
+            print(f"    outputs: {', '.join(target['outputs'])}")
+        return 0
+
+    print("=" * 60)
+    print("  ASPR Photo Repository — Document Build")
+    print("=" * 60)
+    print()
+
+    start = time.perf_counter()
+    results = build(args.targets or list(TARGETS), force=args.force,
+                    jobs=args.jobs, verbose=args.verbose)
+    print_timings(results, time.perf_counter() - start)
+    return 1 if any(r["status"] in ("error", "skipped") for r in results.values()) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
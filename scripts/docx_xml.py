@@ -0,0 +1,52 @@
+"""
+Raw WordprocessingML helpers shared by the python-docx generators.
+
+xml_fragment(xml) returns a fresh copy of an XML fragment, parsing each
+distinct fragment once per process; the shading and border helpers build
+their elements from it, so every generator shares the one cache.
+"""
+
+from copy import deepcopy
+from functools import lru_cache
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+
+@lru_cache(maxsize=None)
+def _fragment_prototype(xml):
+    return parse_xml(xml)
+
+
+def xml_fragment(xml):
+    """Return a fresh copy of an XML fragment, parsing each distinct one once."""
+    return deepcopy(_fragment_prototype(xml))
+
+
+def set_cell_shading(cell, hex_color):
+    """Apply background shading to a table cell."""
+    shading = xml_fragment(
+        f'<w:shd {nsdecls("w")} w:fill="{hex_color}" w:val="clear"/>'
+    )
+    cell._tc.get_or_add_tcPr().append(shading)
+
+
+def set_cell_shading_para(paragraph, hex_color):
+    """Apply background shading to a paragraph (e.g. code blocks)."""
+    shading = xml_fragment(
+        f'<w:shd {nsdecls("w")} w:fill="{hex_color}" w:val="clear"/>'
+    )
+    paragraph.paragraph_format.element.get_or_add_pPr().append(shading)
+
+
+def set_cell_border(cell, **kwargs):
+    """Set borders on a cell. kwargs: top, bottom, left, right with values like ('single','4','auto')."""
+    tc = cell._tc
+    tcPr = tc.get_or_add_tcPr()
+    tcBorders = xml_fragment(f'<w:tcBorders {nsdecls("w")}></w:tcBorders>')
+    for edge, (style, sz, color) in kwargs.items():
+        el = xml_fragment(
+            f'<w:{edge} {nsdecls("w")} w:val="{style}" w:sz="{sz}" w:color="{color}" w:space="0"/>'
+        )
+        tcBorders.append(el)
+    tcPr.append(tcBorders)
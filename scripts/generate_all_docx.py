@@ -2,12 +2,38 @@
 Generate all DOCX documents for the ASPR Photo Repository project.
 Reads markdown source files from docs/ and produces branded DOCX output.
 
-Run:  python scripts/generate_all_docx.py
+Run:  python scripts/generate_all_docx.py [--jobs N] [--force] [--no-template]
+                                          [--formats docx,html,json] [--watch]
+                                          [--profile [--profile-stats PATH]
+                                           [--trace PATH]]
 Requires: pip install python-docx
+
+Each source is parsed once; --formats can add a self-contained HTML page
+and a JSON search-index export alongside (or instead of) each DOCX.
+
+Unchanged documents are skipped using the content-hash manifest in
+docs/.build-cache.json; pass --force to rebuild everything. --watch keeps
+the process running and rebuilds a document whenever its source changes.
+Logos are embedded downscaled to their placed size (see image_assets.py),
+and packages are written by office_save.py, which stores media uncompressed.
 """
 
+import argparse
+import base64
+import cProfile
+import hashlib
+import json
 import os
 import re
+import time
+import tracemalloc
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from copy import deepcopy
+from html import escape
+from io import BytesIO
+from itertools import groupby
 from pathlib import Path
 
 from docx import Document
@@ -16,9 +42,21 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.oxml.ns import qn, nsdecls
 from docx.oxml import parse_xml
+from lxml.etree import SubElement
+
+import image_assets
+import office_save
+from docx_xml import set_cell_shading, set_cell_shading_para, xml_fragment
+from image_assets import placed_image
+from office_save import package_bytes, save_package
 
 ROOT = Path(__file__).resolve().parent.parent
 DOCS = ROOT / "docs"
+BUILD_CACHE = DOCS / ".build-cache.json"
+
+# main() returns 1 when a document fails, for build_all; as a command the
+# generator reports failures but exits 0, as it always has
+EXIT_STATUS_ON_ERROR = False
 
 # ── ASPR / HHS brand colours (508-compliant, WCAG AA contrast) ────────
 BLUE_DARK      = RGBColor(0x06, 0x2E, 0x61)   # 14.5:1 on white
@@ -70,7 +108,7 @@ def set_document_metadata(doc, title, subject="ASPR Photo Repository",
 
 def add_image_with_alt(run, image_path, width, alt_text):
     """Add an image with alt text for screen readers (Section 508)."""
-    inline = run.add_picture(str(image_path), width=width)
+    inline = run.add_picture(placed_image(image_path, width=width), width=width)
     # Set alt text via docPr element
     drawing = run._r.findall(qn('w:drawing'))[0]
     inline_el = drawing.findall(qn('wp:inline'))[0]
@@ -84,25 +122,13 @@ def mark_header_row(table):
     """Mark the first row of a table as a header row for screen readers."""
     first_row = table.rows[0]
     trPr = first_row._tr.get_or_add_trPr()
-    trPr.append(parse_xml(f'<w:tblHeader {nsdecls("w")}/>'))
-
-
-def set_cell_shading(cell, hex_color):
-    shading = parse_xml(
-        f'<w:shd {nsdecls("w")} w:fill="{hex_color}" w:val="clear"/>'
-    )
-    cell._tc.get_or_add_tcPr().append(shading)
-
-
-def set_cell_shading_para(paragraph, hex_color):
-    """Apply background shading to a paragraph (e.g. code blocks)."""
-    shading = parse_xml(
-        f'<w:shd {nsdecls("w")} w:fill="{hex_color}" w:val="clear"/>'
-    )
-    paragraph.paragraph_format.element.get_or_add_pPr().append(shading)
+    trPr.append(xml_fragment(f'<w:tblHeader {nsdecls("w")}/>'))
 
 
 def styled_table(doc, headers, rows, col_widths=None):
+    if len(rows) >= BULK_TABLE_MIN_ROWS:
+        return styled_table_bulk(doc, headers, rows, col_widths)
+
     ncols = len(headers)
     table = doc.add_table(rows=1 + len(rows), cols=ncols)
     table.alignment = WD_TABLE_ALIGNMENT.CENTER
@@ -148,6 +174,106 @@ def styled_table(doc, headers, rows, col_widths=None):
     return table
 
 
+# ── Bulk table writer ─────────────────────────────────────────────────
+# Large tables bypass python-docx's per-cell API (row.cells is O(columns)
+# per access) and are emitted as one <w:tbl>. The XML is identical to what
+# the per-cell path above produces.
+
+BULK_TABLE_MIN_ROWS = 40
+
+
+def _el(parent, tag, **attrs):
+    el = SubElement(parent, qn(tag))
+    for name, value in attrs.items():
+        el.set(qn(f"w:{name}"), value)
+    return el
+
+
+def _cell_prototype(tbl, width, fill=None, run_xml=None):
+    """A detached <w:tc> with width, optional shading and paragraph/run props.
+
+    run_xml is (before, after, bold, color) in OOXML units, or None for an
+    empty cell.
+    """
+    tc = tbl.makeelement(qn("w:tc"), {})
+    tcPr = _el(tc, "w:tcPr")
+    _el(tcPr, "w:tcW", type="dxa", w=str(width))
+    if fill:
+        _el(tcPr, "w:shd", fill=fill, val="clear")
+    p = _el(tc, "w:p")
+    if run_xml is None:
+        return tc
+
+    before, after, bold, color = run_xml
+    pPr = _el(p, "w:pPr")
+    _el(pPr, "w:spacing", before=before, after=after)
+    if bold:
+        _el(pPr, "w:jc", val="left")
+    rPr = _el(_el(p, "w:r"), "w:rPr")
+    _el(rPr, "w:rFonts", ascii="Calibri", hAnsi="Calibri")
+    if bold:
+        _el(rPr, "w:b")
+    if color:
+        _el(rPr, "w:color", val=color)
+    _el(rPr, "w:sz", val="19")   # 9.5pt
+    return tc
+
+
+def _fill_cell(proto, text):
+    tc = deepcopy(proto)
+    if not text:
+        return tc
+    r = tc[-1][-1]
+    if "\t" in text or "\n" in text or "\r" in text:
+        r.text = text   # CT_R setter converts tabs/breaks like add_run does
+        return tc
+    t = _el(r, "w:t")
+    t.text = text
+    if len(text.strip()) < len(text):
+        t.set(qn("xml:space"), "preserve")
+    return tc
+
+
+def styled_table_bulk(doc, headers, rows, col_widths=None):
+    """styled_table for large tables: builds the rows directly in lxml."""
+    ncols = len(headers)
+    table = doc.add_table(rows=0, cols=ncols)
+    table.alignment = WD_TABLE_ALIGNMENT.CENTER
+    table.style = "Table Grid"
+    tbl = table._tbl
+
+    if col_widths:
+        total = sum(col_widths)
+        table_width = Inches(6.5)
+        widths = [Emu(int(table_width * w / total)).twips for w in col_widths]
+    else:
+        widths = [grid_col.get(qn("w:w")) for grid_col in tbl.tblGrid]
+
+    header_protos = [_cell_prototype(tbl, w, BLUE_DARK_HEX, ("60", "60", True, "FFFFFF"))
+                     for w in widths]
+    row_protos = [
+        [_cell_prototype(tbl, w, None, ("40", "40", False, None)) for w in widths],
+        [_cell_prototype(tbl, w, LIGHT_GRAY_HEX, ("40", "40", False, None)) for w in widths],
+    ]
+    empty_protos = [_cell_prototype(tbl, w) for w in widths]
+
+    tr = _el(tbl, "w:tr")
+    _el(_el(tr, "w:trPr"), "w:tblHeader")   # 508: header row for screen readers
+    for ci, text in enumerate(headers):
+        tr.append(_fill_cell(header_protos[ci], text))
+
+    for ri, row_data in enumerate(rows):
+        tr = _el(tbl, "w:tr")
+        protos = row_protos[ri % 2]
+        row_data = row_data[:ncols]
+        for ci, text in enumerate(row_data):
+            tr.append(_fill_cell(protos[ci], str(text)))
+        for ci in range(len(row_data), ncols):
+            tr.append(deepcopy(empty_protos[ci]))
+
+    return table
+
+
 def add_heading_styled(doc, text, level=1):
     h = doc.add_heading(text, level=level)
     color_map = {1: BLUE_DARK, 2: BLUE_PRIMARY, 3: GOLD_DARK}
@@ -215,8 +341,20 @@ def add_toc(doc):
 
 
 def setup_doc(doc_title, doc_subtitle, version="1.0", date="February 7, 2026",
-              status="Draft"):
-    """Create a new Document with branding, cover page, and TOC."""
+              status="Draft", use_template=True):
+    """Create a new Document with branding, cover page, and TOC.
+
+    With use_template the branded skeleton is built once per process and
+    cloned, so only the per-document fields are written each time.
+    """
+    if use_template:
+        return clone_template(doc_title, doc_subtitle, version=version,
+                              date=date, status=status)
+    return build_branded_doc(doc_title, doc_subtitle, version, date, status)
+
+
+def build_branded_doc(doc_title, doc_subtitle, version, date, status):
+    """Build branding, cover page and TOC from an empty Document()."""
     doc = Document()
 
     # 508: Document metadata and language
@@ -326,58 +464,154 @@ def setup_doc(doc_title, doc_subtitle, version="1.0", date="February 7, 2026",
     return doc
 
 
+# ── Branded skeleton template ─────────────────────────────────────────
+# Placeholders are written into the skeleton as plain run text and patched
+# in the clone. Each one sits in a single run, so a w:t lookup finds it.
+
+TEMPLATE_FIELDS = ("title", "subtitle", "version", "date", "status")
+
+_template_bytes = None
+
+
+def _placeholder(field):
+    return "{{" + field + "}}"
+
+
+def get_template_bytes():
+    """Serialized branded skeleton, built on first use and kept per process."""
+    global _template_bytes
+    if _template_bytes is None:
+        doc = build_branded_doc(*(_placeholder(f) for f in TEMPLATE_FIELDS))
+        _template_bytes = package_bytes(doc)
+    return _template_bytes
+
+
+def _fill_placeholders(element, values):
+    for t in element.iter(qn("w:t")):
+        text = t.text
+        if text and "{{" in text:
+            for field, value in values.items():
+                text = text.replace(_placeholder(field), value)
+            t.text = text
+
+
+def clone_template(doc_title, doc_subtitle, version="1.0",
+                   date="February 7, 2026", status="Draft"):
+    """Open a copy of the branded skeleton and fill in the document fields."""
+    doc = Document(BytesIO(get_template_bytes()))
+    values = {
+        "title": doc_title,
+        "subtitle": doc_subtitle,
+        "version": version,
+        "date": date,
+        "status": status,
+    }
+    _fill_placeholders(doc.element.body, values)
+    for section in doc.sections:
+        _fill_placeholders(section.header._element, values)
+        _fill_placeholders(section.footer._element, values)
+    doc.core_properties.title = doc_title
+    return doc
+
+
 # ══════════════════════════════════════════════════════════════════════
 #  MARKDOWN → DOCX CONVERTER
 # ══════════════════════════════════════════════════════════════════════
 
+# ── Block model ───────────────────────────────────────────────────────
+# tokenize_md() turns markdown lines into these blocks; render_docx()
+# turns blocks into python-docx calls. Parsing never touches the Document.
+
+Heading = namedtuple("Heading", "level text")
+Table = namedtuple("Table", "headers rows")
+CodeBlock = namedtuple("CodeBlock", "text")
+Bullet = namedtuple("Bullet", "level text")
+Paragraph = namedtuple("Paragraph", "text bold")
+Rule = namedtuple("Rule", "")
+
+
+def split_md_row(line):
+    """Split one markdown table line into stripped cell strings."""
+    return [c.strip() for c in line.strip().strip('|').split('|')]
+
+
 def parse_md_table(lines):
     """Parse markdown table lines into (headers, rows)."""
     headers = []
     rows = []
     for i, line in enumerate(lines):
-        cells = [c.strip() for c in line.strip().strip('|').split('|')]
         if i == 0:
-            headers = cells
+            headers = split_md_row(line)
         elif i == 1:
             continue  # separator row
         else:
-            rows.append(cells)
+            rows.append(split_md_row(line))
     return headers, rows
 
 
-def md_to_docx(md_path, doc_title, doc_subtitle, out_filename):
-    """Convert a markdown file to a branded DOCX document."""
-    md_text = md_path.read_text(encoding='utf-8')
-    lines = md_text.split('\n')
-
-    doc = setup_doc(doc_title, doc_subtitle)
-
-    # Skip the markdown header block (title, metadata table, ---)
-    # Find where the actual content starts (first ## heading)
-    content_start = 0
-    found_first_heading = False
-    for i, line in enumerate(lines):
-        if line.startswith('## ') and not found_first_heading:
-            # Skip "Table of Contents" if present
-            if 'table of contents' in line.lower():
-                continue
-            content_start = i
-            found_first_heading = True
-            break
-
-    i = content_start
-    while i < len(lines):
-        line = lines[i]
+def iter_lines(fh):
+    """Yield lines from a text file handle exactly as str.split('\\n') would."""
+    line = ''
+    for line in fh:
+        yield line[:-1] if line.endswith('\n') else line
+    if line.endswith('\n') or not line:
+        yield ''
+
+
+def skip_preamble(lines):
+    """Drop the markdown header block (title, metadata table, ---).
+
+    Content starts at the first "## " heading that is not "Table of
+    Contents". Only the preamble is buffered; if no such heading exists
+    the whole input is used.
+    """
+    preamble = []
+    lines = iter(lines)
+    for line in lines:
+        if line.startswith('## ') and 'table of contents' not in line.lower():
+            yield line
+            yield from lines
+            return
+        preamble.append(line)
+    yield from preamble
+
+
+class _Lookahead:
+    """Iterator with a one-line peek, used for table detection."""
+
+    def __init__(self, lines):
+        self._lines = iter(lines)
+        self._peeked = []
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._peeked:
+            return self._peeked.pop()
+        return next(self._lines)
+
+    def peek(self):
+        if not self._peeked:
+            try:
+                self._peeked.append(next(self._lines))
+            except StopIteration:
+                return None
+        return self._peeked[-1]
+
+
+def tokenize_md(lines):
+    """Yield typed blocks from markdown lines in a single streaming pass."""
+    lines = _Lookahead(skip_preamble(lines))
+    for line in lines:
         stripped = line.strip()
 
         # Skip empty lines
         if not stripped:
-            i += 1
             continue
 
         # Skip markdown TOC links
         if stripped.startswith('- [') and '](#' in stripped:
-            i += 1
             continue
 
         # Headings
@@ -385,84 +619,269 @@ def md_to_docx(md_path, doc_title, doc_subtitle, out_filename):
             text = stripped[4:].strip()
             if text.startswith('#'):
                 text = text.lstrip('#').strip()
-            add_heading_styled(doc, text, level=3)
-            i += 1
+            yield Heading(3, text)
             continue
 
         if stripped.startswith('## '):
-            text = stripped[3:].strip()
-            add_heading_styled(doc, text, level=2)
-            i += 1
+            yield Heading(2, stripped[3:].strip())
             continue
 
         # Horizontal rule
         if stripped == '---':
-            i += 1
+            yield Rule()
             continue
 
-        # Table detection
-        if '|' in stripped and i + 1 < len(lines) and '---' in lines[i + 1]:
-            table_lines = []
-            while i < len(lines) and '|' in lines[i].strip():
-                table_lines.append(lines[i])
-                i += 1
-            headers, rows = parse_md_table(table_lines)
-            if headers and rows:
-                styled_table(doc, headers, rows)
-            continue
+        # Table: header line followed by a separator line
+        if '|' in stripped:
+            following = lines.peek()
+            if following is not None and '---' in following:
+                headers = split_md_row(line)
+                rows = []
+                if '|' in following.strip():
+                    next(lines)  # separator row
+                    while (lines.peek() is not None
+                           and '|' in lines.peek().strip()):
+                        rows.append(split_md_row(next(lines)))
+                if headers and rows:
+                    yield Table(headers, rows)
+                continue
 
         # Code block
         if stripped.startswith('```'):
             code_lines = []
-            i += 1
-            while i < len(lines) and not lines[i].strip().startswith('```'):
-                code_lines.append(lines[i])
-                i += 1
-            i += 1  # skip closing ```
-
-            code_text = '\n'.join(code_lines)
-            p = doc.add_paragraph()
-            p.paragraph_format.space_before = Pt(6)
-            p.paragraph_format.space_after = Pt(6)
-            # 508: light gray background with automatic text color for dark/light mode
-            set_cell_shading_para(p, LIGHT_GRAY_HEX)
-            run = p.add_run(code_text)
-            run.font.size = Pt(8.5)
-            run.font.name = "Consolas"
-            # No explicit color — lets Word auto-adjust for dark/light mode
+            for code_line in lines:   # consumes the closing ```
+                if code_line.strip().startswith('```'):
+                    break
+                code_lines.append(code_line)
+            yield CodeBlock('\n'.join(code_lines))
             continue
 
         # Bullet point
         if stripped.startswith('- ') or stripped.startswith('* '):
-            text = stripped[2:].strip()
             # Remove bold markers
-            text = text.replace('**', '')
-            level = 1 if line.startswith('  ') else 0
-            add_bullet(doc, text, level=level)
-            i += 1
+            text = stripped[2:].strip().replace('**', '')
+            yield Bullet(1 if line.startswith('  ') else 0, text)
             continue
 
         # Bold paragraph
         if stripped.startswith('**') and stripped.endswith('**'):
-            text = stripped.strip('*').strip()
-            add_para(doc, text, bold=True)
-            i += 1
+            yield Paragraph(stripped.strip('*').strip(), True)
             continue
 
         # Regular paragraph
         text = stripped.replace('**', '')
         if text:
-            add_para(doc, text)
-        i += 1
+            yield Paragraph(text, False)
+
+
+# ── DOCX renderer ─────────────────────────────────────────────────────
+
+def _render_code(doc, block):
+    p = doc.add_paragraph()
+    p.paragraph_format.space_before = Pt(6)
+    p.paragraph_format.space_after = Pt(6)
+    # 508: light gray background with automatic text color for dark/light mode
+    set_cell_shading_para(p, LIGHT_GRAY_HEX)
+    run = p.add_run(block.text)
+    run.font.size = Pt(8.5)
+    run.font.name = "Consolas"
+    # No explicit color — lets Word auto-adjust for dark/light mode
+
 
-    # Save
+DOCX_RENDERERS = {
+    Heading: lambda doc, b: add_heading_styled(doc, b.text, level=b.level),
+    Table: lambda doc, b: styled_table(doc, b.headers, b.rows),
+    CodeBlock: _render_code,
+    Bullet: lambda doc, b: add_bullet(doc, b.text, level=b.level),
+    Paragraph: lambda doc, b: add_para(doc, b.text, bold=b.bold),
+    Rule: lambda doc, b: None,   # rules only separate sections in markdown
+}
+
+
+def render_docx(doc, blocks):
+    """Append blocks from tokenize_md() to a python-docx Document."""
+    for block in blocks:
+        DOCX_RENDERERS[type(block)](doc, block)
+
+
+def write_docx(blocks, doc_def, out_path, use_template=True):
+    doc = setup_doc(doc_def["title"], doc_def["subtitle"],
+                    use_template=use_template)
+    render_docx(doc, blocks)
+    save_package(doc, out_path)
+
+
+def md_to_docx(md_path, doc_title, doc_subtitle, out_filename,
+               use_template=True):
+    """Convert a markdown file to a branded DOCX document."""
+    doc_def = {"title": doc_title, "subtitle": doc_subtitle}
     out_path = DOCS / out_filename
-    doc.save(str(out_path))
-    size_kb = out_path.stat().st_size / 1024
-    print(f"  [OK] {out_filename} ({size_kb:.1f} KB)")
+    with open(md_path, encoding='utf-8') as fh:
+        write_docx(tokenize_md(iter_lines(fh)), doc_def, out_path,
+                   use_template=use_template)
     return out_path
 
 
+# ── HTML renderer ─────────────────────────────────────────────────────
+# Self-contained: styles are inline and the logo is embedded as a data URI.
+
+HTML_STYLE = f"""
+body {{ font-family: Calibri, Arial, sans-serif; font-size: 11pt;
+       color: #333333; max-width: 52em; margin: 2em auto; padding: 0 1em; }}
+header {{ border-bottom: 3px solid #{BLUE_DARK_HEX}; margin-bottom: 2em; }}
+h1 {{ color: #{BLUE_DARK_HEX}; margin-bottom: 0.2em; }}
+header p {{ color: #{BLUE_PRIMARY_HEX}; font-size: 14pt; margin-top: 0; }}
+h2 {{ color: #{BLUE_PRIMARY_HEX}; }}
+h3 {{ color: #{GOLD_DARK_HEX}; }}
+table {{ border-collapse: collapse; width: 100%; margin: 1em 0;
+        font-size: 9.5pt; }}
+th, td {{ border: 1px solid #999999; padding: 3px 6px; text-align: left;
+         vertical-align: top; }}
+th {{ background: #{BLUE_DARK_HEX}; color: #FFFFFF; }}
+tbody tr:nth-child(even) td {{ background: #{LIGHT_GRAY_HEX}; }}
+pre {{ background: #{LIGHT_GRAY_HEX}; padding: 0.6em; font-size: 8.5pt;
+      font-family: Consolas, monospace; overflow-x: auto; }}
+footer {{ margin-top: 3em; text-align: center; font-size: 8pt;
+         color: #{BLUE_DARK_HEX}; }}
+"""
+
+
+def _html_table(block):
+    ncols = len(block.headers)
+    out = ['<table>', '<thead><tr>']
+    out += [f'<th scope="col">{escape(h)}</th>' for h in block.headers]
+    out += ['</tr></thead>', '<tbody>']
+    for row in block.rows:
+        cells = row[:ncols] + [''] * (ncols - len(row))
+        out.append('<tr>' + ''.join(f'<td>{escape(c)}</td>' for c in cells)
+                   + '</tr>')
+    out += ['</tbody>', '</table>']
+    return '\n'.join(out)
+
+
+def _html_list(bullets):
+    out = ['<ul>']
+    nested = False
+    for b in bullets:
+        if b.level and not nested:
+            out.append('<li><ul>')
+        elif nested and not b.level:
+            out.append('</ul></li>')
+        nested = bool(b.level)
+        out.append(f'<li>{escape(b.text)}</li>')
+    if nested:
+        out.append('</ul></li>')
+    out.append('</ul>')
+    return '\n'.join(out)
+
+
+def _html_logo():
+    if not ASPR_LOGO.exists():
+        return ''
+    # 192 CSS px is 2 inches
+    logo = Path(placed_image(ASPR_LOGO, width=Inches(2.0)))
+    mime = "image/jpeg" if logo.suffix.lower() in (".jpg", ".jpeg") else "image/png"
+    data = base64.b64encode(logo.read_bytes()).decode('ascii')
+    return (f'<img src="data:{mime};base64,{data}" width="192" '
+            f'alt="ASPR — Administration for Strategic Preparedness and '
+            f'Response logo">')
+
+
+def render_html(blocks, doc_def):
+    """Render blocks as a standalone, 508-friendly HTML page."""
+    title = escape(doc_def["title"])
+    body = []
+    for kind, group in groupby(blocks, key=type):
+        if kind is Bullet:
+            body.append(_html_list(group))
+            continue
+        for block in group:
+            if kind is Heading:
+                body.append(f'<h{block.level}>{escape(block.text)}</h{block.level}>')
+            elif kind is Table:
+                body.append(_html_table(block))
+            elif kind is CodeBlock:
+                body.append(f'<pre><code>{escape(block.text)}</code></pre>')
+            elif kind is Paragraph:
+                text = escape(block.text)
+                body.append(f'<p><strong>{text}</strong></p>' if block.bold
+                            else f'<p>{text}</p>')
+    return '\n'.join([
+        '<!DOCTYPE html>',
+        '<html lang="en-US">',
+        '<head>',
+        '<meta charset="utf-8">',
+        f'<title>ASPR Photo Repository — {title}</title>',
+        f'<style>{HTML_STYLE}</style>',
+        '</head>',
+        '<body>',
+        '<header>',
+        _html_logo(),
+        f'<h1>{title}</h1>',
+        f'<p>{escape(doc_def["subtitle"])}</p>',
+        '</header>',
+        '<main>',
+        *body,
+        '</main>',
+        '<footer>HHS/ASPR — For Official Use Only | Leidos</footer>',
+        '</body>',
+        '</html>',
+        '',
+    ])
+
+
+def write_html(blocks, doc_def, out_path):
+    out_path.write_text(render_html(blocks, doc_def), encoding='utf-8')
+
+
+# ── JSON renderer (search index) ──────────────────────────────────────
+
+def _block_text(block):
+    if isinstance(block, Table):
+        return '\n'.join(' | '.join(cells)
+                         for cells in [block.headers, *block.rows])
+    if isinstance(block, Rule):
+        return ''
+    return block.text
+
+
+def render_index(blocks, doc_def):
+    """Flatten blocks into heading-delimited plain-text sections."""
+    sections = []
+    section = {"heading": doc_def["title"], "level": 1, "text": []}
+    for block in blocks:
+        if isinstance(block, Heading):
+            sections.append(section)
+            section = {"heading": block.text, "level": block.level, "text": []}
+            continue
+        text = _block_text(block)
+        if text:
+            section["text"].append(text)
+    sections.append(section)
+
+    for section in sections:
+        section["text"] = '\n'.join(section["text"])
+    return {
+        "title": doc_def["title"],
+        "subtitle": doc_def["subtitle"],
+        "source": doc_def.get("md"),
+        "sections": [s for s in sections if s["text"] or s["level"] > 1],
+    }
+
+
+def write_json(blocks, doc_def, out_path):
+    out_path.write_text(
+        json.dumps(render_index(blocks, doc_def), indent=2, ensure_ascii=False)
+        + '\n', encoding='utf-8')
+
+
+WRITERS = {
+    "docx": write_docx,
+    "html": write_html,
+    "json": write_json,
+}
+
+
 # ══════════════════════════════════════════════════════════════════════
 #  DOCUMENT DEFINITIONS
 # ══════════════════════════════════════════════════════════════════════
@@ -513,11 +932,277 @@ DOCUMENTS = [
 ]
 
 
+# ══════════════════════════════════════════════════════════════════════
+#  BUILD CACHE
+# ══════════════════════════════════════════════════════════════════════
+
+def _hash_file(h, path):
+    h.update(path.name.encode("utf-8"))
+    h.update(path.read_bytes() if path.exists() else b"<missing>")
+
+
+def shared_fingerprint():
+    """Digest of the inputs every document depends on (generators + logos)."""
+    settings = f"{image_assets.settings_key()} {office_save.settings_key()}"
+    h = hashlib.sha256(settings.encode("utf-8"))
+    for path in (Path(__file__).resolve(), Path(image_assets.__file__).resolve(),
+                 Path(office_save.__file__).resolve(), ASPR_LOGO, LEIDOS_LOGO):
+        _hash_file(h, path)
+    return h.hexdigest()
+
+
+def document_fingerprint(doc_def, shared):
+    """Digest of everything that determines one DOCUMENTS entry's output."""
+    h = hashlib.sha256(shared.encode("ascii"))
+    h.update(json.dumps(doc_def, sort_keys=True).encode("utf-8"))
+    _hash_file(h, DOCS / doc_def["md"])
+    return h.hexdigest()
+
+
+def load_build_cache():
+    try:
+        return json.loads(BUILD_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_build_cache(cache):
+    BUILD_CACHE.write_text(json.dumps(cache, indent=2, sort_keys=True) + "\n",
+                           encoding="utf-8")
+
+
+def is_cached(doc_def, fingerprint, cache, formats=("docx",)):
+    return all(cache.get(name) == fingerprint and (DOCS / name).exists()
+               for name in output_names(doc_def, formats))
+
+
 # ══════════════════════════════════════════════════════════════════════
 #  MAIN
 # ══════════════════════════════════════════════════════════════════════
 
-if __name__ == "__main__":
+def output_names(doc_def, formats):
+    """Output file names for a DOCUMENTS entry, one per format."""
+    return [Path(doc_def["out"]).with_suffix(f".{fmt}").name for fmt in formats]
+
+
+def build_document(doc_def, use_template=True, formats=("docx",)):
+    """Generate one DOCUMENTS entry in each format, parsing its source once.
+
+    Top-level so it can run in a worker process. Returns the output paths.
+    """
+    out_paths = [DOCS / name for name in output_names(doc_def, formats)]
+    with open(DOCS / doc_def["md"], encoding='utf-8') as fh:
+        blocks = tokenize_md(iter_lines(fh))
+        if len(formats) > 1:
+            blocks = list(blocks)   # one parse shared by every backend
+        for fmt, out_path in zip(formats, out_paths):
+            if fmt == "docx":
+                write_docx(blocks, doc_def, out_path, use_template=use_template)
+            else:
+                WRITERS[fmt](blocks, doc_def, out_path)
+    return out_paths
+
+
+# ── Profiling ─────────────────────────────────────────────────────────
+# Profiling materializes each stage (read, parse, setup_doc, per-block
+# render, save) so they can be timed separately; tracemalloc adds overhead,
+# so compare profiled runs with each other rather than with normal runs.
+
+class StageTimer:
+    """Accumulates wall time, call count and peak traced memory per stage."""
+
+    def __init__(self):
+        self.stages = {}
+
+    @contextmanager
+    def stage(self, name):
+        tracemalloc.reset_peak()
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            peak = tracemalloc.get_traced_memory()[1]
+            record = self.stages.setdefault(
+                name, {"calls": 0, "seconds": 0.0, "peak_bytes": 0})
+            record["calls"] += 1
+            record["seconds"] += elapsed
+            record["peak_bytes"] = max(record["peak_bytes"], peak)
+
+
+def profile_document(doc_def, use_template=True, formats=("docx",)):
+    """build_document with per-stage timing. Returns (out_paths, stages)."""
+    timer = StageTimer()
+    out_paths = [DOCS / name for name in output_names(doc_def, formats)]
+    tracemalloc.start()
+    try:
+        with timer.stage("read"):
+            with open(DOCS / doc_def["md"], encoding='utf-8') as fh:
+                lines = list(iter_lines(fh))
+        with timer.stage("parse"):
+            blocks = list(tokenize_md(lines))
+
+        for fmt, out_path in zip(formats, out_paths):
+            if fmt != "docx":
+                with timer.stage(f"write {fmt}"):
+                    WRITERS[fmt](blocks, doc_def, out_path)
+                continue
+            with timer.stage("setup_doc"):
+                doc = setup_doc(doc_def["title"], doc_def["subtitle"],
+                                use_template=use_template)
+            for block in blocks:
+                with timer.stage(f"render {type(block).__name__}"):
+                    DOCX_RENDERERS[type(block)](doc, block)
+            with timer.stage("save"):
+                save_package(doc, out_path)
+    finally:
+        tracemalloc.stop()
+    return out_paths, timer.stages
+
+
+def print_profile(name, stages):
+    total = sum(record["seconds"] for record in stages.values())
+    print(f"  Profile: {name}")
+    print(f"    {'Stage':<22} {'Calls':>6} {'Time ms':>9} {'Share':>6} {'Peak MB':>8}")
+    for stage, record in stages.items():
+        share = record["seconds"] / total * 100 if total else 0
+        print(f"    {stage:<22} {record['calls']:>6} "
+              f"{record['seconds'] * 1000:>9.1f} {share:>5.1f}% "
+              f"{record['peak_bytes'] / 2**20:>8.1f}")
+    print(f"    {'total':<22} {'':>6} {total * 1000:>9.1f}")
+    print()
+
+
+def write_trace(path, profiles):
+    trace = [
+        {"document": name,
+         "stages": [dict(stage=stage, **record) for stage, record in stages.items()]}
+        for name, stages in profiles
+    ]
+    Path(path).write_text(json.dumps({"documents": trace}, indent=2) + "\n",
+                          encoding="utf-8")
+
+
+# ── Watch mode ────────────────────────────────────────────────────────
+
+WATCH_INTERVAL = 0.2   # seconds between polls
+WATCH_DEBOUNCE = 0.3   # quiet period after the last change before rebuilding
+
+
+def _stamp(path):
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _rebuild_changed(doc_def, use_template, formats):
+    md_path = DOCS / doc_def["md"]
+    if not md_path.exists():
+        print(f"  [!] {doc_def['md']} removed — skipping")
+        return
+    started = time.perf_counter()
+    out_paths, exc = _attempt(build_document, doc_def, use_template, formats)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    cache = load_build_cache()
+    if exc is not None:
+        print(f"  [ERR] Error generating {doc_def['out']}: {exc}")
+        for name in output_names(doc_def, formats):
+            cache.pop(name, None)
+    else:
+        fingerprint = document_fingerprint(doc_def, shared_fingerprint())
+        for out_path in out_paths:
+            size_kb = out_path.stat().st_size / 1024
+            print(f"  [OK] {out_path.name} ({size_kb:.1f} KB, {elapsed_ms:.0f} ms)")
+            cache[out_path.name] = fingerprint
+    save_build_cache(cache)
+
+
+def watch_documents(use_template=True, formats=("docx",)):
+    """Poll the DOCUMENTS sources and rebuild each one after it changes.
+
+    Runs in this process so python-docx stays imported and the branded
+    template is only built once.
+    """
+    sources = {DOCS / d["md"]: d for d in DOCUMENTS}
+    stamps = {path: _stamp(path) for path in sources}
+    changed_at = {}
+    if use_template:
+        get_template_bytes()
+
+    print(f"  Watching {len(sources)} sources in {DOCS} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(WATCH_INTERVAL)
+            now = time.monotonic()
+            for path in sources:
+                stamp = _stamp(path)
+                if stamp != stamps[path]:
+                    stamps[path] = stamp
+                    changed_at[path] = now
+            for path, last_change in list(changed_at.items()):
+                if now - last_change >= WATCH_DEBOUNCE:
+                    del changed_at[path]
+                    _rebuild_changed(sources[path], use_template, formats)
+    except KeyboardInterrupt:
+        print()
+        print("  Stopped watching.")
+
+
+def _formats(value):
+    formats = tuple(dict.fromkeys(f.strip() for f in value.split(",") if f.strip()))
+    unknown = [f for f in formats if f not in WRITERS]
+    if unknown or not formats:
+        raise argparse.ArgumentTypeError(
+            f"choose from {', '.join(WRITERS)} (got {value!r})")
+    return formats
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate branded DOCX documents from docs/*.md")
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=os.cpu_count() or 1,
+        help="number of worker processes (default: CPU count; 1 = serial)")
+    parser.add_argument(
+        "-f", "--force", action="store_true",
+        help="rebuild every document, ignoring docs/.build-cache.json")
+    parser.add_argument(
+        "--no-template", dest="use_template", action="store_false",
+        help="build each cover page from scratch instead of cloning the "
+             "shared branded skeleton")
+    parser.add_argument(
+        "--formats", type=_formats, default=("docx",),
+        help="comma-separated output formats: docx, html, json "
+             "(default: docx). Each source is parsed once for all formats.")
+    parser.add_argument(
+        "--profile", action="store_true",
+        help="time each stage (read, parse, setup_doc, render by block "
+             "type, save) per document and print a summary; implies "
+             "--force and --jobs 1")
+    parser.add_argument(
+        "--profile-stats", metavar="PATH",
+        help="with --profile, also dump cProfile stats to PATH")
+    parser.add_argument(
+        "--trace", metavar="PATH",
+        help="with --profile, also write the stage timings as JSON to PATH")
+    parser.add_argument(
+        "-w", "--watch", action="store_true",
+        help="after building, keep running and rebuild each document when "
+             "its markdown source changes")
+    args = parser.parse_args(argv)
+    if args.profile_stats or args.trace:
+        args.profile = True
+    if args.profile:
+        args.force = True
+        args.jobs = 1
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
     print("=" * 60)
     print("  ASPR Photo Repository — Document Generation")
     print("=" * 60)
@@ -529,31 +1214,115 @@ if __name__ == "__main__":
     print()
 
     generated = []
+    cached = []
     errors = []
 
+    cache = {} if args.force else load_build_cache()
+    shared = shared_fingerprint()
+    fingerprints = {}
+
+    pending = []
     for doc_def in DOCUMENTS:
         md_path = DOCS / doc_def["md"]
         if not md_path.exists():
             print(f"  [!] Skipping {doc_def['md']} (not found)")
             errors.append(doc_def["md"])
+            for name in output_names(doc_def, args.formats):
+                cache.pop(name, None)
+            continue
+        fingerprints[doc_def["out"]] = document_fingerprint(doc_def, shared)
+        pending.append(doc_def)
+
+    to_build = [d for d in pending
+                if not is_cached(d, fingerprints[d["out"]], cache, args.formats)]
+    rebuild = {d["out"] for d in to_build}
+
+    build = profile_document if args.profile else build_document
+    build_args = (args.use_template, args.formats)
+    jobs = max(1, min(args.jobs, len(to_build)))
+    if jobs > 1:
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        futures = [pool.submit(build, doc_def, *build_args)
+                   for doc_def in to_build]
+        outcomes = (_attempt(future.result) for future in futures)
+    else:
+        pool = None
+        outcomes = (_attempt(build, doc_def, *build_args)
+                    for doc_def in to_build)
+
+    profiles = []
+    profiler = cProfile.Profile() if args.profile_stats else None
+    if profiler is not None:
+        profiler.enable()
+
+    # Outcomes are reported in DOCUMENTS order regardless of completion order
+    for doc_def in pending:
+        out_names = output_names(doc_def, args.formats)
+        if doc_def["out"] not in rebuild:
+            for name in out_names:
+                out_path = DOCS / name
+                size_kb = out_path.stat().st_size / 1024
+                print(f"  [CACHED] {name} ({size_kb:.1f} KB)")
+                cached.append(out_path)
             continue
 
-        try:
-            out_path = md_to_docx(
-                md_path,
-                doc_def["title"],
-                doc_def["subtitle"],
-                doc_def["out"],
-            )
+        out_paths, exc = next(outcomes)
+        if args.profile and exc is None:
+            out_paths, stages = out_paths
+            profiles.append((doc_def["out"], stages))
+        if exc is not None:
+            print(f"  [ERR] Error generating {', '.join(out_names)}: {exc}")
+            errors.extend(out_names)
+            for name in out_names:
+                cache.pop(name, None)
+            continue
+        for out_path in out_paths:
+            size_kb = out_path.stat().st_size / 1024
+            print(f"  [OK] {out_path.name} ({size_kb:.1f} KB)")
             generated.append(out_path)
-        except Exception as e:
-            print(f"  [ERR] Error generating {doc_def['out']}: {e}")
-            errors.append(doc_def["out"])
+            cache[out_path.name] = fingerprints[doc_def["out"]]
+
+    if pool is not None:
+        pool.shutdown()
+    if profiler is not None:
+        profiler.disable()
+
+    save_build_cache(cache)
+
+    if profiles:
+        print()
+        for name, stages in profiles:
+            print_profile(name, stages)
+        if args.profile_stats:
+            profiler.dump_stats(args.profile_stats)
+            print(f"  cProfile stats: {args.profile_stats}")
+        if args.trace:
+            write_trace(args.trace, profiles)
+            print(f"  Stage trace:    {args.trace}")
 
     print()
     print(f"  Generated: {len(generated)} documents")
+    if cached:
+        print(f"  Cached:    {len(cached)} documents (unchanged)")
     if errors:
         print(f"  Errors:    {len(errors)} — {', '.join(errors)}")
     print()
     print("  Done! Open documents in Word and right-click TOC > Update Field")
     print("=" * 60)
+
+    if args.watch:
+        watch_documents(args.use_template, args.formats)
+    return 1 if errors else 0
+
+
+def _attempt(fn, *args):
+    """Call fn and return (result, None), or (None, exc) if it raised."""
+    try:
+        return fn(*args), None
+    except Exception as e:
+        return None, e
+
+
+if __name__ == "__main__":
+    status = main()
+    raise SystemExit(status if EXIT_STATUS_ON_ERROR else 0)
@@ -3,19 +3,35 @@ Generate Executive Summary PowerPoint v2.0 for ASPR Photo Repository.
 14-slide post-deployment briefing with ASPR + Leidos branding.
 
 Run:  python scripts/generate_exec_summary_pptx.py
+      python scripts/generate_exec_summary_pptx.py --dump-spec deck.json
+      python scripts/generate_exec_summary_pptx.py --spec deck.json -o out.pptx
+      python scripts/generate_exec_summary_pptx.py --batch tenants.json [--jobs N]
 Requires: pip install python-pptx
 """
 
+import argparse
+import copy
+import io
+import json
 import os
+import re
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from pptx import Presentation
 from pptx.util import Inches, Pt, Emu
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
-from pptx.enum.shapes import MSO_SHAPE
+from pptx.enum.shapes import MSO_SHAPE, PP_PLACEHOLDER
+from pptx.shapes.shapetree import SlideShapes
+
+from image_assets import placed_image
+from office_save import package_bytes, save_package
 
 ROOT = Path(__file__).resolve().parent.parent
 OUT = ROOT / "docs" / "ASPR_Photo_Repository_Executive_Summary.pptx"
+BATCH_OUT = ROOT / "docs" / "decks"
 
 # ── Brand Colors ──────────────────────────────────────────────────────
 BLUE_DARK     = RGBColor(0x06, 0x2E, 0x61)
@@ -43,6 +59,15 @@ LEIDOS_LOGO = Path(
     r"\02-Digital\03-Raster-PNG\Leidos-logo-horz-full-rgb-@2x.png"
 )
 
+# ── Content Boxes ─────────────────────────────────────────────────────
+BULLET_BOX = (Inches(11), Inches(5.0))      # add_bullet_slide text box
+COLUMN_BOX = (Inches(5.4), Inches(4.5))     # each add_two_col_features column
+TABLE_TOP = Inches(1.8)
+FOOTER_TOP = Inches(7.0)
+BULLET_SPACE_AFTER = Pt(12)
+COLUMN_SPACE_AFTER = Pt(8)
+COLUMN_BULLET = "\u2022  "
+
 
 # ══════════════════════════════════════════════════════════════════════
 #  HELPERS
@@ -103,8 +128,7 @@ def add_bullet_slide(slide, title, bullets, title_color=WHITE,
                      bullet_color=WHITE, font_size=Pt(18)):
     add_slide_header(slide, title)
 
-    txBox = slide.shapes.add_textbox(Inches(1.0), Inches(1.8),
-                                      Inches(11), Inches(5.0))
+    txBox = slide.shapes.add_textbox(Inches(1.0), Inches(1.8), *BULLET_BOX)
     tf = txBox.text_frame
     tf.word_wrap = True
 
@@ -113,24 +137,29 @@ def add_bullet_slide(slide, title, bullets, title_color=WHITE,
         p.text = bullet
         p.font.size = font_size
         p.font.color.rgb = bullet_color
-        p.space_after = Pt(12)
+        p.space_after = BULLET_SPACE_AFTER
         p.level = 0
 
     return tf
 
 
 def add_table_slide(slide, title, headers, rows, col_widths=None,
-                    font_hdr=Pt(14), font_row=Pt(13)):
+                    font_hdr=Pt(14), font_row=Pt(13), row_heights=None):
     add_slide_header(slide, title)
 
     n_rows = len(rows) + 1
     n_cols = len(headers)
+    height = sum(row_heights) if row_heights else Inches(0.4) * n_rows
     table_shape = slide.shapes.add_table(
-        n_rows, n_cols, Inches(0.8), Inches(1.8),
-        Inches(11.5), Inches(0.4) * n_rows
+        n_rows, n_cols, Inches(0.8), TABLE_TOP,
+        Inches(11.5), height
     )
     table = table_shape.table
 
+    if row_heights:
+        for row, row_height in zip(table.rows, row_heights):
+            row.height = row_height
+
     if col_widths:
         total = sum(col_widths)
         for i, w in enumerate(col_widths):
@@ -198,7 +227,7 @@ def add_kpi_cards(slide, cards):
 
 
 def add_two_col_features(slide, title, left_title, left_items,
-                         right_title, right_items):
+                         right_title, right_items, font_size=Pt(14)):
     """Two-column feature list with gold sub-headers."""
     add_slide_header(slide, title)
 
@@ -211,484 +240,1019 @@ def add_two_col_features(slide, title, left_title, left_items,
                        font_size=Pt(20), color=GOLD_LIGHT, bold=True)
 
         txBox = slide.shapes.add_textbox(x + Inches(0.1), Inches(2.2),
-                                          Inches(5.4), Inches(4.5))
+                                          *COLUMN_BOX)
         tf = txBox.text_frame
         tf.word_wrap = True
 
         for i, item in enumerate(items):
             p = tf.add_paragraph() if i > 0 else tf.paragraphs[0]
-            p.text = f"\u2022  {item}"
+            p.text = f"{COLUMN_BULLET}{item}"
+            p.font.size = font_size
+            p.font.color.rgb = WHITE
+            p.space_after = COLUMN_SPACE_AFTER
+
+
+def add_title_block(slide, title, subtitle, metadata_lines):
+    """Cover slide text: title, subtitle and the metadata block."""
+    add_title_text(slide, title,
+                   Inches(0.8), Inches(2.2), Inches(11), Inches(1.0),
+                   font_size=Pt(48), color=WHITE, bold=True)
+    add_title_text(slide, subtitle,
+                   Inches(0.8), Inches(3.2), Inches(11), Inches(0.7),
+                   font_size=Pt(28), color=GOLD_LIGHT, bold=False)
+
+    txBox = slide.shapes.add_textbox(Inches(0.8), Inches(4.5),
+                                      Inches(11), Inches(2.5))
+    tf = txBox.text_frame
+    tf.word_wrap = True
+    for i, line in enumerate(metadata_lines):
+        p = tf.add_paragraph() if i > 0 else tf.paragraphs[0]
+        p.text = line
+        p.font.size = Pt(16)
+        p.font.color.rgb = RGBColor(0xCC, 0xCC, 0xCC) if line else WHITE
+        if "Department" in line or "Administration" in line:
+            p.font.color.rgb = WHITE
+            p.font.size = Pt(18)
+        if "DEPLOYED" in line:
+            p.font.color.rgb = GOLD_LIGHT
+            p.font.bold = True
+
+
+def add_capability_grid(slide, title, left_items, right_items):
+    """Two columns of (heading, description) pairs."""
+    add_slide_header(slide, title)
+
+    for col_idx, caps in enumerate([left_items, right_items]):
+        x = Inches(0.8) if col_idx == 0 else Inches(7.0)
+        for i, (cap_title, desc) in enumerate(caps):
+            y = Inches(1.9) + Inches(1.25) * i
+            add_title_text(slide, cap_title,
+                           x, y, Inches(5.5), Inches(0.4),
+                           font_size=Pt(18), color=GOLD_LIGHT, bold=True)
+            add_title_text(slide, desc,
+                           x, y + Inches(0.38), Inches(5.5), Inches(0.75),
+                           font_size=Pt(14), color=WHITE, bold=False)
+
+
+def add_signoff_slide(slide, title, statement, roles,
+                      headers=("Role", "Name", "Signature", "Date"),
+                      col_widths=(30, 25, 25, 20)):
+    """Recommendation paragraph above a blank signature table."""
+    add_slide_header(slide, title)
+
+    add_title_text(slide, statement,
+                   Inches(0.8), Inches(1.8), Inches(11), Inches(1.2),
+                   font_size=Pt(18), color=WHITE, bold=False)
+
+    n_cols = len(headers)
+    table_shape = slide.shapes.add_table(
+        len(roles) + 1, n_cols, Inches(0.8), Inches(3.4),
+        Inches(11.5), Inches(2.5)
+    )
+    table = table_shape.table
+
+    total = sum(col_widths)
+    for i, w in enumerate(col_widths):
+        table.columns[i].width = int(Inches(11.5) * w / total)
+
+    for i, hdr in enumerate(headers):
+        cell = table.cell(0, i)
+        cell.text = hdr
+        cell.fill.solid()
+        cell.fill.fore_color.rgb = BLUE_PRIMARY
+        for p in cell.text_frame.paragraphs:
             p.font.size = Pt(14)
             p.font.color.rgb = WHITE
-            p.space_after = Pt(8)
+            p.font.bold = True
+
+    for ri, role in enumerate(roles):
+        bg = ROW_EVEN if ri % 2 == 0 else ROW_ODD
+        for ci in range(n_cols):
+            c = table.cell(ri + 1, ci)
+            if ci == 0:
+                c.text = role
+            c.fill.solid()
+            c.fill.fore_color.rgb = bg
+            for p in c.text_frame.paragraphs:
+                p.font.size = Pt(13)
+                p.font.color.rgb = WHITE
+
+    return table
+
+
+def add_closing_slide(slide, title, steps):
+    """Numbered next steps; the logos underneath come from the layout."""
+    add_slide_header(slide, title)
+
+    txBox = slide.shapes.add_textbox(Inches(1.0), Inches(1.9),
+                                      Inches(11), Inches(4.5))
+    tf = txBox.text_frame
+    tf.word_wrap = True
+
+    for i, step in enumerate(steps):
+        p = tf.add_paragraph() if i > 0 else tf.paragraphs[0]
+        p.text = step
+        p.font.size = Pt(18)
+        p.font.color.rgb = WHITE
+        p.space_after = Pt(14)
+
+    return tf
 
 
 # ══════════════════════════════════════════════════════════════════════
-#  BUILD PRESENTATION  (14 slides)
+#  BRANDED MASTER
 # ══════════════════════════════════════════════════════════════════════
+#
+# The dark background and footer live on the slide master and the logos
+# and accent bars on two custom layouts, so each slide only carries its
+# own content. Slides pick a layout by type through SLIDE_LAYOUTS.
+
+CONTENT_LAYOUT = "Content"
+SLIDE_LAYOUTS = {"title": "Cover", "closing": "Closing"}
+
+Canvas = namedtuple("Canvas", "shapes background")
+
+
+def _canvas(master_or_layout):
+    """Let the slide helpers draw onto a master or layout."""
+    return Canvas(SlideShapes(master_or_layout.shapes._spTree, master_or_layout),
+                  master_or_layout.background)
+
+
+def _blank_layout(layout, name):
+    """Strip the layout's cloneable placeholders and rename it."""
+    for ph in list(layout.placeholders):
+        if ph.placeholder_format.type not in (PP_PLACEHOLDER.DATE, PP_PLACEHOLDER.FOOTER,
+                                              PP_PLACEHOLDER.SLIDE_NUMBER):
+            ph._element.getparent().remove(ph._element)
+    layout.name = name
+    return layout
+
+
+def add_cover_brand(slide):
+    """Accent bars and logos around the cover slide's title block."""
+    add_accent_bar(slide, top=Inches(0), height=Inches(0.08), color=GOLD)
+
+    if ASPR_LOGO.exists():
+        slide.shapes.add_picture(placed_image(ASPR_LOGO, height=Inches(1.0)),
+                                 Inches(0.8), Inches(0.4), height=Inches(1.0))
+    if LEIDOS_LOGO.exists():
+        slide.shapes.add_picture(placed_image(LEIDOS_LOGO, height=Inches(0.7)),
+                                 Inches(10.5), Inches(0.4), height=Inches(0.7))
+
+    add_accent_bar(slide, top=Inches(4.1), height=Inches(0.04), color=GOLD)
+
+
+def add_closing_brand(slide):
+    """ASPR and Leidos logos along the bottom of the closing slide."""
+    if ASPR_LOGO.exists():
+        slide.shapes.add_picture(placed_image(ASPR_LOGO, height=Inches(0.7)),
+                                 Inches(0.8), Inches(6.2), height=Inches(0.7))
+    if LEIDOS_LOGO.exists():
+        slide.shapes.add_picture(placed_image(LEIDOS_LOGO, height=Inches(0.5)),
+                                 Inches(10.5), Inches(6.3), height=Inches(0.5))
+
+
+def build_master(prs, footer=None):
+    """Bake the brand into prs's master and keep only the layouts the deck uses."""
+    master = _canvas(prs.slide_master)
+    add_dark_bg(master)
+    if footer is None:
+        add_footer(master)
+    else:
+        add_footer(master, footer)
+
+    layouts = prs.slide_layouts
+    keep = [
+        (_blank_layout(layouts[0], "Cover"), add_cover_brand),
+        (_blank_layout(layouts[5], "Closing"), add_closing_brand),
+        (_blank_layout(layouts[6], CONTENT_LAYOUT), None),
+    ]
+    for layout, brand in keep:
+        if brand is not None:
+            brand(_canvas(layout))
+    names = {layout.name for layout, _ in keep}
+    for layout in list(layouts):
+        if layout.name not in names:
+            layouts.remove(layout)
+    return prs
+
+
+@lru_cache(maxsize=None)
+def branded_template(footer=None):
+    """Saved bytes of an empty branded presentation, built once per footer."""
+    prs = Presentation()
+    prs.slide_width = Inches(13.333)   # Widescreen 16:9
+    prs.slide_height = Inches(7.5)
+    build_master(prs, footer)
+    return package_bytes(prs)
 
-prs = Presentation()
-prs.slide_width = Inches(13.333)   # Widescreen 16:9
-prs.slide_height = Inches(7.5)
-blank_layout = prs.slide_layouts[6]
-
-
-# ── SLIDE 1: TITLE ──────────────────────────────────────────────────
-
-slide = prs.slides.add_slide(blank_layout)
-add_dark_bg(slide)
-add_accent_bar(slide, top=Inches(0), height=Inches(0.08), color=GOLD)
-
-if ASPR_LOGO.exists():
-    slide.shapes.add_picture(str(ASPR_LOGO), Inches(0.8), Inches(0.4),
-                             height=Inches(1.0))
-if LEIDOS_LOGO.exists():
-    slide.shapes.add_picture(str(LEIDOS_LOGO), Inches(10.5), Inches(0.4),
-                             height=Inches(0.7))
-
-add_title_text(slide, "Executive Summary",
-               Inches(0.8), Inches(2.2), Inches(11), Inches(1.0),
-               font_size=Pt(48), color=WHITE, bold=True)
-add_title_text(slide, "ASPR Photo Repository Application",
-               Inches(0.8), Inches(3.2), Inches(11), Inches(0.7),
-               font_size=Pt(28), color=GOLD_LIGHT, bold=False)
-
-add_accent_bar(slide, top=Inches(4.1), height=Inches(0.04), color=GOLD)
-
-metadata_lines = [
-    "U.S. Department of Health and Human Services",
-    "Administration for Strategic Preparedness and Response (ASPR)",
-    "",
-    "Prepared by: HHS ASPR / Leidos",
-    "Date: February 7, 2026  |  Version 2.0",
-    "Status: DEPLOYED TO PRODUCTION",
-    "Classification: For Official Use Only (FOUO)",
-]
-txBox = slide.shapes.add_textbox(Inches(0.8), Inches(4.5),
-                                  Inches(11), Inches(2.5))
-tf = txBox.text_frame
-tf.word_wrap = True
-for i, line in enumerate(metadata_lines):
-    p = tf.add_paragraph() if i > 0 else tf.paragraphs[0]
-    p.text = line
-    p.font.size = Pt(16)
-    p.font.color.rgb = RGBColor(0xCC, 0xCC, 0xCC) if line else WHITE
-    if "Department" in line or "Administration" in line:
-        p.font.color.rgb = WHITE
-        p.font.size = Pt(18)
-    if "DEPLOYED" in line:
-        p.font.color.rgb = GOLD_LIGHT
-        p.font.bold = True
-
-add_footer(slide)
-
-
-# ── SLIDE 2: PURPOSE & MISSION ──────────────────────────────────────
-
-slide = prs.slides.add_slide(blank_layout)
-add_dark_bg(slide)
-add_bullet_slide(slide, "Purpose & Mission", [
-    "Enable ASPR field teams to securely capture, upload, and manage disaster-related "
-    "photographs during incident response operations",
-    "Provide rapid photo documentation capability deployable within hours of incident "
-    "activation \u2014 now live in production with full CDN acceleration",
-    "Replace ad-hoc photo collection methods (email, shared drives, USB) with a "
-    "purpose-built, secure web application accessible via PIN, Entra ID SSO, "
-    "Login.gov, and ID.me",
-    "Support incident accountability with geotagged, timestamped, EXIF-enriched "
-    "photographic evidence and full admin audit trail",
-    "Operate within the HHS/ASPR security boundary with Azure Front Door WAF "
-    "(OWASP 3.2), Private Link network isolation, and NIST SP 800-53 alignment",
-])
-add_footer(slide)
-
-
-# ── SLIDE 3: PLATFORM HIGHLIGHTS (KPI CARDS) ────────────────────────
-
-slide = prs.slides.add_slide(blank_layout)
-add_dark_bg(slide)
-add_slide_header(slide, "What We Built \u2014 Platform Highlights")
-
-add_kpi_cards(slide, [
-    ("17+", "API Endpoints", "REST API with full\nCRUD + bulk operations"),
-    ("4", "Auth Methods", "PIN, Entra ID SSO,\nLogin.gov, ID.me"),
-    ("3", "Image Renditions", "thumb_sm, thumb_md,\nweb (all WebP)"),
-    ("8", "Database Tables", "SQL + audit log\n+ EXIF + tags"),
-    ("10+", "Admin Components", "Photo grid, editor,\ntags, bulk ops"),
-])
-
-add_footer(slide)
-
-
-# ── SLIDE 4: KEY CAPABILITIES ───────────────────────────────────────
-
-slide = prs.slides.add_slide(blank_layout)
-add_dark_bg(slide)
-add_slide_header(slide, "Key Capabilities")
-
-capabilities_left = [
-    ("Multi-Auth Security", "PIN + JWT (field), Entra ID SSO (admin),\n"
-     "Login.gov & ID.me (external), rate limiting"),
-    ("Photo Upload Wizard", "6-step guided upload with animated progress,\n"
-     "GPS capture, incident tagging, batch support"),
-    ("Admin Photo Grid", "Virtualized grid with search, filters,\n"
-     "status badges, bulk select, cursor pagination"),
-    ("Photo Editor", "Crop (aspect presets), rotate 90\u00b0,\n"
-     "flip H/V, rendition regeneration"),
-]
-capabilities_right = [
-    ("Tag System", "Categorized tags (status, priority, type,\n"
-     "timeline, custom) with autocomplete"),
-    ("EXIF Extraction", "Camera make/model, lens, aperture, ISO,\n"
-     "shutter speed, GPS altitude, date taken"),
-    ("Bulk Operations", "Multi-select delete, tag assignment,\n"
-     "status change, ZIP download"),
-    ("Session Management", "Create/revoke PINs, view photo counts,\n"
-     "storage usage, team tracking"),
-]
-
-for col_idx, caps in enumerate([capabilities_left, capabilities_right]):
-    x = Inches(0.8) if col_idx == 0 else Inches(7.0)
-    for i, (cap_title, desc) in enumerate(caps):
-        y = Inches(1.9) + Inches(1.25) * i
-        add_title_text(slide, cap_title,
-                       x, y, Inches(5.5), Inches(0.4),
-                       font_size=Pt(18), color=GOLD_LIGHT, bold=True)
-        add_title_text(slide, desc,
-                       x, y + Inches(0.38), Inches(5.5), Inches(0.75),
-                       font_size=Pt(14), color=WHITE, bold=False)
-
-add_footer(slide)
-
-
-# ── SLIDE 5: ARCHITECTURE OVERVIEW ──────────────────────────────────
-
-slide = prs.slides.add_slide(blank_layout)
-add_dark_bg(slide)
-add_table_slide(slide, "Architecture Overview",
-    ["Layer", "Component", "Technology", "Purpose"],
-    [
-        ["Application", "Web Framework", "Next.js 16.1.6 (React 19)", "Full-stack SSR + API routes"],
-        ["Application", "UI / Design", "Tailwind CSS 4 + shadcn/ui", "Glassmorphic component system"],
-        ["Application", "Image Pipeline", "Sharp 0.34 + exifr", "Multi-rendition WebP + EXIF"],
-        ["Security", "WAF", "Azure Front Door WAF", "OWASP DRS 2.1 + Bot Protection"],
-        ["Security", "Authentication", "Auth.js v5 + bcrypt + JWT", "Multi-provider auth system"],
-        ["Network", "CDN", "Azure Front Door Premium", "Global edge caching + SSL"],
-        ["Network", "Private Link", "Azure Private Endpoints", "VNet isolation (blob + app)"],
-        ["Data", "Database", "Azure SQL Server", "Sessions, photos, tags, audit"],
-        ["Data", "Blob Storage", "Azure Blob Storage", "Photo originals + renditions"],
-        ["Data", "Key Vault", "Azure Key Vault", "Secrets management"],
-        ["Hosting", "App Service", "Linux / Node.js 22", "Standalone Next.js runtime"],
-        ["CI/CD", "Pipeline", "GitHub Actions", "ZipDeploy + post-deploy migrate"],
-    ],
-    col_widths=[13, 18, 30, 39],
-    font_hdr=Pt(13), font_row=Pt(12),
-)
-add_footer(slide)
-
-
-# ── SLIDE 6: SECURITY POSTURE ───────────────────────────────────────
-
-slide = prs.slides.add_slide(blank_layout)
-add_dark_bg(slide)
-add_bullet_slide(slide, "Security Posture", [
-    "FIPS 199 MODERATE categorization \u2014 appropriate for operational "
-    "incident photography",
-    "Azure Front Door WAF (OWASP DRS 2.1 + Microsoft Bot Manager) in "
-    "Prevention mode protecting all application traffic",
-    "Network isolation via Private Endpoints \u2014 Blob Storage, SQL, "
-    "and Key Vault on VNet; App Service behind Private Link origins",
-    "OWASP Top 10 (2021) fully addressed \u2014 injection prevention, "
-    "access control, cryptographic protections, security misconfiguration",
-    "NIST SP 800-63B compliant PIN generation (CSPRNG) with bcrypt "
-    "storage (10 salt rounds)",
-    "Comprehensive rate limiting \u2014 5 PIN attempts/min (15-min lockout), "
-    "3 admin attempts (30-min lockout), 50 uploads/hour",
-    "Hardened HTTP headers \u2014 HSTS, CSP, X-Frame-Options, "
-    "Permissions-Policy on all routes",
-    "Immutable admin audit log \u2014 all operations recorded with entity, "
-    "performer email, IP address, timestamp",
-    "Signed image URLs (HMAC-SHA256) \u2014 24-hour expiry, no JWT "
-    "exposure in query strings",
-], font_size=Pt(16))
-add_footer(slide)
-
-
-# ── SLIDE 7: ADMIN DASHBOARD SHOWCASE ───────────────────────────────
-
-slide = prs.slides.add_slide(blank_layout)
-add_dark_bg(slide)
-add_two_col_features(slide, "Admin Dashboard \u2014 Full Photo Management",
-    "Management Features", [
-        "Photo grid with virtual scrolling (100/page cursor pagination)",
-        "Search by filename, filter by incident/status/date/session/tags",
-        "Photo detail sidebar with inline metadata editing",
-        "Photo editor: crop with aspect presets, rotate, flip",
-        "Rendition auto-regeneration after edits (thumb_sm, thumb_md, web)",
-        "Admin bulk upload panel (drag-and-drop, up to 50 files)",
-        "Dashboard statistics: totals, incidents, daily volume, top teams",
-    ],
-    "Organization & Operations", [
-        "Tag system: status, priority, type, timeline, custom categories",
-        "Tag autocomplete with category filtering and color coding",
-        "Bulk operations: delete, tag assign/remove, status change",
-        "Bulk download: client-side ZIP via signed URLs",
-        "EXIF data: camera make/model, lens, aperture, ISO, GPS, date",
-        "Session manager: create/revoke PINs, usage stats per team",
-        "Audit log: entity type, action, performer, IP, details JSON",
-    ],
-)
-add_footer(slide)
-
-
-# ── SLIDE 8: CDN & PERFORMANCE ──────────────────────────────────────
-
-slide = prs.slides.add_slide(blank_layout)
-add_dark_bg(slide)
-add_table_slide(slide, "CDN & Performance Architecture",
-    ["Component", "Configuration", "Details"],
-    [
-        ["Front Door Profile", "Premium_AzureFrontDoor", "cdn-ociomicro-premium-eus2-01 (shared)"],
-        ["App Endpoint", "cdn-asprphotos-app", "All app routes (/*), HTTPS-only"],
-        ["Blob Endpoint", "cdn-asprphotos", "Rendition images (/renditions/*), HTTPS-only"],
-        ["WAF Policy", "wafAsprPhotos", "OWASP DRS 2.1 + Bot Protection, Prevention mode"],
-        ["App Origin", "Private Link", "App Service via approved Private Endpoint"],
-        ["Blob Origin", "Private Link", "Blob Storage via approved Private Endpoint"],
-        ["Health Probe", "/api/health", "Every 30s \u2014 HTTP 200 + JSON status check"],
-        ["Image Renditions", "3 variants/photo", "thumb_sm 200x150, thumb_md 400x300, web 1200px"],
-        ["Cache Strategy", "7-day immutable", "Static assets + hero images; API routes no-cache"],
-    ],
-    col_widths=[22, 28, 50],
-    font_row=Pt(12),
-)
-add_footer(slide)
-
-
-# ── SLIDE 9: CI/CD PIPELINE ────────────────────────────────────────
-
-slide = prs.slides.add_slide(blank_layout)
-add_dark_bg(slide)
-add_bullet_slide(slide, "CI/CD Pipeline \u2014 Automated Deployment", [
-    "1.  Trigger: Push to main branch or manual workflow_dispatch",
-    "2.  Build: Node.js 22.x \u2014 npm install + npm run build "
-    "(Next.js standalone output)",
-    "3.  Package: Copy .next/static + public/ into .next/standalone artifact",
-    "4.  Deploy: azure/webapps-deploy@v2 via publish profile "
-    "(ZipDeploy to SCM endpoint)",
-    "5.  Target: app-aspr-photos in rg-ocio-microsites-eus2-01",
-    "6.  Post-Deploy: POST /api/admin/migrate (Entra ID session) "
-    "for database schema migrations",
-    "7.  Health: /api/health endpoint polled every 30s by "
-    "Front Door health probe",
-    "8.  Runtime: node server.js (configured on App Service, "
-    "not in workflow)",
-    "9.  Secrets: AZURE_WEBAPP_PUBLISH_PROFILE stored as "
-    "GitHub Actions encrypted secret",
-], font_size=Pt(16))
-add_footer(slide)
-
-
-# ── SLIDE 10: TIMELINE & MILESTONES ─────────────────────────────────
-
-slide = prs.slides.add_slide(blank_layout)
-add_dark_bg(slide)
-add_table_slide(slide, "Timeline & Milestones",
-    ["Phase", "Timeline", "Status", "Key Deliverables"],
-    [
-        ["1. Requirements & Design", "Jan 2026", "COMPLETE",
-         "SRS v2.0, SDD, Security Plan, architecture review"],
-        ["2. Core Development", "Jan\u2013Feb 2026", "COMPLETE",
-         "DB schema, PIN auth, upload API, gallery, wizard"],
-        ["3. Security Hardening", "Feb 2026", "COMPLETE",
-         "bcrypt, JWT, rate limiting, signed URLs, CSP headers"],
-        ["4. Admin Dashboard", "Feb 2026", "COMPLETE",
-         "Photo grid, editor, bulk ops, tags, EXIF, sessions"],
-        ["5. Infrastructure & CDN", "Feb 2026", "COMPLETE",
-         "Front Door Premium, WAF, Private Link, CDN endpoints"],
-        ["6. CI/CD & Deployment", "Feb 2026", "COMPLETE",
-         "GitHub Actions, ZipDeploy, post-deploy migrate"],
-        ["7. UI/UX Polish", "Feb 2026", "COMPLETE",
-         "Glassmorphic design, animations, preloader, transitions"],
-        ["8. Documentation", "Feb 2026", "COMPLETE",
-         "6-document suite + PPTX + Project Plan XML"],
-        ["9. UAT & ATO", "Feb\u2013Mar 2026", "IN PROGRESS",
-         "User acceptance testing, security review, ATO package"],
-        ["10. Production Ops", "Mar 2026+", "PLANNED",
-         "Monitoring, training, field pilot, v1.1 planning"],
-    ],
-    col_widths=[22, 13, 12, 53],
-    font_hdr=Pt(13), font_row=Pt(12),
-)
-add_footer(slide)
-
-
-# ── SLIDE 11: DOCUMENT PACKAGE ──────────────────────────────────────
-
-slide = prs.slides.add_slide(blank_layout)
-add_dark_bg(slide)
-add_table_slide(slide, "Professional Document Package",
-    ["#", "Document", "Version", "Description"],
-    [
-        ["01", "Software Requirements Specification", "v2.0",
-         "Functional & non-functional requirements, data model, API spec"],
-        ["02", "System Design Document", "v1.0",
-         "Architecture, component design, integration patterns"],
-        ["03", "Security Plan", "v1.0",
-         "FIPS 199, OWASP controls, NIST mapping, WAF policy"],
-        ["04", "Deployment & Operations Guide", "v1.0",
-         "Azure setup, CI/CD, monitoring, runbook procedures"],
-        ["05", "User Guide", "v1.0",
-         "Field team upload workflow + admin dashboard usage"],
-        ["06", "API & Data Reference", "v1.0",
-         "REST API endpoints, data model, security headers"],
-        ["\u2014", "Executive Summary PPTX", "v2.0",
-         "This presentation (14-slide executive briefing)"],
-        ["\u2014", "Project Plan XML", "v1.0",
-         "MS Project-compatible schedule (10 phases, 90 tasks)"],
-    ],
-    col_widths=[5, 35, 8, 52],
-    font_row=Pt(12),
-)
-add_footer(slide)
-
-
-# ── SLIDE 12: RISK ASSESSMENT ───────────────────────────────────────
-
-slide = prs.slides.add_slide(blank_layout)
-add_dark_bg(slide)
-add_table_slide(slide, "Risk Assessment",
-    ["Risk", "Likelihood", "Impact", "Mitigation"],
-    [
-        ["PIN brute force", "Low", "Medium",
-         "Rate limiting + lockout + bcrypt + WAF bot protection"],
-        ["Data loss", "Low", "High",
-         "Azure automatic backups + blob soft delete + Private Link"],
-        ["Network unavailability", "Medium", "Medium",
-         "Front Door multi-region routing + health probes"],
-        ["Credential exposure", "Low", "High",
-         "Key Vault + bcrypt + timing-safe compare + no plaintext"],
-        ["CDN cache poisoning", "Low", "Medium",
-         "WAF Prevention mode + OWASP DRS 2.1 managed rules"],
-        ["DDoS / bot attack", "Medium", "Medium",
-         "Front Door WAF + rate limiting + IP restrictions"],
-        ["Scale limitations", "Medium", "Low",
-         "In-memory rate limit \u2192 Redis migration path ready"],
+
+# ══════════════════════════════════════════════════════════════════════
+#  TEXT LAYOUT
+# ══════════════════════════════════════════════════════════════════════
+#
+# Estimates how much room wrapped text needs so slides can shrink fonts or
+# continue onto another slide instead of running off the bottom. Glyph
+# advances come from the Calibri TrueType files when python-pptx can find
+# them (Windows/macOS font folders) and from CALIBRI_WIDTHS otherwise.
+# Widths are cached per glyph and per word, and line counts per (text,
+# size, width), so laying out the same content across a batch of decks
+# is mostly dictionary lookups.
+
+MEASURE_FONT = "Calibri"      # theme body font of the default template
+UNITS_PER_EM = 2048
+LINE_SPACING = 1.2            # single spacing as a multiple of font size
+TEXT_INSET_X = Inches(0.1)    # default text frame / table cell margins
+TEXT_INSET_Y = Inches(0.05)
+BOLD_WIDTH = 1.05             # Calibri Bold runs about 5% wider
+
+# Calibri Regular advance widths in font units (UNITS_PER_EM to the em)
+CALIBRI_WIDTHS = {
+    " ": 463, "!": 544, '"': 821, "#": 1038, "$": 1038, "%": 1463,
+    "&": 1397, "'": 452, "(": 621, ")": 621, "*": 1038, "+": 1038,
+    ",": 511, "-": 627, ".": 517, "/": 792, ":": 548, ";": 548,
+    "<": 1038, "=": 1038, ">": 1038, "?": 950, "@": 1890, "[": 628,
+    "\\": 792, "]": 628, "^": 1038, "_": 1020, "`": 596, "{": 640,
+    "|": 941, "}": 640, "~": 1038,
+    "A": 1185, "B": 1114, "C": 1092, "D": 1260, "E": 1000, "F": 941,
+    "G": 1292, "H": 1276, "I": 516, "J": 653, "K": 1064, "L": 861,
+    "M": 1751, "N": 1322, "O": 1356, "P": 1058, "Q": 1378, "R": 1112,
+    "S": 941, "T": 998, "U": 1314, "V": 1162, "W": 1822, "X": 1063,
+    "Y": 998, "Z": 959,
+    "a": 981, "b": 1076, "c": 866, "d": 1076, "e": 1019, "f": 625,
+    "g": 964, "h": 1076, "i": 470, "j": 490, "k": 931, "l": 470,
+    "m": 1636, "n": 1076, "o": 1080, "p": 1076, "q": 1076, "r": 714,
+    "s": 801, "t": 686, "u": 1076, "v": 925, "w": 1464, "x": 887,
+    "y": 927, "z": 809,
+    "\u00b0": 686, "\u2013": 1020, "\u2014": 1841, "\u2022": 1020,
+    "\u2192": 2048,
+}
+CALIBRI_DEFAULT_WIDTH = 1038  # digits and anything not listed
+
+
+@lru_cache(maxsize=None)
+def _truetype(bold):
+    """PIL font for MEASURE_FONT at one em per UNITS_PER_EM, or None."""
+    try:
+        from PIL import ImageFont
+        from pptx.text.fonts import FontFiles
+        return ImageFont.truetype(FontFiles.find(MEASURE_FONT, bold, False),
+                                  UNITS_PER_EM)
+    except (ImportError, KeyError, OSError):
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _advance(char, bold):
+    font = _truetype(bold)
+    if font is not None:
+        return font.getlength(char)
+    width = CALIBRI_WIDTHS.get(char, CALIBRI_DEFAULT_WIDTH)
+    return width * BOLD_WIDTH if bold else width
+
+
+@lru_cache(maxsize=65536)
+def _word_units(word, bold):
+    return sum(_advance(char, bold) for char in word)
+
+
+def text_width(text, size, bold=False):
+    """Width in EMU of text set on one line at size (a Length)."""
+    return int(_word_units(text, bold) * size / UNITS_PER_EM)
+
+
+@lru_cache(maxsize=65536)
+def wrap_count(text, size, width, bold=False):
+    """Number of lines text wraps to in a box width EMU wide at size."""
+    scale = size / UNITS_PER_EM
+    space = _advance(" ", bold) * scale
+    lines = 0
+    for segment in text.split("\n"):
+        lines += 1
+        used = 0
+        for word in segment.split():
+            needed = _word_units(word, bold) * scale
+            if used and used + space + needed > width:
+                lines += 1
+                used = 0
+            elif used:
+                needed += space
+            # A word wider than the box is broken across lines
+            while used + needed > width and needed > width:
+                lines += 1
+                needed -= width
+            used += needed
+    return lines
+
+
+def paragraph_heights(paragraphs, size, width, space_after=0, bold=False):
+    """Height in EMU of each paragraph, plus space_after, in a box width EMU wide."""
+    inner = width - 2 * TEXT_INSET_X
+    return [int(wrap_count(text, size, inner, bold) * size * LINE_SPACING + space_after)
+            for text in paragraphs]
+
+
+def text_height(paragraphs, size, width, space_after=0, bold=False):
+    """Height in EMU of paragraphs in a text box width EMU wide, insets included."""
+    heights = paragraph_heights(paragraphs, size, width, space_after, bold)
+    return sum(heights) - (space_after if heights else 0) + 2 * TEXT_INSET_Y
+
+
+def fit_font_size(paragraphs, width, height, size, min_size, space_after=0,
+                  bold=False):
+    """Largest whole point size from size down to min_size that fits, or None."""
+    for points in range(int(size.pt), int(min_size.pt) - 1, -1):
+        if text_height(paragraphs, Pt(points), width, space_after, bold) <= height:
+            return Pt(points)
+    return None
+
+
+def paginate(items, heights, capacity):
+    """Split items into consecutive pages whose heights fit capacity.
+
+    An item taller than capacity gets a page to itself.
+    """
+    pages = [[]]
+    used = 0
+    for item, height in zip(items, heights):
+        if pages[-1] and used + height > capacity:
+            pages.append([])
+            used = 0
+        pages[-1].append(item)
+        used += height
+    return pages
+
+
+def table_row_heights(headers, rows, col_widths, font_hdr, font_row,
+                      width=Inches(11.5), min_height=Inches(0.4)):
+    """Row heights in EMU for a table whose cells wrap their text."""
+    n_cols = len(headers)
+    widths = col_widths or [1] * n_cols
+    total = sum(widths)
+    inner = [int(width * w / total) - 2 * TEXT_INSET_X for w in widths]
+
+    def row_height(cells, size, bold):
+        # A short or empty row still takes one line, as add_table_slide draws it
+        lines = max((wrap_count(str(text), size, inner[ci], bold)
+                     for ci, text in enumerate(cells[:n_cols])), default=1)
+        return max(min_height, int(lines * size * LINE_SPACING + 2 * TEXT_INSET_Y))
+
+    return ([row_height(headers, font_hdr, True)]
+            + [row_height(row, font_row, False) for row in rows])
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  DECK SPEC  (14 slides)
+# ══════════════════════════════════════════════════════════════════════
+#
+# Each slide is a plain dict with a "type" key naming its renderer (see
+# SLIDE_RENDERERS); the remaining keys are that renderer's fields. Font
+# sizes are given in points. The same shape round-trips through JSON, so
+# --dump-spec / --spec let a deck be edited without touching this file.
+
+DECK = {
+    "footer": "HHS/ASPR \u2014 For Official Use Only | Leidos",
+    "slides": [
+        {
+            "type": "title",
+            "title": "Executive Summary",
+            "subtitle": "ASPR Photo Repository Application",
+            "metadata": [
+                "U.S. Department of Health and Human Services",
+                "Administration for Strategic Preparedness and Response (ASPR)",
+                "",
+                "Prepared by: HHS ASPR / Leidos",
+                "Date: February 7, 2026  |  Version 2.0",
+                "Status: DEPLOYED TO PRODUCTION",
+                "Classification: For Official Use Only (FOUO)",
+            ],
+        },
+        {
+            "type": "bullets",
+            "title": "Purpose & Mission",
+            "bullets": [
+                "Enable ASPR field teams to securely capture, upload, and manage disaster-related "
+                "photographs during incident response operations",
+                "Provide rapid photo documentation capability deployable within hours of incident "
+                "activation \u2014 now live in production with full CDN acceleration",
+                "Replace ad-hoc photo collection methods (email, shared drives, USB) with a "
+                "purpose-built, secure web application accessible via PIN, Entra ID SSO, "
+                "Login.gov, and ID.me",
+                "Support incident accountability with geotagged, timestamped, EXIF-enriched "
+                "photographic evidence and full admin audit trail",
+                "Operate within the HHS/ASPR security boundary with Azure Front Door WAF "
+                "(OWASP 3.2), Private Link network isolation, and NIST SP 800-53 alignment",
+            ],
+        },
+        {
+            "type": "kpi",
+            "title": "What We Built \u2014 Platform Highlights",
+            "cards": [
+                ["17+", "API Endpoints", "REST API with full\nCRUD + bulk operations"],
+                ["4", "Auth Methods", "PIN, Entra ID SSO,\nLogin.gov, ID.me"],
+                ["3", "Image Renditions", "thumb_sm, thumb_md,\nweb (all WebP)"],
+                ["8", "Database Tables", "SQL + audit log\n+ EXIF + tags"],
+                ["10+", "Admin Components", "Photo grid, editor,\ntags, bulk ops"],
+            ],
+        },
+        {
+            "type": "capabilities",
+            "title": "Key Capabilities",
+            "left": [
+                ["Multi-Auth Security", "PIN + JWT (field), Entra ID SSO (admin),\n"
+                 "Login.gov & ID.me (external), rate limiting"],
+                ["Photo Upload Wizard", "6-step guided upload with animated progress,\n"
+                 "GPS capture, incident tagging, batch support"],
+                ["Admin Photo Grid", "Virtualized grid with search, filters,\n"
+                 "status badges, bulk select, cursor pagination"],
+                ["Photo Editor", "Crop (aspect presets), rotate 90\u00b0,\n"
+                 "flip H/V, rendition regeneration"],
+            ],
+            "right": [
+                ["Tag System", "Categorized tags (status, priority, type,\n"
+                 "timeline, custom) with autocomplete"],
+                ["EXIF Extraction", "Camera make/model, lens, aperture, ISO,\n"
+                 "shutter speed, GPS altitude, date taken"],
+                ["Bulk Operations", "Multi-select delete, tag assignment,\n"
+                 "status change, ZIP download"],
+                ["Session Management", "Create/revoke PINs, view photo counts,\n"
+                 "storage usage, team tracking"],
+            ],
+        },
+        {
+            "type": "table",
+            "title": "Architecture Overview",
+            "headers": ["Layer", "Component", "Technology", "Purpose"],
+            "rows": [
+                ["Application", "Web Framework", "Next.js 16.1.6 (React 19)", "Full-stack SSR + API routes"],
+                ["Application", "UI / Design", "Tailwind CSS 4 + shadcn/ui", "Glassmorphic component system"],
+                ["Application", "Image Pipeline", "Sharp 0.34 + exifr", "Multi-rendition WebP + EXIF"],
+                ["Security", "WAF", "Azure Front Door WAF", "OWASP DRS 2.1 + Bot Protection"],
+                ["Security", "Authentication", "Auth.js v5 + bcrypt + JWT", "Multi-provider auth system"],
+                ["Network", "CDN", "Azure Front Door Premium", "Global edge caching + SSL"],
+                ["Network", "Private Link", "Azure Private Endpoints", "VNet isolation (blob + app)"],
+                ["Data", "Database", "Azure SQL Server", "Sessions, photos, tags, audit"],
+                ["Data", "Blob Storage", "Azure Blob Storage", "Photo originals + renditions"],
+                ["Data", "Key Vault", "Azure Key Vault", "Secrets management"],
+                ["Hosting", "App Service", "Linux / Node.js 22", "Standalone Next.js runtime"],
+                ["CI/CD", "Pipeline", "GitHub Actions", "ZipDeploy + post-deploy migrate"],
+            ],
+            "col_widths": [13, 18, 30, 39],
+            "font_hdr": 13,
+            "font_row": 12,
+        },
+        {
+            "type": "bullets",
+            "title": "Security Posture",
+            "bullets": [
+                "FIPS 199 MODERATE categorization \u2014 appropriate for operational "
+                "incident photography",
+                "Azure Front Door WAF (OWASP DRS 2.1 + Microsoft Bot Manager) in "
+                "Prevention mode protecting all application traffic",
+                "Network isolation via Private Endpoints \u2014 Blob Storage, SQL, "
+                "and Key Vault on VNet; App Service behind Private Link origins",
+                "OWASP Top 10 (2021) fully addressed \u2014 injection prevention, "
+                "access control, cryptographic protections, security misconfiguration",
+                "NIST SP 800-63B compliant PIN generation (CSPRNG) with bcrypt "
+                "storage (10 salt rounds)",
+                "Comprehensive rate limiting \u2014 5 PIN attempts/min (15-min lockout), "
+                "3 admin attempts (30-min lockout), 50 uploads/hour",
+                "Hardened HTTP headers \u2014 HSTS, CSP, X-Frame-Options, "
+                "Permissions-Policy on all routes",
+                "Immutable admin audit log \u2014 all operations recorded with entity, "
+                "performer email, IP address, timestamp",
+                "Signed image URLs (HMAC-SHA256) \u2014 24-hour expiry, no JWT "
+                "exposure in query strings",
+            ],
+            "font_size": 16,
+        },
+        {
+            "type": "two_col",
+            "title": "Admin Dashboard \u2014 Full Photo Management",
+            "left_title": "Management Features",
+            "left_items": [
+                "Photo grid with virtual scrolling (100/page cursor pagination)",
+                "Search by filename, filter by incident/status/date/session/tags",
+                "Photo detail sidebar with inline metadata editing",
+                "Photo editor: crop with aspect presets, rotate, flip",
+                "Rendition auto-regeneration after edits (thumb_sm, thumb_md, web)",
+                "Admin bulk upload panel (drag-and-drop, up to 50 files)",
+                "Dashboard statistics: totals, incidents, daily volume, top teams",
+            ],
+            "right_title": "Organization & Operations",
+            "right_items": [
+                "Tag system: status, priority, type, timeline, custom categories",
+                "Tag autocomplete with category filtering and color coding",
+                "Bulk operations: delete, tag assign/remove, status change",
+                "Bulk download: client-side ZIP via signed URLs",
+                "EXIF data: camera make/model, lens, aperture, ISO, GPS, date",
+                "Session manager: create/revoke PINs, usage stats per team",
+                "Audit log: entity type, action, performer, IP, details JSON",
+            ],
+        },
+        {
+            "type": "table",
+            "title": "CDN & Performance Architecture",
+            "headers": ["Component", "Configuration", "Details"],
+            "rows": [
+                ["Front Door Profile", "Premium_AzureFrontDoor", "cdn-ociomicro-premium-eus2-01 (shared)"],
+                ["App Endpoint", "cdn-asprphotos-app", "All app routes (/*), HTTPS-only"],
+                ["Blob Endpoint", "cdn-asprphotos", "Rendition images (/renditions/*), HTTPS-only"],
+                ["WAF Policy", "wafAsprPhotos", "OWASP DRS 2.1 + Bot Protection, Prevention mode"],
+                ["App Origin", "Private Link", "App Service via approved Private Endpoint"],
+                ["Blob Origin", "Private Link", "Blob Storage via approved Private Endpoint"],
+                ["Health Probe", "/api/health", "Every 30s \u2014 HTTP 200 + JSON status check"],
+                ["Image Renditions", "3 variants/photo", "thumb_sm 200x150, thumb_md 400x300, web 1200px"],
+                ["Cache Strategy", "7-day immutable", "Static assets + hero images; API routes no-cache"],
+            ],
+            "col_widths": [22, 28, 50],
+            "font_row": 12,
+        },
+        {
+            "type": "bullets",
+            "title": "CI/CD Pipeline \u2014 Automated Deployment",
+            "bullets": [
+                "1.  Trigger: Push to main branch or manual workflow_dispatch",
+                "2.  Build: Node.js 22.x \u2014 npm install + npm run build "
+                "(Next.js standalone output)",
+                "3.  Package: Copy .next/static + public/ into .next/standalone artifact",
+                "4.  Deploy: azure/webapps-deploy@v2 via publish profile "
+                "(ZipDeploy to SCM endpoint)",
+                "5.  Target: app-aspr-photos in rg-ocio-microsites-eus2-01",
+                "6.  Post-Deploy: POST /api/admin/migrate (Entra ID session) "
+                "for database schema migrations",
+                "7.  Health: /api/health endpoint polled every 30s by "
+                "Front Door health probe",
+                "8.  Runtime: node server.js (configured on App Service, "
+                "not in workflow)",
+                "9.  Secrets: AZURE_WEBAPP_PUBLISH_PROFILE stored as "
+                "GitHub Actions encrypted secret",
+            ],
+            "font_size": 16,
+        },
+        {
+            "type": "table",
+            "title": "Timeline & Milestones",
+            "headers": ["Phase", "Timeline", "Status", "Key Deliverables"],
+            "rows": [
+                ["1. Requirements & Design", "Jan 2026", "COMPLETE",
+                 "SRS v2.0, SDD, Security Plan, architecture review"],
+                ["2. Core Development", "Jan\u2013Feb 2026", "COMPLETE",
+                 "DB schema, PIN auth, upload API, gallery, wizard"],
+                ["3. Security Hardening", "Feb 2026", "COMPLETE",
+                 "bcrypt, JWT, rate limiting, signed URLs, CSP headers"],
+                ["4. Admin Dashboard", "Feb 2026", "COMPLETE",
+                 "Photo grid, editor, bulk ops, tags, EXIF, sessions"],
+                ["5. Infrastructure & CDN", "Feb 2026", "COMPLETE",
+                 "Front Door Premium, WAF, Private Link, CDN endpoints"],
+                ["6. CI/CD & Deployment", "Feb 2026", "COMPLETE",
+                 "GitHub Actions, ZipDeploy, post-deploy migrate"],
+                ["7. UI/UX Polish", "Feb 2026", "COMPLETE",
+                 "Glassmorphic design, animations, preloader, transitions"],
+                ["8. Documentation", "Feb 2026", "COMPLETE",
+                 "6-document suite + PPTX + Project Plan XML"],
+                ["9. UAT & ATO", "Feb\u2013Mar 2026", "IN PROGRESS",
+                 "User acceptance testing, security review, ATO package"],
+                ["10. Production Ops", "Mar 2026+", "PLANNED",
+                 "Monitoring, training, field pilot, v1.1 planning"],
+            ],
+            "col_widths": [22, 13, 12, 53],
+            "font_hdr": 13,
+            "font_row": 12,
+        },
+        {
+            "type": "table",
+            "title": "Professional Document Package",
+            "headers": ["#", "Document", "Version", "Description"],
+            "rows": [
+                ["01", "Software Requirements Specification", "v2.0",
+                 "Functional & non-functional requirements, data model, API spec"],
+                ["02", "System Design Document", "v1.0",
+                 "Architecture, component design, integration patterns"],
+                ["03", "Security Plan", "v1.0",
+                 "FIPS 199, OWASP controls, NIST mapping, WAF policy"],
+                ["04", "Deployment & Operations Guide", "v1.0",
+                 "Azure setup, CI/CD, monitoring, runbook procedures"],
+                ["05", "User Guide", "v1.0",
+                 "Field team upload workflow + admin dashboard usage"],
+                ["06", "API & Data Reference", "v1.0",
+                 "REST API endpoints, data model, security headers"],
+                ["\u2014", "Executive Summary PPTX", "v2.0",
+                 "This presentation (14-slide executive briefing)"],
+                ["\u2014", "Project Plan XML", "v1.0",
+                 "MS Project-compatible schedule (10 phases, 90 tasks)"],
+            ],
+            "col_widths": [5, 35, 8, 52],
+            "font_row": 12,
+        },
+        {
+            "type": "table",
+            "title": "Risk Assessment",
+            "headers": ["Risk", "Likelihood", "Impact", "Mitigation"],
+            "rows": [
+                ["PIN brute force", "Low", "Medium",
+                 "Rate limiting + lockout + bcrypt + WAF bot protection"],
+                ["Data loss", "Low", "High",
+                 "Azure automatic backups + blob soft delete + Private Link"],
+                ["Network unavailability", "Medium", "Medium",
+                 "Front Door multi-region routing + health probes"],
+                ["Credential exposure", "Low", "High",
+                 "Key Vault + bcrypt + timing-safe compare + no plaintext"],
+                ["CDN cache poisoning", "Low", "Medium",
+                 "WAF Prevention mode + OWASP DRS 2.1 managed rules"],
+                ["DDoS / bot attack", "Medium", "Medium",
+                 "Front Door WAF + rate limiting + IP restrictions"],
+                ["Scale limitations", "Medium", "Low",
+                 "In-memory rate limit \u2192 Redis migration path ready"],
+            ],
+            "col_widths": [22, 12, 12, 54],
+        },
+        {
+            "type": "signoff",
+            "title": "Recommendation & Approval",
+            "statement":
+                "The ASPR Photo Repository application has been successfully deployed "
+                "to production. The system meets all functional requirements, adheres "
+                "to NIST and OWASP security standards, is protected by Azure Front "
+                "Door WAF with OWASP DRS 2.1 ruleset, and operates within full "
+                "network isolation via Private Link. The application is recommended "
+                "for Authority to Operate (ATO) approval.",
+            "roles": [
+                "Federal Project Sponsor",
+                "Information System Security Officer (ISSO)",
+                "Authorizing Official (AO)",
+                "Technical Lead",
+            ],
+        },
+        {
+            "type": "closing",
+            "title": "Next Steps",
+            "steps": [
+                "1.  Complete User Acceptance Testing (UAT) with ASPR field team "
+                "representatives",
+                "2.  Conduct formal security review and obtain Authority to "
+                "Operate (ATO)",
+                "3.  Configure Azure Monitor / Application Insights for production "
+                "telemetry and alerting",
+                "4.  Train operations staff on admin dashboard, PIN management, "
+                "and photo workflow",
+                "5.  Conduct field pilot during next incident activation or "
+                "training exercise",
+                "6.  Integrate Login.gov + ID.me external responder authentication "
+                "(Phase 2 \u2014 app registration pending)",
+                "7.  Plan v1.1 enhancements: interactive map view, offline mode, "
+                "batch download improvements",
+            ],
+        },
     ],
-    col_widths=[22, 12, 12, 54],
-)
-add_footer(slide)
+}
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  RENDERER
+# ══════════════════════════════════════════════════════════════════════
 
+def _pt(spec, key, default):
+    return Pt(spec[key]) if key in spec else default
 
-# ── SLIDE 13: RECOMMENDATION & APPROVAL ─────────────────────────────
 
-slide = prs.slides.add_slide(blank_layout)
-add_dark_bg(slide)
-add_slide_header(slide, "Recommendation & Approval")
+def render_title(slide, spec):
+    add_title_block(slide, spec["title"], spec.get("subtitle", ""),
+                    spec.get("metadata", []))
 
-add_title_text(slide,
-    "The ASPR Photo Repository application has been successfully deployed "
-    "to production. The system meets all functional requirements, adheres "
-    "to NIST and OWASP security standards, is protected by Azure Front "
-    "Door WAF with OWASP DRS 2.1 ruleset, and operates within full "
-    "network isolation via Private Link. The application is recommended "
-    "for Authority to Operate (ATO) approval.",
-    Inches(0.8), Inches(1.8), Inches(11), Inches(1.2),
-    font_size=Pt(18), color=WHITE, bold=False)
 
-table_shape = slide.shapes.add_table(
-    5, 4, Inches(0.8), Inches(3.4), Inches(11.5), Inches(2.5)
-)
-table = table_shape.table
-
-headers = ["Role", "Name", "Signature", "Date"]
-col_pct = [30, 25, 25, 20]
-total = sum(col_pct)
-for i, w in enumerate(col_pct):
-    table.columns[i].width = int(Inches(11.5) * w / total)
-
-for i, hdr in enumerate(headers):
-    cell = table.cell(0, i)
-    cell.text = hdr
-    cell.fill.solid()
-    cell.fill.fore_color.rgb = BLUE_PRIMARY
-    for p in cell.text_frame.paragraphs:
-        p.font.size = Pt(14)
-        p.font.color.rgb = WHITE
-        p.font.bold = True
-
-roles = [
-    "Federal Project Sponsor",
-    "Information System Security Officer (ISSO)",
-    "Authorizing Official (AO)",
-    "Technical Lead",
-]
-for ri, role in enumerate(roles):
-    bg = ROW_EVEN if ri % 2 == 0 else ROW_ODD
-    for ci in range(4):
-        c = table.cell(ri + 1, ci)
-        if ci == 0:
-            c.text = role
-        c.fill.solid()
-        c.fill.fore_color.rgb = bg
-        for p in c.text_frame.paragraphs:
-            p.font.size = Pt(13)
-            p.font.color.rgb = WHITE
+def render_bullets(slide, spec):
+    add_bullet_slide(slide, spec["title"], spec["bullets"],
+                     font_size=_pt(spec, "font_size", Pt(18)))
+
+
+def render_kpi(slide, spec):
+    add_slide_header(slide, spec["title"])
+    add_kpi_cards(slide, spec["cards"])
 
-add_footer(slide)
-
-
-# ── SLIDE 14: NEXT STEPS ───────────────────────────────────────────
-
-slide = prs.slides.add_slide(blank_layout)
-add_dark_bg(slide)
-add_slide_header(slide, "Next Steps")
-
-next_steps = [
-    "1.  Complete User Acceptance Testing (UAT) with ASPR field team "
-    "representatives",
-    "2.  Conduct formal security review and obtain Authority to "
-    "Operate (ATO)",
-    "3.  Configure Azure Monitor / Application Insights for production "
-    "telemetry and alerting",
-    "4.  Train operations staff on admin dashboard, PIN management, "
-    "and photo workflow",
-    "5.  Conduct field pilot during next incident activation or "
-    "training exercise",
-    "6.  Integrate Login.gov + ID.me external responder authentication "
-    "(Phase 2 \u2014 app registration pending)",
-    "7.  Plan v1.1 enhancements: interactive map view, offline mode, "
-    "batch download improvements",
-]
-
-txBox = slide.shapes.add_textbox(Inches(1.0), Inches(1.9),
-                                  Inches(11), Inches(4.5))
-tf = txBox.text_frame
-tf.word_wrap = True
-
-for i, step in enumerate(next_steps):
-    p = tf.add_paragraph() if i > 0 else tf.paragraphs[0]
-    p.text = step
-    p.font.size = Pt(18)
-    p.font.color.rgb = WHITE
-    p.space_after = Pt(14)
-
-if ASPR_LOGO.exists():
-    slide.shapes.add_picture(str(ASPR_LOGO), Inches(0.8), Inches(6.2),
-                             height=Inches(0.7))
-if LEIDOS_LOGO.exists():
-    slide.shapes.add_picture(str(LEIDOS_LOGO), Inches(10.5), Inches(6.3),
-                             height=Inches(0.5))
-
-add_footer(slide)
+
+def render_capabilities(slide, spec):
+    add_capability_grid(slide, spec["title"], spec["left"], spec["right"])
+
+
+def render_table(slide, spec):
+    font_hdr = _pt(spec, "font_hdr", Pt(14))
+    font_row = _pt(spec, "font_row", Pt(13))
+    add_table_slide(slide, spec["title"], spec["headers"], spec["rows"],
+                    col_widths=spec.get("col_widths"),
+                    font_hdr=font_hdr, font_row=font_row,
+                    row_heights=table_row_heights(spec["headers"], spec["rows"],
+                                                  spec.get("col_widths"),
+                                                  font_hdr, font_row))
+
+
+def render_two_col(slide, spec):
+    add_two_col_features(slide, spec["title"],
+                         spec["left_title"], spec["left_items"],
+                         spec["right_title"], spec["right_items"],
+                         font_size=_pt(spec, "font_size", Pt(14)))
+
+
+def render_signoff(slide, spec):
+    add_signoff_slide(slide, spec["title"], spec["statement"], spec["roles"])
+
+
+def render_closing(slide, spec):
+    add_closing_slide(slide, spec["title"], spec["steps"])
+
+
+SLIDE_RENDERERS = {
+    "title": render_title,
+    "bullets": render_bullets,
+    "kpi": render_kpi,
+    "capabilities": render_capabilities,
+    "table": render_table,
+    "two_col": render_two_col,
+    "signoff": render_signoff,
+    "closing": render_closing,
+}
+
+
+# ── Auto-fit ──────────────────────────────────────────────────────────
+#
+# A fitter turns one slide spec into one or more: the same slide with
+# its font shrunk to fit (never below the type's minimum), or, when even
+# the minimum overflows, continuation slides at the original size. Set
+# "autofit": false on a slide to render it as written, or "min_font" to
+# change how far it may shrink.
+
+AUTOFIT_MIN_PT = {"bullets": 14, "two_col": 11, "table": 10}
+
+
+def _min_pt(spec):
+    return Pt(spec.get("min_font", AUTOFIT_MIN_PT[spec["type"]]))
+
+
+def _pages(spec, pages, **fields):
+    """One spec per page; pages after the first are titled (cont.)."""
+    specs = []
+    for index, page in enumerate(pages):
+        specs.append(dict(spec, **page, **fields))
+        if index:
+            specs[-1]["title"] = f"{spec['title']} (cont.)"
+    return specs
+
+
+def fit_bullets(spec):
+    size = _pt(spec, "font_size", Pt(18))
+    width, height = BULLET_BOX
+    bullets = spec["bullets"]
+    fitted = fit_font_size(bullets, width, height, size, _min_pt(spec),
+                           BULLET_SPACE_AFTER)
+    if fitted is not None:
+        return [dict(spec, font_size=round(fitted.pt))]
+
+    heights = paragraph_heights(bullets, size, width, BULLET_SPACE_AFTER)
+    capacity = height - 2 * TEXT_INSET_Y + BULLET_SPACE_AFTER
+    pages = paginate(bullets, heights, capacity)
+    return _pages(spec, [{"bullets": page} for page in pages],
+                  font_size=round(size.pt))
+
+
+def fit_two_col(spec):
+    size = _pt(spec, "font_size", Pt(14))
+    width, height = COLUMN_BOX
+    columns = [[COLUMN_BULLET + item for item in spec[key]]
+               for key in ("left_items", "right_items")]
+    sizes = [fit_font_size(texts, width, height, size, _min_pt(spec),
+                           COLUMN_SPACE_AFTER) for texts in columns]
+    if None not in sizes:
+        return [dict(spec, font_size=round(min(sizes).pt))]
+
+    capacity = height - 2 * TEXT_INSET_Y + COLUMN_SPACE_AFTER
+    left, right = (paginate(spec[key],
+                            paragraph_heights(texts, size, width, COLUMN_SPACE_AFTER),
+                            capacity)
+                   for key, texts in zip(("left_items", "right_items"), columns))
+    pages = [{"left_items": left[i] if i < len(left) else [],
+              "right_items": right[i] if i < len(right) else []}
+             for i in range(max(len(left), len(right)))]
+    return _pages(spec, pages, font_size=round(size.pt))
+
+
+def fit_table(spec):
+    font_hdr = _pt(spec, "font_hdr", Pt(14))
+    font_row = _pt(spec, "font_row", Pt(13))
+    headers, rows, col_widths = spec["headers"], spec["rows"], spec.get("col_widths")
+    capacity = FOOTER_TOP - TABLE_TOP
+
+    # Header and body shrink together, a point at a time
+    for step in range(int(font_row.pt) - int(_min_pt(spec).pt) + 1):
+        hdr, row = Pt(font_hdr.pt - step), Pt(font_row.pt - step)
+        if sum(table_row_heights(headers, rows, col_widths, hdr, row)) <= capacity:
+            return [dict(spec, font_hdr=round(hdr.pt), font_row=round(row.pt))]
+
+    heights = table_row_heights(headers, rows, col_widths, font_hdr, font_row)
+    pages = paginate(rows, heights[1:], capacity - heights[0])
+    return _pages(spec, [{"rows": page} for page in pages],
+                  font_hdr=round(font_hdr.pt), font_row=round(font_row.pt))
+
+
+SLIDE_FITTERS = {
+    "bullets": fit_bullets,
+    "two_col": fit_two_col,
+    "table": fit_table,
+}
+
+
+def new_presentation(footer=None):
+    """Empty widescreen presentation on the branded master."""
+    return Presentation(io.BytesIO(branded_template(footer)))
+
+
+def render_deck(deck, prs=None):
+    """Render a deck spec into prs (a new branded presentation by default)."""
+    if prs is None:
+        prs = new_presentation(deck.get("footer"))
+    layouts = {layout.name: layout for layout in prs.slide_layouts}
+
+    for index, spec in enumerate(deck["slides"], 1):
+        try:
+            render = SLIDE_RENDERERS[spec["type"]]
+        except KeyError:
+            raise ValueError(f"slide {index}: unknown slide type "
+                             f"{spec.get('type')!r}") from None
+        layout = layouts[SLIDE_LAYOUTS.get(spec["type"], CONTENT_LAYOUT)]
+        fit = SLIDE_FITTERS.get(spec["type"]) if spec.get("autofit", True) else None
+        try:
+            for page in (fit(spec) if fit else [spec]):
+                render(prs.slides.add_slide(layout), page)
+        except (KeyError, TypeError, ValueError) as exc:
+            raise ValueError(f"slide {index} ({spec['type']}): {exc!r}") from None
+    return prs
+
+
+def load_deck(path):
+    """Read a deck spec from JSON: {"footer": ..., "slides": [...]} or a bare list."""
+    path = Path(path)
+    with open(path, encoding="utf-8") as fh:
+        data = json.load(fh)
+    deck = {"slides": data} if isinstance(data, list) else data
+    if not isinstance(deck.get("slides"), list):
+        raise ValueError(f"{path}: expected a list of slides")
+    return deck
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  TENANT BATCH
+# ══════════════════════════════════════════════════════════════════════
+#
+# A tenants file is a JSON list of parameter sets, one deck each:
+#   {"name": "Region 4", "subtitle": ..., "metadata": [...], "footer": ...,
+#    "spec": "other_deck.json", "output": "region4.pptx"}
+# Only "name" is required; "title", "subtitle" and "metadata" replace the
+# cover slide's fields and "spec" swaps the built-in deck for a JSON one.
+
+TENANT_COVER_FIELDS = ("title", "subtitle", "metadata")
+
+
+def load_tenants(path):
+    """Read a tenants file; returns a list of parameter dicts."""
+    path = Path(path)
+    with open(path, encoding="utf-8") as fh:
+        tenants = json.load(fh)
+    if not isinstance(tenants, list):
+        raise ValueError(f"{path}: expected a list of tenants")
+    names = set()
+    for index, tenant in enumerate(tenants):
+        if not isinstance(tenant, dict) or not tenant.get("name"):
+            raise ValueError(f"{path}: tenant {index} has no name")
+        out_name = tenant_output(tenant)
+        if out_name in names:
+            raise ValueError(f"{path}: tenant {index} writes {out_name} twice")
+        names.add(out_name)
+    return tenants
+
+
+def tenant_output(tenant):
+    slug = re.sub(r"[^A-Za-z0-9]+", "_", tenant["name"]).strip("_")
+    return tenant.get("output") or f"{slug}_Executive_Summary.pptx"
+
+
+def tenant_deck(tenant, base=DECK):
+    """Deck spec for one tenant: base (or its own spec) with overrides applied."""
+    deck = load_deck(tenant["spec"]) if tenant.get("spec") else copy.deepcopy(base)
+    if "footer" in tenant:
+        deck["footer"] = tenant["footer"]
+    cover = next((s for s in deck["slides"] if s.get("type") == "title"), None)
+    if cover is not None:
+        for key in TENANT_COVER_FIELDS:
+            if key in tenant:
+                cover[key] = tenant[key]
+    return deck
+
+
+def render_tenant(tenant, out_dir):
+    """Render and save one tenant's deck; returns the output path."""
+    out = Path(out_dir) / tenant_output(tenant)
+    prs = render_deck(tenant_deck(tenant))
+    save_package(prs, out)
+    return out
+
+
+def _attempt(fn, *args):
+    """Call fn and return (result, None), or (None, exc) if it raised."""
+    try:
+        return fn(*args), None
+    except Exception as e:
+        return None, e
+
+
+def render_batch(tenants, out_dir, jobs=1):
+    """Render every tenant's deck, yielding (tenant, path, exc) in order."""
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    jobs = max(1, min(jobs, len(tenants)))
+    if jobs == 1:
+        for tenant in tenants:
+            yield (tenant, *_attempt(render_tenant, tenant, out_dir))
+        return
+    # Each worker builds the branded template once and reuses it for
+    # every deck it renders
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(render_tenant, tenant, out_dir) for tenant in tenants]
+        for tenant, future in zip(tenants, futures):
+            yield (tenant, *_attempt(future.result))
 
 
 # ══════════════════════════════════════════════════════════════════════
-#  SAVE
+#  MAIN
 # ══════════════════════════════════════════════════════════════════════
 
-OUT.parent.mkdir(parents=True, exist_ok=True)
-prs.save(str(OUT))
-size_kb = OUT.stat().st_size / 1024
-print(f"\nExecutive Summary PPTX v2.0 generated: {OUT}")
-print(f"Size: {size_kb:.1f} KB")
-print(f"Slides: {len(prs.slides)}")
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate the ASPR Photo Repository executive summary deck.")
+    parser.add_argument("--spec", type=Path,
+                        help="JSON deck spec to render instead of the built-in deck")
+    parser.add_argument("--dump-spec", type=Path, metavar="PATH",
+                        help="write the built-in deck spec as JSON and exit")
+    parser.add_argument("-o", "--output", type=Path, default=OUT,
+                        help=f"output .pptx (default: {OUT.relative_to(ROOT)})")
+    parser.add_argument("--batch", type=Path, metavar="TENANTS",
+                        help="JSON list of tenant parameter sets; renders one deck each")
+    parser.add_argument("--out-dir", type=Path, default=BATCH_OUT,
+                        help=f"--batch output directory (default: {BATCH_OUT.relative_to(ROOT)})")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes for --batch (default: CPU count)")
+    return parser.parse_args(argv)
+
+
+def run_batch(args):
+    try:
+        tenants = load_tenants(args.batch)
+    except (OSError, ValueError) as exc:
+        print(f"  [ERR] {exc}")
+        return 1
+
+    errors = 0
+    total_kb = 0.0
+    for tenant, out, exc in render_batch(tenants, args.out_dir, args.jobs):
+        if exc is not None:
+            print(f"  [ERR] {tenant['name']}: {exc}")
+            errors += 1
+            continue
+        size_kb = out.stat().st_size / 1024
+        total_kb += size_kb
+        print(f"  [OK] {out.name} ({size_kb:.1f} KB)")
+
+    print(f"\n{len(tenants) - errors} of {len(tenants)} decks generated in "
+          f"{args.out_dir} ({total_kb:.1f} KB)")
+    return 1 if errors else 0
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    if args.dump_spec:
+        args.dump_spec.parent.mkdir(parents=True, exist_ok=True)
+        args.dump_spec.write_text(json.dumps(DECK, indent=2, ensure_ascii=False),
+                                  encoding="utf-8")
+        print(f"  [OK] Deck spec written: {args.dump_spec}")
+        return 0
+    if args.batch:
+        return run_batch(args)
+
+    try:
+        deck = load_deck(args.spec) if args.spec else DECK
+        prs = render_deck(deck)
+    except (OSError, ValueError) as exc:
+        print(f"  [ERR] {exc}")
+        return 1
+
+    out = args.output
+    out.parent.mkdir(parents=True, exist_ok=True)
+    save_package(prs, out)
+    size_kb = out.stat().st_size / 1024
+    print(f"\nExecutive Summary PPTX v2.0 generated: {out}")
+    print(f"Size: {size_kb:.1f} KB")
+    print(f"Slides: {len(prs.slides)}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
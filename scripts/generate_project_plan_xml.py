@@ -2,13 +2,30 @@
 Generate MS Project XML for ASPR Photo Repository project schedule.
 Uses MS Project 2003 XML schema for broad compatibility.
 
-Run:  python scripts/generate_project_plan_xml.py
+Run:  python scripts/generate_project_plan_xml.py [--keep-dates]
+      python scripts/generate_project_plan_xml.py --tasks plan.csv --resources team.csv
+      python scripts/generate_project_plan_xml.py --incremental   # weekly updates
+      python scripts/generate_project_plan_xml.py --formats xml,html,csv,ics
+
+Task dates are recomputed from durations and predecessor links with a
+critical-path pass (see schedule_tasks); --keep-dates writes the typed ones.
 Requires: No additional dependencies (uses stdlib xml.etree.ElementTree)
 """
 
+import argparse
+import csv
+import io
+import json
+import os
+import re
+from bisect import bisect_left, bisect_right
+from collections import namedtuple
 from pathlib import Path
-from datetime import datetime
-from xml.etree.ElementTree import Element, SubElement, ElementTree, indent
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from heapq import heappop, heappush
+from html import escape as html_escape
+from xml.etree.ElementTree import Element, SubElement
 
 ROOT = Path(__file__).resolve().parent.parent
 OUT = ROOT / "docs" / "ASPR_Photo_Repository_Project_Plan.xml"
@@ -333,18 +350,947 @@ TASKS = [
 ]
 
 
+# ══════════════════════════════════════════════════════════════════════
+#  PLAN IMPORT  (CSV / JSON / JSON Lines)
+# ══════════════════════════════════════════════════════════════════════
+#
+# Tasks and resources can be loaded from files instead of the literals
+# above. Rows are read one at a time (CSV and .jsonl are streamed; a .json
+# file is a list of rows, or an object with "tasks"/"resources" lists) and
+# normalized to the same dict shape as TASKS/RESOURCES. Lookups go through
+# dicts keyed by UID, so validation is linear in rows + predecessor links.
+#
+# Task columns:     uid, name, start, dur  (required)
+#                   level (1), finish (start), pct (0), preds, res
+# Resource columns: uid, name  (required), initials
+#
+# "preds" is a list of UIDs (";", "," or space separated in CSV). "res" is
+# a resource UID, initials or name.
+
+def _iter_rows(path, key):
+    """Yield (line, row dict) from a CSV, JSON or JSON Lines file."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        with open(path, newline="", encoding="utf-8-sig") as fh:
+            reader = csv.DictReader(fh)
+            for row in reader:
+                yield reader.line_num, row
+    elif suffix in (".jsonl", ".ndjson"):
+        with open(path, encoding="utf-8") as fh:
+            for line_num, line in enumerate(fh, 1):
+                if line.strip():
+                    yield line_num, json.loads(line)
+    elif suffix == ".json":
+        with open(path, encoding="utf-8") as fh:
+            data = json.load(fh)
+        rows = data.get(key, []) if isinstance(data, dict) else data
+        for index, row in enumerate(rows):
+            yield f"{key}[{index}]", row
+    else:
+        raise ValueError(f"{path}: unsupported file type (use .csv, .json or .jsonl)")
+
+
+def _uid_list(value):
+    if value is None or value == "":
+        return []
+    if isinstance(value, (list, tuple)):
+        return [int(v) for v in value]
+    return [int(v) for v in re.split(r"[;,\s]+", str(value).strip()) if v]
+
+
+def _required(row, field):
+    value = row.get(field)
+    if value is None or value == "":
+        raise ValueError(f"missing required field {field!r}")
+    return value
+
+
+def _load(path, key, convert):
+    """Run convert(row) over every row, prefixing errors with file:line."""
+    for where, row in _iter_rows(path, key):
+        try:
+            yield convert(row)
+        except (TypeError, ValueError, KeyError) as exc:
+            raise ValueError(f"{path}:{where}: {exc}") from None
+
+
+def load_resources(path):
+    """Load resources from path; returns a list shaped like RESOURCES."""
+    def convert(row):
+        name = str(_required(row, "name"))
+        initials = row.get("initials") or "".join(w[0] for w in name.split()).upper()
+        return {"uid": int(_required(row, "uid")), "name": name, "initials": initials}
+
+    resources = []
+    seen = set()
+    for res in _load(path, "resources", convert):
+        if res["uid"] in seen:
+            raise ValueError(f"{path}: duplicate resource UID {res['uid']}")
+        seen.add(res["uid"])
+        resources.append(res)
+    return resources
+
+
+def resource_index(resources):
+    """Map every resource UID, initials and name to its UID."""
+    index = {}
+    for res in resources:
+        index[str(res["uid"])] = index[res["initials"]] = index[res["name"]] = res["uid"]
+    return index
+
+
+def load_tasks(path, resources=RESOURCES):
+    """Load tasks from path; returns a list shaped like TASKS.
+
+    Raises ValueError on malformed rows, duplicate UIDs, predecessors that
+    name no task, or assignments to unknown resources.
+    """
+    by_res = resource_index(resources)
+
+    def convert(row):
+        start = date.fromisoformat(str(_required(row, "start"))).isoformat()
+        finish = row.get("finish")
+        res = row.get("res")
+        if res is not None and res != "":
+            if str(res) not in by_res:
+                raise ValueError(f"unknown resource {res!r}")
+            res = by_res[str(res)]
+        else:
+            res = None
+        return {
+            "uid": int(_required(row, "uid")),
+            "name": str(_required(row, "name")),
+            "level": int(row.get("level") or 1),
+            "start": start,
+            "finish": date.fromisoformat(str(finish)).isoformat() if finish else start,
+            "dur": int(_required(row, "dur")),
+            "pct": int(row.get("pct") or 0),
+            "preds": _uid_list(row.get("preds")),
+            "res": res,
+        }
+
+    tasks = []
+    seen = set()
+    for task in _load(path, "tasks", convert):
+        if task["uid"] in seen:
+            raise ValueError(f"{path}: duplicate task UID {task['uid']}")
+        seen.add(task["uid"])
+        tasks.append(task)
+
+    dangling = [(t["uid"], p) for t in tasks for p in t["preds"] if p not in seen]
+    if dangling:
+        shown = ", ".join(f"{uid}->{pred}" for uid, pred in dangling[:10])
+        more = f" (+{len(dangling) - 10} more)" if len(dangling) > 10 else ""
+        raise ValueError(f"{path}: unknown predecessors {shown}{more}")
+    return tasks
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  SCHEDULING ENGINE  (critical path method)
+# ══════════════════════════════════════════════════════════════════════
+#
+# Dates are handled as working-day indices on the Mon-Fri calendar written
+# by build_calendar(), so date arithmetic is O(1). Links are Finish-to-Start
+# with no lag. A summary task becomes two zero-length nodes (start, finish):
+# its predecessors feed the start node, every child runs between the two,
+# and successors of the summary hang off the finish node. That keeps the
+# graph at O(tasks + links) edges however links are drawn. task_graph()
+# builds it; the scheduler and the validator both walk the same structure.
+
+CALENDAR_EPOCH = date(2026, 1, 5)   # a Monday; any Monday works
+WORK_WEEK_DAYS = 5                  # Mon-Fri, see build_calendar()
+
+
+def to_workday(day):
+    """Working-day index of a date; weekend dates roll forward to Monday."""
+    weeks, weekday = divmod((day - CALENDAR_EPOCH).days, 7)
+    return weeks * WORK_WEEK_DAYS + min(weekday, WORK_WEEK_DAYS)
+
+
+@lru_cache(maxsize=None)
+def from_workday(index):
+    weeks, weekday = divmod(index, WORK_WEEK_DAYS)
+    return CALENDAR_EPOCH + timedelta(weeks=weeks, days=weekday)
+
+
+def task_parents(tasks):
+    """Map uid -> parent summary uid (None at top level) from outline levels."""
+    parents = {}
+    open_levels = []   # stack of (level, uid)
+    for task in tasks:
+        while open_levels and open_levels[-1][0] >= task["level"]:
+            open_levels.pop()
+        parents[task["uid"]] = open_levels[-1][1] if open_levels else None
+        open_levels.append((task["level"], task["uid"]))
+    return parents
+
+
+TaskGraph = namedtuple("TaskGraph", "duration successors indegree anchors entry exit summaries")
+
+
+def _node_uid(node):
+    return node if not isinstance(node, tuple) else node[1]
+
+
+def task_graph(tasks, skip_unknown=False):
+    """Build the node/edge structure shared by the scheduler and validator.
+
+    Node ids are the uid for work tasks and ("S", uid)/("F", uid) for the
+    start/finish of a summary. Predecessors naming no task raise
+    ValueError, or are dropped when skip_unknown is set.
+    """
+    known = {t["uid"] for t in tasks}
+    parents = task_parents(tasks)
+    summaries = {p for p in parents.values() if p is not None}
+
+    def entry(uid):
+        return ("S", uid) if uid in summaries else uid
+
+    def exit_(uid):
+        return ("F", uid) if uid in summaries else uid
+
+    duration = {}
+    successors = {}
+    for task in tasks:
+        uid = task["uid"]
+        if uid in summaries:
+            duration[("S", uid)] = duration[("F", uid)] = 0
+            successors[("S", uid)] = [("F", uid)]
+            successors[("F", uid)] = []
+        else:
+            duration[uid] = task["dur"]
+            successors[uid] = []
+
+    anchors = {}
+    for task in tasks:
+        uid = task["uid"]
+        first = entry(uid)
+        preds = task.get("preds", [])
+        for pred in preds:
+            if pred not in known:
+                if skip_unknown:
+                    continue
+                raise ValueError(f"task {uid} has unknown predecessor {pred}")
+            successors[exit_(pred)].append(first)
+        parent = parents[uid]
+        if parent is not None:
+            successors[("S", parent)].append(first)
+            successors[exit_(uid)].append(("F", parent))
+        if not preds and uid not in summaries:
+            anchors[uid] = to_workday(date.fromisoformat(task["start"]))
+
+    indegree = dict.fromkeys(duration, 0)
+    for succs in successors.values():
+        for succ in succs:
+            indegree[succ] += 1
+
+    return TaskGraph(duration, successors, indegree, anchors, entry, exit_, summaries)
+
+
+def schedule_tasks(tasks, project_start=None):
+    """Compute early/late dates, total float and criticality for every task.
+
+    Returns {uid: {"start", "finish", "dur", "early_start", "early_finish",
+    "late_start", "late_finish", "float", "critical", "summary"}} with
+    start/finish as dates (finish inclusive) and the rest in working days.
+    Tasks without predecessors start at their own "start" date, or at
+    project_start if that is later. Raises ValueError on unknown
+    predecessors or dependency cycles.
+    """
+    graph = task_graph(tasks)
+    duration, successors, indegree, anchors, entry, exit_, summaries = graph
+    origin = to_workday(project_start) if project_start else None
+
+    # Topological order (Kahn), O(nodes + edges)
+    order = [n for n, d in indegree.items() if d == 0]
+    remaining = dict(indegree)
+    for node in order:
+        for succ in successors[node]:
+            remaining[succ] -= 1
+            if remaining[succ] == 0:
+                order.append(succ)
+    if len(order) != len(duration):
+        stuck = sorted({_node_uid(n) for n, d in remaining.items() if d > 0})
+        more = f" (+{len(stuck) - 10} more)" if len(stuck) > 10 else ""
+        raise ValueError(f"dependency cycle among tasks {stuck[:10]}{more}")
+
+    # Forward pass: early start/finish (finish is exclusive)
+    floor = origin if origin is not None else min(anchors.values(), default=0)
+    early_start = {}
+    early_finish = {}
+    for node in order:
+        es = max(early_start.get(node, floor), anchors.get(node, floor), floor)
+        early_start[node] = es
+        early_finish[node] = ef = es + duration[node]
+        for succ in successors[node]:
+            early_start[succ] = max(early_start.get(succ, ef), ef)
+
+    # Backward pass: late start/finish
+    project_finish = max(early_finish.values())
+    late_finish = {}
+    late_start = {}
+    for node in reversed(order):
+        lf = min((late_start[s] for s in successors[node]), default=project_finish)
+        late_finish[node] = lf
+        late_start[node] = lf - duration[node]
+
+    spans = {
+        task["uid"]: (early_start[entry(task["uid"])], early_finish[exit_(task["uid"])],
+                      late_start[entry(task["uid"])], late_finish[exit_(task["uid"])])
+        for task in tasks
+    }
+    return _task_schedule(tasks, spans, summaries)
+
+
+def _task_schedule(tasks, spans, summaries):
+    """Schedule entries from per-task node spans (es, ef, ls, lf).
+
+    A summary spans its children: earliest start to latest finish on both
+    the early and late dates, with the least float among them. Its own
+    start/finish node times, which only bound its children, are kept
+    under "nodes" for reschedule() and the plan cache.
+    """
+    parents = task_parents(tasks)
+    children = {}
+    schedule = {}
+    # Children follow their summary in outline order, so walk it backwards
+    for task in reversed(tasks):
+        uid = task["uid"]
+        if uid in summaries:
+            kids = [schedule[child] for child in children[uid]]
+            info = _schedule_entry(min(k["early_start"] for k in kids),
+                                   max(k["early_finish"] for k in kids),
+                                   min(k["late_start"] for k in kids),
+                                   max(k["late_finish"] for k in kids),
+                                   True, slack=min(k["float"] for k in kids))
+            info["nodes"] = spans[uid]
+        else:
+            info = _schedule_entry(*spans[uid], False)
+        schedule[uid] = info
+        children.setdefault(parents[uid], []).append(uid)
+    return {task["uid"]: schedule[task["uid"]] for task in tasks}
+
+
+def _node_span(info):
+    """(es, ef, ls, lf) of a task's entry/exit nodes in the task graph."""
+    return info.get("nodes") or (info["early_start"], info["early_finish"],
+                                 info["late_start"], info["late_finish"])
+
+
+def _schedule_entry(es, ef, ls, lf, summary, slack=None):
+    if slack is None:
+        slack = ls - es
+    return {
+        "start": from_workday(es),
+        "finish": from_workday(max(ef - 1, es)),
+        "dur": ef - es,
+        "early_start": es,
+        "early_finish": ef,
+        "late_start": ls,
+        "late_finish": lf,
+        "float": slack,
+        "critical": slack == 0,
+        "summary": summary,
+    }
+
+
+def _node_times(graph, schedule):
+    """Per-node (es, ef, ls, lf) recovered from a task-level schedule."""
+    times = {}
+    for uid, info in schedule.items():
+        if uid in graph.summaries:
+            es, ef, ls, lf = _node_span(info)
+            times[("S", uid)] = [es, es, ls, ls]
+            times[("F", uid)] = [ef, ef, lf, lf]
+        else:
+            times[uid] = [info["early_start"], info["early_finish"],
+                          info["late_start"], info["late_finish"]]
+    return times
+
+
+def _closure(seeds, edges):
+    """Every node reachable from seeds through edges, seeds included."""
+    seen = set(seeds)
+    stack = list(seen)
+    while stack:
+        for nxt in edges[stack.pop()]:
+            if nxt not in seen:
+                seen.add(nxt)
+                stack.append(nxt)
+    return seen
+
+
+def _ordered(nodes, edges):
+    """Topological order of the subgraph induced by nodes (Kahn)."""
+    indegree = dict.fromkeys(nodes, 0)
+    for node in nodes:
+        for nxt in edges[node]:
+            if nxt in indegree:
+                indegree[nxt] += 1
+    order = [n for n, d in indegree.items() if d == 0]
+    for node in order:
+        for nxt in edges[node]:
+            if nxt in indegree:
+                indegree[nxt] -= 1
+                if indegree[nxt] == 0:
+                    order.append(nxt)
+    return order
+
+
+def reschedule(tasks, previous, changed, project_start=None):
+    """Update a schedule after the tasks in `changed` moved or changed length.
+
+    `previous` is the schedule_tasks() result for the same outline and
+    links; only durations, typed starts and non-date fields may differ.
+    Early dates are recomputed for the successors reachable from the
+    changed tasks, late dates for the predecessors that reach a task
+    whose duration changed; every other late date shifts by however much
+    the project finish moved. Falls back to schedule_tasks() when a new
+    earliest anchor moves the whole plan.
+
+    Returns (schedule, uids whose start, finish or duration changed).
+    """
+    graph = task_graph(tasks)
+    origin = to_workday(project_start) if project_start else None
+    floor = origin if origin is not None else min(graph.anchors.values(), default=0)
+    times = _node_times(graph, previous)
+    if origin is None and floor != min(t[0] for t in times.values()):
+        schedule = schedule_tasks(tasks, project_start)
+        return schedule, {uid for uid in schedule if _moved(schedule[uid], previous[uid])}
+
+    predecessors = {node: [] for node in graph.duration}
+    for node, succs in graph.successors.items():
+        for succ in succs:
+            predecessors[succ].append(node)
+
+    # Forward pass over everything downstream of the changed tasks
+    downstream = _closure([graph.entry(uid) for uid in changed], graph.successors)
+    for node in _ordered(downstream, graph.successors):
+        es = max(floor, graph.anchors.get(node, floor),
+                 max((times[p][1] for p in predecessors[node]), default=floor))
+        times[node][0], times[node][1] = es, es + graph.duration[node]
+
+    # Backward pass over everything upstream of a changed duration
+    finish_before = max(info["early_finish"] for info in previous.values())
+    project_finish = max(t[1] for t in times.values())
+    shift = project_finish - finish_before
+    resized = [uid for uid in changed if uid not in graph.summaries
+               and graph.duration[uid] != previous[uid]["dur"]]
+    upstream = _closure(resized, predecessors)
+    if shift:
+        for node, t in times.items():
+            if node not in upstream:
+                t[2] += shift
+                t[3] += shift
+    for node in _ordered(upstream, predecessors):
+        lf = min((times[s][2] for s in graph.successors[node]), default=project_finish)
+        times[node][2], times[node][3] = lf - graph.duration[node], lf
+
+    spans = {}
+    for task in tasks:
+        uid = task["uid"]
+        first, last = times[graph.entry(uid)], times[graph.exit(uid)]
+        spans[uid] = (first[0], last[1], first[2], last[3])
+    schedule = _task_schedule(tasks, spans, graph.summaries)
+    return schedule, {uid for uid in schedule if _moved(schedule[uid], previous[uid])}
+
+
+def _moved(new, old):
+    return (new["early_start"], new["early_finish"]) != (old["early_start"], old["early_finish"])
+
+
+def summary_uids(tasks):
+    """UIDs of tasks that have at least one child in the outline."""
+    return {p for p in task_parents(tasks).values() if p is not None}
+
+
+def critical_path(tasks, schedule):
+    """Critical work tasks in early-start order."""
+    critical = [t for t in tasks
+                if schedule[t["uid"]]["critical"] and not schedule[t["uid"]]["summary"]]
+    return sorted(critical, key=lambda t: schedule[t["uid"]]["early_start"])
+
+
+def apply_schedule(tasks, schedule):
+    """Copy of tasks with start/finish/dur replaced by the computed values."""
+    return [
+        dict(task,
+             start=schedule[task["uid"]]["start"].isoformat(),
+             finish=schedule[task["uid"]]["finish"].isoformat(),
+             dur=schedule[task["uid"]]["dur"])
+        for task in tasks
+    ]
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  RESOURCE LOADING
+# ══════════════════════════════════════════════════════════════════════
+#
+# Every assignment is Units 1 against MaxUnits 1.0 (see build_assignments
+# and build_resources), so a resource's load on a working day is simply
+# the number of its tasks in progress. Loads come from one sorted sweep
+# over task start/end events per resource: O(n log n) in assignments,
+# independent of how many days the plan spans.
+
+def resource_spans(tasks, schedule=None):
+    """res uid -> [(first, last, task uid)] working-day spans, last exclusive.
+
+    Uses the computed dates from schedule when given, else the typed ones.
+    Summary tasks and zero-length tasks carry no load.
+    """
+    summaries = summary_uids(tasks)
+    by_resource = {}
+    for task in tasks:
+        uid = task["uid"]
+        if not task.get("res") or uid in summaries:
+            continue
+        if schedule is not None:
+            first, last = schedule[uid]["early_start"], schedule[uid]["early_finish"]
+        else:
+            first = to_workday(date.fromisoformat(task["start"]))
+            last = to_workday(date.fromisoformat(task["finish"]) + timedelta(days=1))
+        if last > first:
+            by_resource.setdefault(task["res"], []).append((first, last, uid))
+    return by_resource
+
+
+def _sweep(spans):
+    """Yield (first, last, active uids) for each stretch of constant load.
+
+    active is the live set; copy it if it must outlive the iteration.
+    """
+    events = sorted([(first, 1, uid) for first, _, uid in spans]
+                    + [(last, -1, uid) for _, last, uid in spans])
+    active = set()
+    for i, (day, step, uid) in enumerate(events):
+        if step > 0:
+            active.add(uid)
+        else:
+            active.discard(uid)
+        if active and i + 1 < len(events) and events[i + 1][0] != day:
+            yield day, events[i + 1][0], active
+
+
+def resource_loading(spans_by_resource):
+    """res uid -> [(first, last, load)] runs of constant non-zero load."""
+    loading = {}
+    for res, spans in spans_by_resource.items():
+        runs = []
+        for first, last, active in _sweep(spans):
+            load = len(active)
+            if runs and runs[-1][1] == first and runs[-1][2] == load:
+                runs[-1] = (runs[-1][0], last, load)
+            else:
+                runs.append((first, last, load))
+        loading[res] = runs
+    return loading
+
+
+def over_allocations(spans_by_resource):
+    """Windows where a resource holds more than one task at once.
+
+    Returns dicts with resource, first, last (working-day indices, last
+    exclusive), peak load and the uids involved.
+    """
+    windows = []
+    for res, spans in spans_by_resource.items():
+        window = None
+        for first, last, active in _sweep(spans):
+            if len(active) < 2:
+                continue
+            if window is not None and window["last"] == first:
+                window["last"] = last
+                window["peak"] = max(window["peak"], len(active))
+                window["uids"].update(active)
+            else:
+                window = {"resource": res, "first": first, "last": last,
+                          "peak": len(active), "uids": set(active)}
+                windows.append(window)
+    return windows
+
+
+def _free_slot(busy, start, length, latest):
+    """Earliest day in [start, latest] where length days are free, or None.
+
+    busy is a pair of parallel sorted lists (starts, ends) of disjoint
+    booked intervals.
+    """
+    starts, ends = busy
+    i = bisect_right(starts, start) - 1
+    if i >= 0 and ends[i] > start:
+        start = ends[i]
+    i += 1
+    while i < len(starts) and starts[i] < start + length:
+        start = ends[i]
+        i += 1
+    return start if start <= latest else None
+
+
+def _book(busy, first, last):
+    """Merge [first, last) into the disjoint interval lists."""
+    starts, ends = busy
+    lo = bisect_left(ends, first)
+    hi = bisect_right(starts, last)
+    if lo < hi:
+        first = min(first, starts[lo])
+        last = max(last, ends[hi - 1])
+    starts[lo:hi] = [first]
+    ends[lo:hi] = [last]
+
+
+def level_resources(tasks, schedule):
+    """Delay non-critical tasks within their total float to clear over-allocations.
+
+    Tasks are placed in dependency order, earliest start then least float
+    first, each at the first working day that its (already placed)
+    predecessors and its resource allow, but never past its late start,
+    so the project finish does not move. A task that cannot fit stays at
+    its earliest start and is listed as unresolved.
+
+    Returns (schedule, unresolved uids), the schedule in schedule_tasks()
+    shape with float measured against the unchanged late dates.
+    """
+    graph = task_graph(tasks)
+    res_of = {t["uid"]: t.get("res") for t in tasks}
+
+    def floor(node):
+        # never earlier than the unleveled schedule; a summary's finish
+        # node sits at the summary's early finish
+        es, ef, _, _ = _node_span(schedule[_node_uid(node)])
+        return ef if node == ("F", _node_uid(node)) else es
+
+    def key(node):
+        info = schedule[_node_uid(node)]
+        return info["early_start"], info["float"]
+
+    remaining = dict(graph.indegree)
+    ready = []
+    for seq, (node, degree) in enumerate(remaining.items()):
+        if degree == 0:
+            heappush(ready, (*key(node), seq, node))
+    seq = len(remaining)
+
+    earliest = {}
+    placed = {}
+    busy = {}
+    unresolved = []
+    while ready:
+        node = heappop(ready)[-1]
+        uid = _node_uid(node)
+        days = graph.duration[node]
+        start = max(earliest.get(node, 0), floor(node))
+        res = res_of.get(uid) if not isinstance(node, tuple) else None
+        if res and days > 0:
+            booked = busy.setdefault(res, ([], []))
+            slot = _free_slot(booked, start, days, schedule[uid]["late_start"])
+            if slot is None:
+                unresolved.append(uid)
+            else:
+                start = slot
+            _book(booked, start, start + days)
+        placed[node] = start
+        finish = start + days
+        for succ in graph.successors[node]:
+            earliest[succ] = max(earliest.get(succ, finish), finish)
+            remaining[succ] -= 1
+            if remaining[succ] == 0:
+                heappush(ready, (*key(succ), seq, succ))
+                seq += 1
+
+    spans = {}
+    for task in tasks:
+        uid = task["uid"]
+        _, _, ls, lf = _node_span(schedule[uid])
+        last_node = graph.exit(uid)
+        spans[uid] = (placed[graph.entry(uid)],
+                      placed[last_node] + graph.duration[last_node], ls, lf)
+    return _task_schedule(tasks, spans, graph.summaries), unresolved
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  PLAN VALIDATION
+# ══════════════════════════════════════════════════════════════════════
+#
+# validate_plan() indexes the plan once (UID -> task, outline intervals,
+# the task_graph() adjacency) and runs every check in one pass over it:
+#
+#   error    duplicate-uid, dangling-pred, unknown-resource,
+#            summary-link (a link between a summary and its own subtree),
+#            cycle (one issue per strongly connected component)
+#   warning  date-order (typed pred finish must be before succ start;
+#            finish dates are inclusive, so the same day is an overlap),
+#            inverted-dates (finish before start), over-allocation
+#            (a resource on two or more tasks at once, per window)
+#
+# Everything is linear apart from the per-resource sort in the
+# over-allocation sweep (see RESOURCE LOADING), which runs on typed dates.
+
+VALIDATION_ERRORS = {"duplicate-uid", "dangling-pred", "unknown-resource",
+                     "summary-link", "cycle"}
+
+
+def _issue(check, uids, message, **extra):
+    severity = "error" if check in VALIDATION_ERRORS else "warning"
+    return dict(check=check, severity=severity, uids=list(uids), message=message, **extra)
+
+
+def _outline_spans(tasks):
+    """uid -> (first, end) row positions of the task's subtree (end exclusive)."""
+    spans = {}
+    open_levels = []   # stack of (level, uid, position)
+    for position, task in enumerate(tasks):
+        while open_levels and open_levels[-1][0] >= task["level"]:
+            _, uid, first = open_levels.pop()
+            spans[uid] = (first, position)
+        open_levels.append((task["level"], task["uid"], position))
+    for _, uid, first in open_levels:
+        spans[uid] = (first, len(tasks))
+    return spans
+
+
+def _strong_components(successors):
+    """Cyclic strongly connected components (Tarjan, iterative)."""
+    index = {}
+    low = {}
+    stack = []
+    on_stack = set()
+    cyclic = []
+    for root in successors:
+        if root in index:
+            continue
+        index[root] = low[root] = len(index)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(successors[root]))]
+        while work:
+            node, edges = work[-1]
+            for succ in edges:
+                if succ not in index:
+                    index[succ] = low[succ] = len(index)
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(successors[succ])))
+                    break
+                if succ in on_stack:
+                    low[node] = min(low[node], index[succ])
+            else:
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[node])
+                if low[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in successors[node]:
+                        cyclic.append(component)
+    return cyclic
+
+
+def validate_plan(tasks, resources=RESOURCES):
+    """Check a plan's links, outline, dates and assignments.
+
+    Returns a JSON-serializable report: {"tasks", "links", "errors",
+    "warnings", "issues": [{"check", "severity", "uids", "message", ...}]}.
+    """
+    issues = []
+
+    # UID index; later duplicates are reported and left out of the graph
+    by_uid = {}
+    for task in tasks:
+        if task["uid"] in by_uid:
+            issues.append(_issue("duplicate-uid", [task["uid"]],
+                                 f"UID {task['uid']} is used by more than one task"))
+        else:
+            by_uid[task["uid"]] = task
+    indexed = list(by_uid.values())
+
+    known_resources = {r["uid"] for r in resources}
+    spans = _outline_spans(indexed)
+    links = 0
+    for task in indexed:
+        uid = task["uid"]
+        first, end = spans[uid]
+        start = date.fromisoformat(task["start"])
+        if date.fromisoformat(task["finish"]) < start:
+            issues.append(_issue("inverted-dates", [uid],
+                                 f"task {uid} finishes ({task['finish']}) before it "
+                                 f"starts ({task['start']})"))
+        if task.get("res") and task["res"] not in known_resources:
+            issues.append(_issue("unknown-resource", [uid],
+                                 f"task {uid} is assigned to unknown resource {task['res']}"))
+        for pred in task.get("preds", []):
+            links += 1
+            if pred not in by_uid:
+                issues.append(_issue("dangling-pred", [uid, pred],
+                                     f"task {uid} depends on missing task {pred}"))
+                continue
+            pred_first, pred_end = spans[pred]
+            if first <= pred_first < end or pred_first <= first < pred_end:
+                issues.append(_issue("summary-link", [uid, pred],
+                                     f"task {uid} and its predecessor {pred} are in "
+                                     f"the same outline branch"))
+            pred_finish = by_uid[pred]["finish"]
+            if date.fromisoformat(pred_finish) >= start:
+                issues.append(_issue("date-order", [pred, uid],
+                                     f"task {uid} starts {task['start']} but predecessor "
+                                     f"{pred} finishes {pred_finish}"))
+
+    graph = task_graph(indexed, skip_unknown=True)
+    for component in _strong_components(graph.successors):
+        uids = sorted({_node_uid(node) for node in component})
+        listed = ", ".join(map(str, uids[:10])) + (", ..." if len(uids) > 10 else "")
+        issues.append(_issue("cycle", uids,
+                             f"dependency cycle through {len(uids)} tasks ({listed})"))
+
+    for window in over_allocations(resource_spans(indexed)):
+        first, last = from_workday(window["first"]), from_workday(window["last"] - 1)
+        issues.append(_issue(
+            "over-allocation", sorted(window["uids"]),
+            f"resource {window['resource']} carries {window['peak']} tasks at once "
+            f"from {first} to {last}",
+            resource=window["resource"], start=first.isoformat(),
+            finish=last.isoformat(), peak=window["peak"]))
+
+    errors = sum(1 for i in issues if i["severity"] == "error")
+    return {
+        "tasks": len(tasks),
+        "links": links,
+        "errors": errors,
+        "warnings": len(issues) - errors,
+        "issues": issues,
+    }
+
+
 # ══════════════════════════════════════════════════════════════════════
 #  XML BUILDER
 # ══════════════════════════════════════════════════════════════════════
 
 def _se(parent, tag, text=None):
-    """SubElement shorthand."""
+    """SubElement shorthand; also accepts an XmlStream node as parent."""
+    if isinstance(parent, StreamNode):
+        return parent.stream.element(parent.depth + 1, tag, text)
     el = SubElement(parent, tag)
     if text is not None:
         el.text = str(text)
     return el
 
 
+# ══════════════════════════════════════════════════════════════════════
+#  STREAMING WRITER
+# ══════════════════════════════════════════════════════════════════════
+#
+# The builders below only ever append to the most recently opened element
+# or one of its ancestors, so an element can be written out as soon as it
+# is created: opening a child at depth d closes every open element deeper
+# than d-1. Nothing but the open-element stack is kept in memory. With
+# pretty=True the output is byte-identical to indent(root, "  ") followed
+# by ElementTree.write(..., xml_declaration=True).
+
+StreamNode = namedtuple("StreamNode", "stream depth")
+
+_ATTR_ESCAPES = {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#09;"}
+
+
+def escape(data, entities=None):
+    """Same as xml.sax.saxutils.escape, whose import pulls in urllib.request."""
+    data = data.replace("&", "&amp;").replace(">", "&gt;").replace("<", "&lt;")
+    for char, entity in (entities or {}).items():
+        data = data.replace(char, entity)
+    return data
+
+
+class _Newlines(dict):
+    """depth -> newline plus indentation string, built on first use."""
+
+    def __init__(self, space):
+        super().__init__()
+        self.space = space
+
+    def __missing__(self, depth):
+        self[depth] = value = "\n" + self.space * depth
+        return value
+
+
+class XmlStream:
+    """Incremental XML writer driven through _se()."""
+
+    def __init__(self, fh, pretty=True, space="  ", track=()):
+        self.fh = fh
+        self.pretty = pretty
+        self.space = space
+        self.open_tags = []       # stack of open container tags
+        self.has_children = []    # parallel stack: child written yet?
+        self.open_spans = []      # parallel stack: span of a tracked tag, else None
+        self.newlines = _Newlines(space)
+        self.position = 0         # characters written so far
+        self.spans = {tag: [] for tag in track}   # tag -> [[start, end], ...]
+
+    def write(self, text):
+        self.fh.write(text)
+        self.position += len(text)
+
+    def root(self, tag, attrs=None):
+        self.write("<?xml version='1.0' encoding='utf-8'?>\n")
+        return self.element(0, tag, None, attrs)
+
+    def element(self, depth, tag, text=None, attrs=None):
+        if len(self.open_tags) > depth:
+            self._close_to(depth)
+        prefix = ""
+        if self.has_children:
+            if not self.has_children[-1]:
+                self.write(">")       # the parent's start tag, outside any span
+                self.has_children[-1] = True
+            if self.pretty:
+                prefix = self.newlines[depth]
+        head = prefix + "<" + tag
+        if attrs:
+            head += "".join(f' {k}="{escape(str(v), _ATTR_ESCAPES)}"'
+                            for k, v in attrs.items())
+        spans = self.spans.get(tag)
+        span = None
+        if spans is not None:
+            # a span covers the element and the indentation before it
+            span = [self.position, None]
+            spans.append(span)
+        if text is None:
+            self.write(head)
+            self.open_tags.append(tag)
+            self.has_children.append(False)
+            self.open_spans.append(span)
+        else:
+            text = str(text)
+            if text:
+                self.write(f"{head}>{escape(text)}</{tag}>")
+            else:
+                self.write(head + " />")
+            if span:
+                span[1] = self.position
+        return StreamNode(self, depth)
+
+    def close(self):
+        self._close_to(0)
+
+    def _close_to(self, depth):
+        while len(self.open_tags) > depth:
+            depth_of_tag = len(self.open_tags) - 1
+            tag = self.open_tags.pop()
+            if self.has_children.pop():
+                end = self.newlines[depth_of_tag] if self.pretty else ""
+                self.write(f"{end}</{tag}>")
+            else:
+                self.write(" />")
+            span = self.open_spans.pop()
+            if span:
+                span[1] = self.position
+
+
 def build_calendar(parent):
     """Standard 5-day work-week calendar."""
     calendars = _se(parent, "Calendars")
@@ -375,38 +1321,44 @@ def build_calendar(parent):
         _se(wd, "DayWorking", "0")
 
 
-def build_tasks(parent):
-    """Build <Tasks> element from TASKS list."""
+def build_tasks(parent, tasks=TASKS):
+    """Build <Tasks> element from a task list (TASKS by default)."""
     tasks_el = _se(parent, "Tasks")
+    summaries = summary_uids(tasks)
+
+    for task in tasks:
+        _build_task(tasks_el, task, summaries)
 
-    for task in TASKS:
-        t = _se(tasks_el, "Task")
-        _se(t, "UID", str(task["uid"]))
-        _se(t, "ID", str(task["uid"]))
-        _se(t, "Name", task["name"])
-        _se(t, "OutlineLevel", str(task["level"]))
-        _se(t, "Start", f"{task['start']}T08:00:00")
-        _se(t, "Finish", f"{task['finish']}T17:00:00")
-        _se(t, "Duration", f"PT{task['dur'] * 8}H0M0S")
-        _se(t, "DurationFormat", "7")   # days
-        _se(t, "PercentComplete", str(task["pct"]))
-        _se(t, "Summary", "1" if task["level"] == 1 else "0")
-        _se(t, "Type", "1")             # Fixed duration
-        _se(t, "ConstraintType", "0")   # As soon as possible
-
-        for pred_uid in task.get("preds", []):
-            pl = _se(t, "PredecessorLink")
-            _se(pl, "PredecessorUID", str(pred_uid))
-            _se(pl, "Type", "1")        # Finish-to-Start
-            _se(pl, "CrossProject", "0")
-            _se(pl, "LinkLag", "0")
-            _se(pl, "LagFormat", "7")
-
-
-def build_resources(parent):
+
+def _build_task(tasks_el, task, summaries):
+    """One <Task> with its predecessor links."""
+    t = _se(tasks_el, "Task")
+    _se(t, "UID", str(task["uid"]))
+    _se(t, "ID", str(task["uid"]))
+    _se(t, "Name", task["name"])
+    _se(t, "OutlineLevel", str(task["level"]))
+    _se(t, "Start", f"{task['start']}T08:00:00")
+    _se(t, "Finish", f"{task['finish']}T17:00:00")
+    _se(t, "Duration", f"PT{task['dur'] * 8}H0M0S")
+    _se(t, "DurationFormat", "7")   # days
+    _se(t, "PercentComplete", str(task["pct"]))
+    _se(t, "Summary", "1" if task["uid"] in summaries else "0")
+    _se(t, "Type", "1")             # Fixed duration
+    _se(t, "ConstraintType", "0")   # As soon as possible
+
+    for pred_uid in task.get("preds", []):
+        pl = _se(t, "PredecessorLink")
+        _se(pl, "PredecessorUID", str(pred_uid))
+        _se(pl, "Type", "1")        # Finish-to-Start
+        _se(pl, "CrossProject", "0")
+        _se(pl, "LinkLag", "0")
+        _se(pl, "LagFormat", "7")
+
+
+def build_resources(parent, resources=RESOURCES):
     """Build <Resources> element."""
     resources_el = _se(parent, "Resources")
-    for res in RESOURCES:
+    for res in resources:
         r = _se(resources_el, "Resource")
         _se(r, "UID", str(res["uid"]))
         _se(r, "ID", str(res["uid"]))
@@ -416,12 +1368,13 @@ def build_resources(parent):
         _se(r, "MaxUnits", "1.0")
 
 
-def build_assignments(parent):
-    """Build <Assignments> linking tasks to resources."""
+def build_assignments(parent, tasks=TASKS):
+    """Build <Assignments> linking work tasks to resources."""
     assignments_el = _se(parent, "Assignments")
+    summaries = summary_uids(tasks)
     assign_uid = 1
-    for task in TASKS:
-        if task.get("res") and task["level"] > 1:
+    for task in tasks:
+        if task.get("res") and task["uid"] not in summaries:
             a = _se(assignments_el, "Assignment")
             _se(a, "UID", str(assign_uid))
             _se(a, "TaskUID", str(task["uid"]))
@@ -430,12 +1383,104 @@ def build_assignments(parent):
             assign_uid += 1
 
 
-def build_project():
-    """Build the complete Project XML."""
+def build_project(tasks=TASKS, resources=RESOURCES):
+    """Build the complete Project XML; project dates span the task list."""
     root = Element("Project")
     root.set("xmlns", NS)
+    _build_project_body(root, tasks, resources)
+    return root
+
+
+def write_project(path, tasks=TASKS, resources=RESOURCES, pretty=True):
+    """Stream the Project XML straight to path without building a tree.
+
+    Returns the file layout patch_project() needs: the character offset
+    where the header (project properties) ends and the [start, end)
+    offsets of every <Task>, in task order.
+    """
+    # newline="": LF on every platform, as ElementTree wrote it
+    with open(path, "w", encoding="utf-8", newline="", buffering=1 << 16) as fh:
+        stream = XmlStream(fh, pretty=pretty, track=("Calendars", "Task"))
+        _build_project_body(stream.root("Project", {"xmlns": NS}), tasks, resources)
+        stream.close()
+    return {"header_end": stream.spans["Calendars"][0][0], "tasks": stream.spans["Task"]}
 
-    # Project properties
+
+def patch_project(path, layout, tasks, rewrite, pretty=True):
+    """Rewrite the header and the <Task> blocks of `rewrite` uids in place.
+
+    Everything else is copied through from the file write_project() (or
+    an earlier patch) produced, so the cost is a sequential copy plus the
+    changed tasks. Returns the new layout.
+    """
+    summaries = summary_uids(tasks)
+    targets = [(i, task) for i, task in enumerate(tasks) if task["uid"] in rewrite]
+
+    head = io.StringIO()
+    stream = XmlStream(head, pretty=pretty)
+    _project_properties(stream.root("Project", {"xmlns": NS}), tasks)
+    header = head.getvalue()
+
+    # Inside <Tasks>, which already has children: blocks carry their own
+    # leading indentation, matching the spans recorded by write_project()
+    block = io.StringIO()
+    stream = XmlStream(block, pretty=pretty)
+    stream.open_tags, stream.has_children, stream.open_spans = (
+        ["Project", "Tasks"], [True, True], [None, None])
+
+    tmp = path.with_name(path.name + ".tmp")
+    written = {}   # task index -> length of its rewritten block
+    # No newline translation either way: layout offsets count raw characters
+    with open(path, encoding="utf-8", newline="") as old, \
+            open(tmp, "w", encoding="utf-8", newline="", buffering=1 << 16) as fh:
+        _copy_chars(old, None, layout["header_end"])
+        fh.write(header)
+        cursor = layout["header_end"]
+        for index, task in targets:
+            start, end = layout["tasks"][index]
+            _copy_chars(old, fh, start - cursor)
+            _copy_chars(old, None, end - start)
+            block.seek(0)
+            block.truncate()
+            _build_task(StreamNode(stream, 1), task, summaries)
+            stream._close_to(2)
+            fh.write(block.getvalue())
+            written[index] = len(block.getvalue())
+            cursor = end
+        _copy_chars(old, fh, None)
+    os.replace(tmp, path)
+
+    shift = len(header) - layout["header_end"]
+    spans = []
+    for index, (start, end) in enumerate(layout["tasks"]):
+        new_start = start + shift
+        if index in written:
+            shift += written[index] - (end - start)
+        spans.append([new_start, end + shift])
+    return {"header_end": len(header), "tasks": spans}
+
+
+def _copy_chars(src, dst, count, chunk=1 << 20):
+    """Copy (or, with dst None, skip) count characters; None means to EOF."""
+    while count is None or count > 0:
+        data = src.read(chunk if count is None else min(chunk, count))
+        if not data:
+            break
+        if dst is not None:
+            dst.write(data)
+        if count is not None:
+            count -= len(data)
+
+
+def _build_project_body(root, tasks, resources):
+    _project_properties(root, tasks)
+    build_calendar(root)
+    build_tasks(root, tasks)
+    build_resources(root, resources)
+    build_assignments(root, tasks)
+
+
+def _project_properties(root, tasks):
     _se(root, "Name", "ASPR Photo Repository - Project Plan")
     _se(root, "Title", "ASPR Photo Repository Application")
     _se(root, "Subject", "Project Schedule")
@@ -444,8 +1489,8 @@ def build_project():
     _se(root, "Manager", "Project Manager")
     _se(root, "CreationDate", datetime.now().isoformat())
     _se(root, "LastSaved", datetime.now().isoformat())
-    _se(root, "StartDate", "2026-01-06T08:00:00")
-    _se(root, "FinishDate", "2026-04-04T17:00:00")
+    _se(root, "StartDate", f"{min(t['start'] for t in tasks)}T08:00:00")
+    _se(root, "FinishDate", f"{max(t['finish'] for t in tasks)}T17:00:00")
     _se(root, "CalendarUID", "1")
     _se(root, "DefaultStartTime", "08:00:00")
     _se(root, "DefaultFinishTime", "17:00:00")
@@ -456,43 +1501,584 @@ def build_project():
     _se(root, "CurrencySymbol", "$")
     _se(root, "CurrencyDigits", "2")
 
-    build_calendar(root)
-    build_tasks(root)
-    build_resources(root)
-    build_assignments(root)
 
-    return root
+# ══════════════════════════════════════════════════════════════════════
+#  EXPORTERS  (Gantt HTML, CSV, iCalendar)
+# ══════════════════════════════════════════════════════════════════════
+#
+# Every exporter takes the same (path, tasks, schedule, resources) that
+# the XML writer uses, so one computed plan feeds all of them. Dates come
+# from tasks (typed or computed, whichever is written); float and
+# criticality always come from the schedule. Output is streamed row by
+# row and every layout step is a single pass over the tasks.
+
+PLAN_TITLE = "ASPR Photo Repository \u2014 Project Plan"
+
+BLUE_DARK = "#062E61"
+BLUE_PRIMARY = "#155197"
+GOLD = "#AA8A2A"
+CRITICAL_RED = "#C0392B"
+LIGHT_GRAY = "#F2F2F2"
+
+GANTT_LABEL_W = 320      # px for the task-name column
+GANTT_ROW_H = 20
+GANTT_AXIS_H = 36
+GANTT_CHART_W = 1400     # target px for the timeline
+GANTT_DAY_W = (0.05, 18)  # min/max px per working day
+
+GANTT_STYLE = f"""
+body {{ font-family: Calibri, Arial, sans-serif; color: #333333; margin: 1.5em; }}
+h1 {{ color: {BLUE_DARK}; font-size: 18pt; margin: 0; }}
+header p {{ color: {BLUE_PRIMARY}; margin: 0.2em 0 1em; }}
+.legend span {{ display: inline-block; margin-right: 1.5em; font-size: 9pt; }}
+.legend i {{ display: inline-block; width: 1.2em; height: 0.7em; margin-right: 0.3em; }}
+svg {{ font-size: 11px; }}
+svg .name {{ fill: #333333; }}
+svg .phase {{ fill: {BLUE_DARK}; font-weight: bold; }}
+svg .task {{ fill: {BLUE_PRIMARY}; }}
+svg .crit {{ fill: {CRITICAL_RED}; }}
+svg .done {{ fill: #000000; fill-opacity: 0.25; }}
+svg .sum {{ fill: {BLUE_DARK}; }}
+svg .mile {{ fill: {GOLD}; }}
+svg .grid {{ stroke: #DDDDDD; stroke-width: 1; }}
+svg .tick {{ fill: {BLUE_DARK}; }}
+"""
+
+
+def _axis_ticks(first, last):
+    """(workday index, label) at each month start, or each year for long plans."""
+    start, end = from_workday(first), from_workday(max(last - 1, first))
+    yearly = (end.year - start.year) > 3
+    year, month = start.year, 1 if yearly else start.month
+    ticks = []
+    while (year, month) <= (end.year, end.month):
+        day = date(year, month, 1)
+        if day >= start:
+            ticks.append((to_workday(day), str(year) if yearly else day.strftime("%b %Y")))
+        if yearly:
+            year += 1
+        else:
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return ticks
+
+
+def export_gantt_html(path, tasks, schedule, resources):
+    """Self-contained HTML page with an SVG Gantt chart, one row per task."""
+    summaries = summary_uids(tasks)
+    res_names = {r["uid"]: r["name"] for r in resources}
+    spans = [(to_workday(date.fromisoformat(t["start"])),
+              to_workday(date.fromisoformat(t["finish"]) + timedelta(days=1))) for t in tasks]
+    first = min((a for a, _ in spans), default=0)
+    last = max((b for _, b in spans), default=first + 1)
+    day_w = min(GANTT_DAY_W[1], max(GANTT_DAY_W[0], GANTT_CHART_W / max(last - first, 1)))
+    width = GANTT_LABEL_W + (last - first) * day_w + 20
+    height = GANTT_AXIS_H + len(tasks) * GANTT_ROW_H + 4
+
+    def x(day):
+        return f"{GANTT_LABEL_W + (day - first) * day_w:.1f}"
+
+    with open(path, "w", encoding="utf-8", buffering=1 << 16) as fh:
+        fh.write("<!DOCTYPE html>\n<html lang=\"en\">\n<head>\n<meta charset=\"utf-8\">\n"
+                 f"<title>{html_escape(PLAN_TITLE)}</title>\n"
+                 f"<style>{GANTT_STYLE}</style>\n</head>\n<body>\n<header>\n"
+                 f"<h1>{html_escape(PLAN_TITLE)}</h1>\n"
+                 f"<p>{from_workday(first)} \u2013 {from_workday(last - 1)} \u00b7 "
+                 f"{len(tasks)} tasks \u00b7 generated {datetime.now():%Y-%m-%d %H:%M}</p>\n"
+                 "<div class=\"legend\">"
+                 f"<span><i style=\"background:{BLUE_PRIMARY}\"></i>Task</span>"
+                 f"<span><i style=\"background:{CRITICAL_RED}\"></i>Critical path</span>"
+                 f"<span><i style=\"background:{BLUE_DARK}\"></i>Phase</span>"
+                 f"<span><i style=\"background:{GOLD}\"></i>Milestone</span>"
+                 "</div>\n</header>\n")
+        fh.write(f'<svg xmlns="http://www.w3.org/2000/svg" width="{width:.0f}" '
+                 f'height="{height}" role="img" aria-label="Gantt chart">\n')
+
+        # Axis: one label and one grid segment per tick, O(ticks)
+        ticks = _axis_ticks(first, last)
+        grid = " ".join(f"M{x(day)} {GANTT_AXIS_H - 6}V{height}" for day, _ in ticks)
+        fh.write(f'<path class="grid" d="{grid}"/>\n')
+        for day, label in ticks:
+            fh.write(f'<text class="tick" x="{float(x(day)) + 3:.1f}" y="{GANTT_AXIS_H - 12}">'
+                     f"{label}</text>\n")
+
+        bar_h = GANTT_ROW_H - 8
+        for row, (task, (start, end)) in enumerate(zip(tasks, spans)):
+            uid = task["uid"]
+            info = schedule[uid]
+            y = GANTT_AXIS_H + row * GANTT_ROW_H
+            indent = 12 * (task["level"] - 1)
+            label_class = "phase" if uid in summaries else "name"
+            who = res_names.get(task.get("res"), "")
+            tip = html_escape(f"{task['name']}\n{task['start']} \u2192 {task['finish']} "
+                              f"({task['dur']}d, {task['pct']}% complete)"
+                              f"{chr(10) + who if who else ''}\nFloat: {info['float']}d")
+            fh.write(f'<g><title>{tip}</title>'
+                     f'<text class="{label_class}" x="{4 + indent}" y="{y + GANTT_ROW_H - 6}">'
+                     f"{html_escape(task['name'][:60])}</text>")
+            if uid in summaries:
+                fh.write(f'<rect class="sum" x="{x(start)}" y="{y + 6}" '
+                         f'width="{max((end - start) * day_w, 1):.1f}" height="{bar_h // 2}"/>')
+            elif end - start <= 0 or task["dur"] == 0:
+                cx, cy = float(x(start)), y + GANTT_ROW_H / 2
+                fh.write(f'<path class="mile" d="M{cx:.1f} {cy - 6:.1f}l6 6-6 6-6-6z"/>')
+            else:
+                bar_w = max((end - start) * day_w, 1)
+                fh.write(f'<rect class="{"crit" if info["critical"] else "task"}" x="{x(start)}" '
+                         f'y="{y + 4}" width="{bar_w:.1f}" height="{bar_h}" rx="2"/>')
+                if task["pct"]:
+                    fh.write(f'<rect class="done" x="{x(start)}" y="{y + 4 + bar_h / 3:.1f}" '
+                             f'width="{bar_w * min(task["pct"], 100) / 100:.1f}" '
+                             f'height="{bar_h / 3:.1f}"/>')
+            fh.write("</g>\n")
+        fh.write("</svg>\n</body>\n</html>\n")
+
+
+CSV_COLUMNS = ("uid", "name", "level", "summary", "start", "finish", "dur", "pct",
+               "preds", "res", "late_start", "late_finish", "float", "critical")
+
+
+def export_csv(path, tasks, schedule, resources):
+    """Flat CSV, one row per task; readable back with --tasks."""
+    summaries = summary_uids(tasks)
+    res_names = {r["uid"]: r["name"] for r in resources}
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(CSV_COLUMNS)
+        for task in tasks:
+            info = schedule[task["uid"]]
+            writer.writerow([
+                task["uid"], task["name"], task["level"],
+                int(task["uid"] in summaries),
+                task["start"], task["finish"], task["dur"], task["pct"],
+                ";".join(map(str, task.get("preds", []))),
+                res_names.get(task.get("res"), ""),
+                from_workday(info["late_start"]).isoformat(),
+                from_workday(max(info["late_finish"] - 1, info["late_start"])).isoformat(),
+                info["float"], int(info["critical"]),
+            ])
+
+
+def _ics_text(value):
+    return (value.replace("\\", "\\\\").replace(";", "\\;")
+            .replace(",", "\\,").replace("\n", "\\n"))
+
+
+def _ics_line(line):
+    """Fold a content line at 75 octets (RFC 5545 3.1)."""
+    data = line.encode("utf-8")
+    if len(data) <= 75:
+        return line + "\r\n"
+    parts = []
+    limit = 75
+    while data:
+        cut = min(limit, len(data))
+        while cut < len(data) and (data[cut] & 0xC0) == 0x80:
+            cut -= 1       # never split a UTF-8 sequence
+        parts.append(data[:cut].decode("utf-8"))
+        data = data[cut:]
+        limit = 74         # continuation lines start with a space
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def export_milestones_ics(path, tasks, schedule, resources):
+    """iCalendar file with all-day events for milestones and phase completions.
+
+    Milestones are zero-duration work tasks (on their start date); every
+    summary task adds a completion event on its finish date.
+    """
+    summaries = summary_uids(tasks)
+    stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    with open(path, "w", encoding="utf-8", newline="") as fh:
+        for line in ("BEGIN:VCALENDAR", "VERSION:2.0",
+                     "PRODID:-//HHS ASPR//Photo Repository Project Plan//EN",
+                     "CALSCALE:GREGORIAN",
+                     f"X-WR-CALNAME:{_ics_text(PLAN_TITLE)} milestones"):
+            fh.write(_ics_line(line))
+        for task in tasks:
+            uid = task["uid"]
+            if uid in summaries:
+                day, summary = task["finish"], f"Complete: {task['name']}"
+            elif task["dur"] == 0:
+                day, summary = task["start"], f"Milestone: {task['name']}"
+            else:
+                continue
+            day = date.fromisoformat(day)
+            details = f"Task {uid}, total float {schedule[uid]['float']}d"
+            for line in ("BEGIN:VEVENT",
+                         f"UID:task-{uid}@aspr-photo-repository",
+                         f"DTSTAMP:{stamp}",
+                         f"DTSTART;VALUE=DATE:{day:%Y%m%d}",
+                         f"DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}",
+                         f"SUMMARY:{_ics_text(summary)}",
+                         f"DESCRIPTION:{_ics_text(details)}",
+                         "TRANSP:TRANSPARENT",
+                         "END:VEVENT"):
+                fh.write(_ics_line(line))
+        fh.write(_ics_line("END:VCALENDAR"))
+
+
+EXPORTERS = {
+    "html": export_gantt_html,
+    "csv": export_csv,
+    "ics": export_milestones_ics,
+}
+FORMATS = ("xml", *EXPORTERS)
+
+
+# ══════════════════════════════════════════════════════════════════════
+#  PLAN CACHE  (incremental rebuilds)
+# ══════════════════════════════════════════════════════════════════════
+#
+# Each build leaves a sidecar next to the XML with the input plan, the
+# computed schedule and the file layout from write_project(). With
+# --incremental the next run diffs its input against it. If only
+# durations, typed starts, progress or names changed, it reschedules just
+# the affected subgraph and patches those <Task> blocks into the existing
+# file. Any change to the outline, links, assignments or resources, a
+# different output mode, or an XML file touched since, means a full build.
+
+PLAN_CACHE_VERSION = 2
+STRUCTURAL_FIELDS = ("uid", "level", "preds", "res")
+
+
+def plan_cache_path(out):
+    return out.with_name(f".{out.name}.cache.json")
+
+
+def save_plan_cache(out, tasks, resources, schedule, layout, pretty, keep_dates):
+    stat = out.stat()
+    data = {
+        "version": PLAN_CACHE_VERSION,
+        "mode": {"pretty": pretty, "keep_dates": keep_dates},
+        "xml": dict(layout, size=stat.st_size, mtime_ns=stat.st_mtime_ns),
+        "resources": resources,
+        "tasks": tasks,
+        "schedule": [[uid, *_node_span(info)] for uid, info in schedule.items()],
+    }
+    plan_cache_path(out).write_text(json.dumps(data, separators=(",", ":")),
+                                    encoding="utf-8")
+
+
+def load_plan_cache(out, pretty, keep_dates):
+    """The sidecar for out, or None if missing, stale or for another mode."""
+    try:
+        data = json.loads(plan_cache_path(out).read_text(encoding="utf-8"))
+        stat = out.stat()
+    except (OSError, ValueError):
+        return None
+    if (data.get("version") != PLAN_CACHE_VERSION
+            or data["mode"] != {"pretty": pretty, "keep_dates": keep_dates}
+            or (data["xml"]["size"], data["xml"]["mtime_ns"])
+            != (stat.st_size, stat.st_mtime_ns)):
+        return None
+    return data
+
+
+def cached_schedule(data, tasks):
+    spans = {uid: tuple(span) for uid, *span in data["schedule"]}
+    return _task_schedule(tasks, spans, summary_uids(tasks))
+
+
+def plan_changes(tasks, resources, data):
+    """UIDs whose inputs differ from the cached plan.
+
+    None when the change is structural (see STRUCTURAL_FIELDS) and needs
+    a full build.
+    """
+    cached = data["tasks"]
+    if len(cached) != len(tasks) or data["resources"] != resources:
+        return None
+    changed = set()
+    for task, old in zip(tasks, cached):
+        if task != old:
+            if any(task.get(f) != old.get(f) for f in STRUCTURAL_FIELDS):
+                return None
+            changed.add(task["uid"])
+    return changed
 
 
 # ══════════════════════════════════════════════════════════════════════
 #  MAIN
 # ══════════════════════════════════════════════════════════════════════
 
-if __name__ == "__main__":
+CRITICAL_PATH_LISTED = 40
+
+
+def print_schedule(tasks, schedule):
+    """Print the critical path and a float summary."""
+    path = critical_path(tasks, schedule)
+    work = [t for t in tasks if not schedule[t["uid"]]["summary"]]
+    floats = [schedule[t["uid"]]["float"] for t in work]
+    first = min(s["early_start"] for s in schedule.values())
+    last = max(s["early_finish"] for s in schedule.values())
+
+    print(f"  Schedule: {from_workday(first)} \u2192 {from_workday(last - 1)} "
+          f"({last - first} working days)")
+    print(f"  Critical path: {len(path)} of {len(work)} tasks")
+    for task in path[:CRITICAL_PATH_LISTED]:
+        info = schedule[task["uid"]]
+        print(f"    {task['uid']:>5}  {info['start']} \u2192 {info['finish']}  {task['name']}")
+    if len(path) > CRITICAL_PATH_LISTED:
+        print(f"    ... {len(path) - CRITICAL_PATH_LISTED} more")
+    if floats:
+        print(f"  Total float: min {min(floats)}d, "
+              f"max {max(floats)}d, mean {sum(floats) / len(floats):.1f}d")
+    moved = [t for t in tasks
+             if (t["start"], t["finish"]) != (schedule[t["uid"]]["start"].isoformat(),
+                                              schedule[t["uid"]]["finish"].isoformat())]
+    if moved:
+        print(f"  Rescheduled: {len(moved)} tasks differ from their typed dates")
+
+
+VALIDATION_LISTED = 20
+
+
+def print_validation(report):
+    """One line per check, then the first errors in full (see --report for all)."""
+    counts = {}
+    for issue in report["issues"]:
+        counts[issue["check"]] = counts.get(issue["check"], 0) + 1
+    tag = "[ERR]" if report["errors"] else "[OK]"
+    print(f"  {tag} Validation: {report['tasks']} tasks, {report['links']} links, "
+          f"{report['errors']} errors, {report['warnings']} warnings")
+    for check, count in sorted(counts.items()):
+        print(f"    {check}: {count}")
+    shown = [i for i in report["issues"] if i["severity"] == "error"]
+    for issue in shown[:VALIDATION_LISTED]:
+        print(f"    {issue['severity']}: {issue['message']}")
+    if len(shown) > VALIDATION_LISTED:
+        print(f"    ... {len(shown) - VALIDATION_LISTED} more")
+
+
+def loading_report(resources, spans_by_resource):
+    """JSON-serializable loading histogram: runs and over-allocation per resource."""
+    loading = resource_loading(spans_by_resource)
+    windows = {}
+    for window in over_allocations(spans_by_resource):
+        windows.setdefault(window["resource"], []).append(window)
+
+    def day(index):
+        return from_workday(index).isoformat()
+
+    report = []
+    for res in resources:
+        runs = loading.get(res["uid"], [])
+        report.append({
+            "uid": res["uid"],
+            "name": res["name"],
+            "busy_days": sum(last - first for first, last, _ in runs),
+            "peak": max((load for _, _, load in runs), default=0),
+            "over_allocated_days": sum(last - first for first, last, load in runs if load > 1),
+            "runs": [{"start": day(first), "finish": day(last - 1), "load": load}
+                     for first, last, load in runs],
+            "over_allocations": [{"start": day(w["first"]), "finish": day(w["last"] - 1),
+                                  "peak": w["peak"], "uids": sorted(w["uids"])}
+                                 for w in windows.get(res["uid"], [])],
+        })
+    return report
+
+
+def print_loading(report):
+    """One line per assigned resource: busy days, peak load, over-allocated days."""
+    over = [r for r in report if r["over_allocated_days"]]
+    print(f"  Resource loading: {len(over)} of "
+          f"{sum(1 for r in report if r['busy_days'])} resources over-allocated")
+    for res in over:
+        windows = len(res["over_allocations"])
+        print(f"    {res['name']:<24} peak {res['peak']}  "
+              f"{res['over_allocated_days']:>4}d over in {windows} "
+              f"window{'s' if windows != 1 else ''}  ({res['busy_days']}d booked)")
+
+
+def _formats(value):
+    formats = tuple(dict.fromkeys(f.strip() for f in value.split(",") if f.strip()))
+    unknown = [f for f in formats if f not in FORMATS]
+    if unknown or not formats:
+        raise argparse.ArgumentTypeError(
+            f"choose from {', '.join(FORMATS)} (got {value!r})")
+    return formats
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Generate the MS Project XML schedule for the ASPR Photo Repository.")
+    parser.add_argument(
+        "--keep-dates", action="store_true",
+        help="write the typed start/finish/dur values instead of the computed schedule")
+    parser.add_argument(
+        "--compact", action="store_true",
+        help="write the XML without indentation")
+    parser.add_argument(
+        "--tasks", metavar="FILE",
+        help="load tasks from a .csv, .json or .jsonl file instead of TASKS")
+    parser.add_argument(
+        "--resources", metavar="FILE",
+        help="load resources from a .csv, .json or .jsonl file instead of RESOURCES")
+    parser.add_argument(
+        "--report", metavar="FILE", type=Path,
+        help="write the plan validation report as JSON")
+    parser.add_argument(
+        "--check", action="store_true",
+        help="validate the plan and stop without writing the XML")
+    parser.add_argument(
+        "--level", action="store_true",
+        help="delay non-critical tasks within their float to clear resource over-allocation")
+    parser.add_argument(
+        "--loading", metavar="FILE", type=Path,
+        help="write the per-resource loading histogram as JSON")
+    parser.add_argument(
+        "--formats", type=_formats, default=("xml",), metavar="LIST",
+        help=f"comma-separated outputs from {', '.join(FORMATS)}; non-XML "
+             "files are written next to the XML (default: xml)")
+    parser.add_argument(
+        "-i", "--incremental", action="store_true",
+        help="reschedule and rewrite only the tasks changed since the last build")
+    parser.add_argument(
+        "-o", "--output", metavar="FILE", type=Path, default=OUT,
+        help=f"output path (default: {OUT.relative_to(ROOT)})")
+    args = parser.parse_args(argv)
+    if args.level and args.keep_dates:
+        parser.error("--level reschedules tasks and cannot be combined with --keep-dates")
+    return args
+
+
+def load_plan(args):
+    """(tasks, resources) from the files named on the command line, or the defaults."""
+    resources = load_resources(args.resources) if args.resources else RESOURCES
+    tasks = load_tasks(args.tasks, resources) if args.tasks else TASKS
+    if not args.tasks and args.resources:
+        # The built-in tasks reference resources by UID; check they still exist
+        known = {r["uid"] for r in resources}
+        missing = sorted({t["res"] for t in tasks if t.get("res") and t["res"] not in known})
+        if missing:
+            raise ValueError(f"{args.resources}: TASKS assign unknown resources {missing}")
+    return tasks, resources
+
+
+def export_path(out, fmt):
+    """Where a --formats export goes: next to the XML, with fmt as suffix."""
+    return out.with_suffix(f".{fmt}")
+
+
+def output_paths(args):
+    """Every file this run may write, by role."""
+    paths = {"report": args.report, "loading": args.loading}
+    for fmt in args.formats:
+        paths[fmt] = args.output if fmt == "xml" else export_path(args.output, fmt)
+    return {role: path for role, path in paths.items() if path is not None}
+
+
+def check_output_paths(args):
+    """Raise ValueError if an output would overwrite a --tasks/--resources file."""
+    inputs = {Path(p).resolve(): flag for flag, p in
+              (("--tasks", args.tasks), ("--resources", args.resources)) if p}
+    for role, path in output_paths(args).items():
+        flag = inputs.get(Path(path).resolve())
+        if flag:
+            raise ValueError(f"the {role} output {path} would overwrite the {flag} "
+                             f"file; choose another -o/--output")
+
+
+def main(argv=None):
+    args = parse_args(argv)
     print("=" * 60)
     print("  ASPR Photo Repository \u2014 Project Plan XML Generation")
     print("=" * 60)
     print()
 
-    root = build_project()
-    indent(root, space="  ")
+    try:
+        check_output_paths(args)
+        plan_tasks, resources = load_plan(args)
+    except (OSError, ValueError) as exc:
+        print(f"  [ERR] {exc}")
+        return 1
 
-    OUT.parent.mkdir(parents=True, exist_ok=True)
-    tree = ElementTree(root)
-    tree.write(str(OUT), encoding="utf-8", xml_declaration=True)
+    # Always validated: a changed duration or date can raise new warnings
+    # even when the outline, links and assignments are as last built
+    report = validate_plan(plan_tasks, resources)
+    print_validation(report)
+    if args.report:
+        args.report.parent.mkdir(parents=True, exist_ok=True)
+        args.report.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"  Report: {args.report}")
+    if report["errors"]:
+        return 1
+    if args.check:
+        return 0
 
-    size_kb = OUT.stat().st_size / 1024
-    work_tasks = [t for t in TASKS if t["level"] > 1]
-    summary_tasks = [t for t in TASKS if t["level"] == 1]
+    out = args.output
+    pretty = not args.compact
+    cache = None
+    changed = None
+    if args.incremental and not args.level and "xml" in args.formats:
+        cache = load_plan_cache(out, pretty, args.keep_dates)
+        changed = plan_changes(plan_tasks, resources, cache) if cache else None
+    if changed is not None:
+        print(f"  [OK] Incremental: {len(changed)} tasks changed since the last build")
+    print()
+
+    unresolved = None
+    if changed is None:
+        schedule = schedule_tasks(plan_tasks)
+    else:
+        schedule, moved = reschedule(plan_tasks, cached_schedule(cache, plan_tasks), changed)
+    if args.level:
+        unleveled = schedule
+        schedule, unresolved = level_resources(plan_tasks, schedule)
+        delayed = sum(1 for uid, info in schedule.items()
+                      if not info["summary"]
+                      and info["early_start"] != unleveled[uid]["early_start"])
+    tasks = plan_tasks if args.keep_dates else apply_schedule(plan_tasks, schedule)
+
+    out.parent.mkdir(parents=True, exist_ok=True)
+    if "xml" in args.formats:
+        if changed is None:
+            layout = write_project(out, tasks, resources, pretty=pretty)
+            verb = "generated"
+        else:
+            rewrite = changed if args.keep_dates else changed | moved
+            layout = patch_project(out, cache["xml"], tasks, rewrite, pretty=pretty)
+            verb = f"patched ({len(rewrite)} tasks rewritten)"
+        if args.level:
+            # Leveled dates are not a function of the inputs alone
+            plan_cache_path(out).unlink(missing_ok=True)
+        else:
+            save_plan_cache(out, plan_tasks, resources, schedule, layout, pretty,
+                            args.keep_dates)
+        print(f"  [OK] Project Plan XML {verb}: {out}")
+        print(f"  Size: {out.stat().st_size / 1024:.1f} KB")
+    for fmt in args.formats:
+        if fmt in EXPORTERS:
+            path = export_path(out, fmt)
+            EXPORTERS[fmt](path, tasks, schedule, resources)
+            print(f"  [OK] {fmt.upper()} export: {path} ({path.stat().st_size / 1024:.1f} KB)")
+
+    summaries = summary_uids(plan_tasks)
+    work_tasks = [t for t in plan_tasks if t["uid"] not in summaries]
     complete = [t for t in work_tasks if t["pct"] == 100]
 
-    print(f"  [OK] Project Plan XML generated: {OUT}")
-    print(f"  Size: {size_kb:.1f} KB")
-    print(f"  Phases: {len(summary_tasks)}")
+    print(f"  Phases: {len(summaries)}")
     print(f"  Tasks: {len(work_tasks)}")
     print(f"  Complete: {len(complete)} / {len(work_tasks)}")
-    print(f"  Resources: {len(RESOURCES)}")
+    print(f"  Resources: {len(resources)}")
+    print_schedule(plan_tasks, schedule)
+
+    loading = loading_report(
+        resources, resource_spans(plan_tasks, None if args.keep_dates else schedule))
+    if unresolved is not None:
+        print(f"  Leveling: {delayed} tasks delayed within float, "
+              f"{len(unresolved)} could not be fitted")
+    print_loading(loading)
+    if args.loading:
+        args.loading.parent.mkdir(parents=True, exist_ok=True)
+        args.loading.write_text(json.dumps(loading, indent=2), encoding="utf-8")
+        print(f"  Loading: {args.loading}")
     print()
     print("  Open in Microsoft Project, Project Online, or import")
     print("  into Azure DevOps / Jira / Smartsheet.")
     print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
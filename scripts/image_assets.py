@@ -0,0 +1,195 @@
+"""
+Downscaled, content-addressed copies of the images the generators embed.
+
+placed_image(path, width=...) returns a path to the image resized to the
+pixel size its placed width (or height) needs at IMAGE_DPI, rounded up to
+a power of two, recompressed, and kept in an on-disk cache keyed by the
+source bytes and that size. Placements of one image at nearby sizes thus
+share one copy, and which copy a placement gets depends only on the
+placement, never on what earlier builds left in the cache. Cached copies keep the source's file name, which becomes the picture's
+name in the document. Later builds reuse them without decoding the source
+again; the cache is trimmed back under its size budget, least recently
+used first.
+
+Without Pillow, or for images already at or below the target size, the
+source path is returned unchanged.
+
+Settings (environment):
+  ASPR_IMAGE_DPI       target resolution, 0 to embed originals (default 220)
+  ASPR_IMAGE_CACHE     cache directory (default .cache/images)
+  ASPR_IMAGE_CACHE_MB  cache size budget in MB (default 256)
+"""
+
+import hashlib
+import math
+import os
+import warnings
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:     # embed originals
+    Image = None
+
+ROOT = Path(__file__).resolve().parent.parent
+
+IMAGE_DPI = int(os.environ.get("ASPR_IMAGE_DPI", 220))
+IMAGE_CACHE = Path(os.environ.get("ASPR_IMAGE_CACHE", ROOT / ".cache" / "images"))
+IMAGE_CACHE_BUDGET = int(os.environ.get("ASPR_IMAGE_CACHE_MB", 256)) * 1024 * 1024
+JPEG_QUALITY = 85
+# Long side, in pixels, of the reduced copy sizes are resampled from; well
+# above a full-page placement (6.5in is 1430 px at 220 dpi)
+WORKING_SIZE = 4096
+EMU_PER_INCH = 914400
+
+
+def settings_key():
+    """Everything besides the source bytes that changes placed_image output."""
+    return f"dpi={IMAGE_DPI} jpeg={JPEG_QUALITY} pil={Image is not None}"
+
+
+def _target_pixels(length):
+    """Pixels for length (EMU) at IMAGE_DPI, rounded up to a power of two."""
+    pixels = math.ceil(length / EMU_PER_INCH * IMAGE_DPI)
+    return 1 << max(0, pixels - 1).bit_length()
+
+
+@lru_cache(maxsize=None)
+def _digest(path, mtime_ns, size):
+    """SHA-256 of a source file, once per process per (path, mtime, size)."""
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def _touch(path):
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+
+
+def _evict(cache_dir, budget, keep):
+    """Delete least recently used cached copies, other than keep, until the
+    cache fits budget."""
+    entries = []
+    for path in cache_dir.glob("*/*"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        if path.is_file() and not path.name.startswith(".") and path != keep:
+            entries.append((stat.st_mtime, stat.st_size, path))
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= budget:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        total -= size
+        try:
+            path.parent.rmdir()
+        except OSError:
+            pass    # not empty, e.g. another process is writing into it
+
+
+def _cache_path(source, digest, box):
+    """Where the copy of source sized for box=(width px, height px), one of
+    them None, is cached; named after the source, as a PNG unless JPEG."""
+    jpeg = Path(source).suffix.lower() in (".jpg", ".jpeg")
+    name = Path(source).name if jpeg else Path(source).with_suffix(".png").name
+    axis = f"w{box[0]}" if box[0] is not None else f"h{box[1]}"
+    return IMAGE_CACHE / f"{digest[:32]}-{axis}-{IMAGE_DPI}" / name
+
+
+@lru_cache(maxsize=2)
+def _working_copy(source, digest):
+    """source decoded once per process and box-reduced to WORKING_SIZE.
+
+    Returns (image, original size); every placed size of the source is
+    resized from this copy rather than from a fresh full-resolution decode.
+    """
+    with warnings.catch_warnings():
+        # Trusted local artwork; the print-resolution logos are large
+        warnings.simplefilter("ignore", Image.DecompressionBombWarning)
+        with Image.open(source) as im:
+            original = im.size
+            scale = WORKING_SIZE / max(original)
+            if im.format == "JPEG" and scale < 1:
+                # Decode at a reduced scale no smaller than the working copy
+                im.draft(im.mode, (math.ceil(original[0] * scale),
+                                   math.ceil(original[1] * scale)))
+            if im.mode not in ("RGB", "RGBA", "L"):
+                # Palette and CMYK images would resize with nearest-neighbour
+                alpha = im.mode in ("P", "LA", "PA") or "transparency" in im.info
+                im = im.convert("RGBA" if alpha else "RGB")
+            else:
+                im.load()
+            factor = max(im.size) // WORKING_SIZE
+            if factor > 1:
+                im = im.reduce(factor)
+            return im, original
+
+
+def _render(source, digest, box):
+    """Write source downscaled to box=(width px, height px), one of them
+    None, into the cache and return its path, or None if the source is
+    small enough."""
+    im, (width, height) = _working_copy(source, digest)
+    if box[0] is not None:
+        size = (box[0], max(1, round(height * box[0] / width)))
+    else:
+        size = (max(1, round(width * box[1] / height)), box[1])
+    if size[0] >= width:
+        return None
+    im = im.resize(size, Image.LANCZOS, reducing_gap=3.0)
+
+    target = _cache_path(source, digest, box)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    if target.suffix.lower() in (".jpg", ".jpeg"):
+        im.convert("RGB").save(tmp, "JPEG", quality=JPEG_QUALITY,
+                               optimize=True, dpi=(IMAGE_DPI, IMAGE_DPI))
+    else:
+        im.save(tmp, "PNG", optimize=True, dpi=(IMAGE_DPI, IMAGE_DPI))
+    os.replace(tmp, target)
+    return target
+
+
+def placed_image(path, width=None, height=None):
+    """Path of path's image sized for placement at width or height (EMU)."""
+    path = Path(path)
+    if Image is None or IMAGE_DPI <= 0 or (width is None and height is None):
+        return str(path)
+    stat = path.stat()
+    digest = _digest(str(path), stat.st_mtime_ns, stat.st_size)
+    box = ((_target_pixels(width), None) if width is not None
+           else (None, _target_pixels(height)))
+    placed = _placed(str(path), digest, box)
+    if not os.path.exists(placed):
+        # Evicted since this process first placed it
+        _placed.cache_clear()
+        placed = _placed(str(path), digest, box)
+    return placed
+
+
+@lru_cache(maxsize=None)
+def _placed(source, digest, box):
+    cached = _cache_path(source, digest, box)
+    if cached.is_file():
+        _touch(cached)
+        return str(cached)
+
+    try:
+        target = _render(source, digest, box)
+    except (OSError, ValueError, Image.DecompressionBombError):
+        return source
+    if target is None:
+        return source
+    _evict(IMAGE_CACHE, IMAGE_CACHE_BUDGET, keep=target)
+    return str(target)
@@ -0,0 +1,98 @@
+"""
+Package writer for the python-docx and python-pptx generators.
+
+save_package(document, target) writes a Document or Presentation the way
+doc.save() does, but with a per-part compression policy: XML parts are
+deflated at ZIP_LEVEL, and other parts only when a trial deflate shows it
+pays, so already-compressed media (PNG, JPEG, ...) is stored as is.
+target may be a path or any binary stream, seekable or not;
+package_bytes(document) returns the package in memory.
+
+Settings (environment):
+  ASPR_ZIP_LEVEL   deflate level for XML and other parts, 0-9 (default 6)
+"""
+
+import os
+import zipfile
+import zlib
+from io import BytesIO
+from pathlib import Path
+
+ZIP_LEVEL = int(os.environ.get("ASPR_ZIP_LEVEL", 6))
+
+# Non-XML parts are deflated only if deflating their first TRIAL_BYTES
+# saves at least MIN_SAVING; a sample keeps large photos from being
+# compressed twice just to find out
+DEFLATED_SUFFIXES = (".xml", ".rels")
+TRIAL_BYTES = 64 * 1024
+MIN_SAVING = 0.02
+
+CONTENT_TYPES = "[Content_Types].xml"
+CT_RELATIONSHIPS = "application/vnd.openxmlformats-package.relationships+xml"
+
+
+def settings_key():
+    """Everything besides the document that changes save_package output."""
+    return f"zip={ZIP_LEVEL}"
+
+
+def _package(document):
+    """(package relationships, parts) of a python-docx or python-pptx document."""
+    package = document.part.package
+    parts = list(package.iter_parts())
+    for part in parts:
+        # python-docx parts finalise their XML here; python-pptx has no hook
+        before_marshal = getattr(part, "before_marshal", None)
+        if before_marshal is not None:
+            before_marshal()
+    rels = package.rels if hasattr(package, "rels") else package._rels
+    return rels, parts
+
+
+def content_types_xml(parts):
+    """[Content_Types].xml with an Override for every part."""
+    overrides = "".join(
+        f'<Override PartName="{part.partname}" ContentType="{part.content_type}"/>'
+        for part in sorted(parts, key=lambda p: p.partname))
+    return ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            f'<Default Extension="rels" ContentType="{CT_RELATIONSHIPS}"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            f'{overrides}</Types>').encode("utf-8")
+
+
+def compression_for(membername, blob, level=ZIP_LEVEL):
+    """ZIP compression type for a package member."""
+    if membername.lower().endswith(DEFLATED_SUFFIXES) or not blob:
+        return zipfile.ZIP_DEFLATED
+    sample = blob[:TRIAL_BYTES]
+    if len(zlib.compress(sample, level)) <= len(sample) * (1 - MIN_SAVING):
+        return zipfile.ZIP_DEFLATED
+    return zipfile.ZIP_STORED
+
+
+def save_package(document, target, level=None):
+    """Write document's package to target, a path or a binary stream."""
+    level = ZIP_LEVEL if level is None else level
+    rels, parts = _package(document)
+    if isinstance(target, Path):
+        target = str(target)
+    with zipfile.ZipFile(target, "w", strict_timestamps=False) as zf:
+        def write(membername, blob):
+            compression = compression_for(membername, blob, level)
+            zf.writestr(membername, blob, compress_type=compression,
+                        compresslevel=level if compression == zipfile.ZIP_DEFLATED else None)
+
+        write(CONTENT_TYPES, content_types_xml(parts))
+        write("_rels/.rels", rels.xml)
+        for part in parts:
+            write(part.partname.membername, part.blob)
+            if len(part.rels):
+                write(part.partname.rels_uri.membername, part.rels.xml)
+
+
+def package_bytes(document, level=None):
+    """document's package as bytes, for handing on without touching disk."""
+    buf = BytesIO()
+    save_package(document, buf, level)
+    return buf.getvalue()
@@ -0,0 +1,37 @@
+"""Deck specs rendered by the executive summary generator."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import generate_exec_summary_pptx as deck  # noqa: E402
+
+
+def _table_deck(rows, **fields):
+    return {"slides": [dict({"type": "table", "title": "Ragged rows",
+                             "headers": ["Layer", "Component", "Purpose"],
+                             "rows": rows}, **fields)]}
+
+
+def _cell_texts(table):
+    return [[cell.text for cell in row.cells] for row in table.rows]
+
+
+def test_short_and_empty_rows_render():
+    rows = [["Application", "Web Framework", "SSR"], ["Security"], []]
+    prs = deck.render_deck(_table_deck(rows))
+    [slide] = prs.slides
+    [table] = [shape.table for shape in slide.shapes if shape.has_table]
+    assert _cell_texts(table)[1:] == [["Application", "Web Framework", "SSR"],
+                                      ["Security", "", ""],
+                                      ["", "", ""]]
+    heights = [row.height for row in table.rows]
+    assert heights[2] == heights[3] > 0
+
+
+def test_empty_row_heights_without_autofit():
+    rows = [[], ["Security"]]
+    prs = deck.render_deck(_table_deck(rows, autofit=False))
+    [table] = [shape.table for shape in prs.slides[0].shapes if shape.has_table]
+    assert len(table.rows) == 3
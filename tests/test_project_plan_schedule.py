@@ -0,0 +1,70 @@
+"""Summary-task spans in the project plan scheduler."""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+import generate_project_plan_xml as plan  # noqa: E402
+
+
+def _children(tasks):
+    children = {}
+    for uid, parent in plan.task_parents(tasks).items():
+        if parent is not None:
+            children.setdefault(parent, []).append(uid)
+    return children
+
+
+def assert_summaries_span_children(tasks, schedule):
+    for summary, kids in _children(tasks).items():
+        info = schedule[summary]
+        assert info["start"] == min(schedule[k]["start"] for k in kids)
+        assert info["finish"] == max(schedule[k]["finish"] for k in kids)
+        assert info["float"] == min(schedule[k]["float"] for k in kids)
+        assert info["critical"] == any(schedule[k]["critical"] for k in kids)
+
+
+def test_default_plan_summaries_span_children():
+    assert_summaries_span_children(plan.TASKS, plan.schedule_tasks(plan.TASKS))
+
+
+def test_lone_anchored_child():
+    tasks = [
+        {"uid": 1, "name": "Phase", "level": 1, "start": "2026-01-05", "dur": 22},
+        {"uid": 2, "name": "Anchored", "level": 2, "start": "2026-02-02", "dur": 2},
+        {"uid": 3, "name": "Long", "level": 1, "start": "2026-01-05", "dur": 30},
+    ]
+    schedule = plan.schedule_tasks(tasks)
+    assert schedule[1]["start"] == date(2026, 2, 2)
+    assert schedule[1]["finish"] == date(2026, 2, 3)
+    assert schedule[1]["dur"] == 2
+    assert schedule[1]["float"] == schedule[2]["float"] == 8
+
+
+def test_nested_summaries_and_reschedule():
+    tasks = [
+        {"uid": 1, "name": "Phase", "level": 1, "start": "2026-01-05", "dur": 0},
+        {"uid": 2, "name": "Stage", "level": 2, "start": "2026-01-05", "dur": 0},
+        {"uid": 3, "name": "A", "level": 3, "start": "2026-01-12", "dur": 3},
+        {"uid": 4, "name": "B", "level": 3, "start": "2026-01-05", "dur": 2, "preds": [3]},
+        {"uid": 5, "name": "C", "level": 2, "start": "2026-01-19", "dur": 4},
+        {"uid": 6, "name": "D", "level": 1, "start": "2026-01-05", "dur": 1, "preds": [1]},
+    ]
+    schedule = plan.schedule_tasks(tasks)
+    assert_summaries_span_children(tasks, schedule)
+
+    tasks[3] = dict(tasks[3], dur=9)
+    updated, _ = plan.reschedule(tasks, schedule, {4})
+    assert_summaries_span_children(tasks, updated)
+    full = plan.schedule_tasks(tasks)
+    assert {uid: info["float"] for uid, info in updated.items()} == \
+        {uid: info["float"] for uid, info in full.items()}
+    assert {uid: (info["start"], info["finish"]) for uid, info in updated.items()} == \
+        {uid: (info["start"], info["finish"]) for uid, info in full.items()}
+
+
+def test_leveled_summaries_span_children():
+    schedule, _ = plan.level_resources(plan.TASKS, plan.schedule_tasks(plan.TASKS))
+    assert_summaries_span_children(plan.TASKS, schedule)